@@ -7,128 +7,323 @@ from various sources for gap trading analysis.
 """
 
 import yfinance as yf
+import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
-import json
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+from zoneinfo import ZoneInfo
+import hashlib
 import os
+import time
+
+import orjson
+
+from exploration_utils import get_or_fetch_api_data
+from tradescout.config import local_config
+from tradescout.config.local_config import get_http_session
+
+ET_TZ = ZoneInfo('America/New_York')
+MARKET_OPEN = datetime.min.time().replace(hour=9, minute=30)
+MARKET_CLOSE = datetime.min.time().replace(hour=16, minute=0)
+AFTER_HOURS_END = datetime.min.time().replace(hour=20, minute=0)
+
+# Common large-cap S&P 500 symbols for testing
+_SP500_SYMBOLS = (
+    'AAPL', 'MSFT', 'GOOGL', 'AMZN', 'TSLA', 'META', 'NVDA', 'BRK-B',
+    'UNH', 'JNJ', 'V', 'WMT', 'JPM', 'PG', 'MA', 'HD', 'CVX', 'ABBV',
+    'PFE', 'KO', 'PEP', 'AVGO', 'TMO', 'COST', 'MRK', 'DHR', 'VZ',
+    'ABT', 'ACN', 'NFLX', 'ADBE', 'CRM', 'AMD', 'NKE', 'T', 'LIN',
+    'TXN', 'RTX', 'QCOM', 'LOW', 'UPS', 'ORCL', 'PM', 'HON', 'IBM',
+    'SBUX', 'CAT', 'INTU', 'AXP'
+)
 
 def get_sp500_symbols(limit=50):
-    """Get a sample of S&P 500 symbols for testing"""
-    # Common large-cap symbols for testing
-    symbols = [
-        'AAPL', 'MSFT', 'GOOGL', 'AMZN', 'TSLA', 'META', 'NVDA', 'BRK-B',
-        'UNH', 'JNJ', 'V', 'WMT', 'JPM', 'PG', 'MA', 'HD', 'CVX', 'ABBV',
-        'PFE', 'KO', 'PEP', 'AVGO', 'TMO', 'COST', 'MRK', 'DHR', 'VZ',
-        'ABT', 'ACN', 'NFLX', 'ADBE', 'CRM', 'AMD', 'NKE', 'T', 'LIN',
-        'TXN', 'RTX', 'QCOM', 'LOW', 'UPS', 'ORCL', 'PM', 'HON', 'IBM',
-        'SBUX', 'CAT', 'INTU', 'AXP'
-    ]
-    return symbols[:limit]
-
-def get_after_hours_activity(symbol):
-    """Get after-hours activity for a symbol"""
-    try:
-        ticker = yf.Ticker(symbol)
-        
-        # Get pre/post market data for today
-        hist = ticker.history(period="1d", interval="1m", prepost=True)
-        
-        if hist.empty:
-            return None
-            
-        # Get regular market hours (9:30 AM - 4:00 PM ET)
-        # Make datetime objects timezone-aware to match yfinance data
-        import pytz
-        et_tz = pytz.timezone('America/New_York')
-        
-        today = datetime.now(et_tz).date()
-        market_open = et_tz.localize(datetime.combine(today, datetime.min.time().replace(hour=9, minute=30)))
-        market_close = et_tz.localize(datetime.combine(today, datetime.min.time().replace(hour=16, minute=0)))
+    """Get a sample of S&P 500 symbols for testing (immutable tuple)"""
+    return _SP500_SYMBOLS[:limit]
+
+# Yahoo accepts roughly 20 symbols per batched chart request
+DOWNLOAD_CHUNK_SIZE = 20
+DOWNLOAD_INTERVAL = "1m"
+DOWNLOAD_WORKERS = 4  # Stay under Yahoo's soft concurrency limit
+
+# Larger scans stream all_activity to NDJSON instead of one big JSON array
+NDJSON_THRESHOLD = 500
+ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY
+
+ACTIVITY_COLUMNS = [
+    'symbol', 'has_activity', 'regular_close',
+    'after_hours_open', 'after_hours_close', 'after_hours_high', 'after_hours_low',
+    'after_hours_volume', 'change_amount', 'change_percent', 'is_significant',
+]
+
+def normalize_symbols(symbols):
+    """Uppercase symbols and drop ill-formed tickers once, before any network calls"""
+    if len(symbols) == 0:
+        return []
+    symbols_arr = np.char.upper(np.char.strip(np.asarray(symbols, dtype=str)))
+    valid = np.char.isalnum(np.char.replace(symbols_arr, '-', ''))
+    return symbols_arr[valid].tolist()
+
+def chunk_symbols(symbols, chunk_size=DOWNLOAD_CHUNK_SIZE):
+    """Split symbols into lists small enough for one batched Yahoo request"""
+    return [symbols[i:i + chunk_size] for i in range(0, len(symbols), chunk_size)]
+
+def download_chunk(chunk):
+    """Download today's 1m bars (with pre/post market) for one batch of symbols"""
+    return yf.download(
+        chunk,
+        period="1d",
+        interval=DOWNLOAD_INTERVAL,
+        prepost=True,
+        group_by='ticker',
+        threads=False,  # Concurrency is handled by download_intraday
+        progress=False,
+        session=get_http_session(),
+    )
+
+def download_intraday(symbols):
+    """Download today's 1m bars for many symbols, running batches concurrently"""
+    chunks = chunk_symbols(symbols)
+    print(f"Downloading {len(symbols)} symbols in {len(chunks)} batch(es)...")
+    
+    delay_seconds = local_config.get('api_rate_limits')['yfinance_delay_seconds']
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+        futures = []
+        for chunk in chunks:
+            futures.append(executor.submit(download_chunk, chunk))
+            time.sleep(delay_seconds)  # Be nice to Yahoo
+        frames = [future.result() for future in futures]
+    
+    frames = [frame for frame in frames if frame is not None and not frame.empty]
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, axis=1)
+
+def get_cached_intraday(symbols, force_refresh=False):
+    """Load today's batched download from data/examples/scans/, fetching on first use"""
+    now = datetime.now(ET_TZ)
+    if now < get_session_bounds()[2]:
+        # Today's after-hours bars are still arriving; a saved copy would be partial
+        return download_intraday(symbols)
+    et_date = now.date().isoformat()
+    symbols_key = hashlib.blake2b(','.join(sorted(symbols)).encode()).hexdigest()[:12]
+    return get_or_fetch_api_data(
+        f"scans/{et_date}_{DOWNLOAD_INTERVAL}_{symbols_key}",
+        lambda: download_intraday(symbols),
+        f"{DOWNLOAD_INTERVAL} bars for {len(symbols)} symbols on {et_date}",
+        force_refresh=force_refresh,
+    )
+
+@lru_cache(maxsize=1)
+def _compute_session_bounds(et_date):
+    """Build timezone-aware session bounds for one ET trading date"""
+    market_open = datetime.combine(et_date, MARKET_OPEN, tzinfo=ET_TZ)
+    market_close = datetime.combine(et_date, MARKET_CLOSE, tzinfo=ET_TZ)
+    after_hours_end = datetime.combine(et_date, AFTER_HOURS_END, tzinfo=ET_TZ)
+    return market_open, market_close, after_hours_end
+
+def get_session_bounds():
+    """Get today's (market_open, market_close, after_hours_end) in ET"""
+    return _compute_session_bounds(datetime.now(ET_TZ).date())
+
+def _session_row_ranges(timestamps, session_bounds):
+    """
+    Locate regular [open, close] and after-hours (close, end] rows in a sorted index
+    
+    Binary search on the raw int64 timestamps gives contiguous slices
+    without allocating full-length boolean masks.
+    """
+    bounds = pd.DatetimeIndex(session_bounds).tz_convert(timestamps.tz).as_unit(timestamps.unit).asi8
+    idx = timestamps.asi8
+    open_lo = np.searchsorted(idx, bounds[0], side='left')
+    close_hi = np.searchsorted(idx, bounds[1], side='right')
+    end_hi = np.searchsorted(idx, bounds[2], side='right')
+    return slice(open_lo, close_hi), slice(close_hi, end_hi)
+
+def summarize_after_hours(data, session_bounds=None):
+    """
+    Compute after-hours metrics for every symbol in one vectorized pass
+    
+    Args:
+        data: Multi-index (ticker, field) frame from download_intraday
+        session_bounds: Optional (market_open, market_close, after_hours_end)
         
-        # Filter for after-hours (4:00 PM - 8:00 PM ET)
-        after_hours_start = market_close
-        after_hours_end = market_close + timedelta(hours=4)
+    Returns:
+        DataFrame with one row per symbol that traded after hours
+    """
+    if data.empty:
+        return pd.DataFrame(columns=ACTIVITY_COLUMNS)
+    
+    # Sorted by timestamp, so each session is one contiguous row range
+    bars = (
+        data.sort_index()
+        .stack(level=0, future_stack=True)
+        .rename_axis(['timestamp', 'symbol'])
+        .reset_index(level='symbol')
+        .dropna(subset=['Close'])
+    )
+    
+    regular_rows, after_hours_rows = _session_row_ranges(bars.index, session_bounds or get_session_bounds())
+    
+    regular_close = bars.iloc[regular_rows].groupby('symbol')['Close'].last().rename('regular_close')
+    after_hours = bars.iloc[after_hours_rows].groupby('symbol').agg(
+        after_hours_open=('Open', 'first'),
+        after_hours_close=('Close', 'last'),
+        after_hours_high=('High', 'max'),
+        after_hours_low=('Low', 'min'),
+        after_hours_volume=('Volume', 'sum'),
+    )
+    
+    summary = after_hours.join(regular_close, how='inner').reset_index()
+    summary['has_activity'] = True
+    summary['after_hours_volume'] = summary['after_hours_volume'].astype('int64')
+    summary['change_amount'] = summary['after_hours_close'] - summary['regular_close']
+    summary['change_percent'] = (
+        summary['change_amount'] / summary['regular_close'] * 100
+    ).where(summary['regular_close'] > 0, 0.0)
+    summary['is_significant'] = summary['change_percent'].abs() >= 1.0  # 1%+ move
+    
+    return summary[ACTIVITY_COLUMNS]
+
+@dataclass
+class IncrementalGapState:
+    """
+    Running after-hours state for one symbol, updated in O(1) per new minute bar
+    
+    Lets a live polling loop (e.g. every minute after 4 PM ET) fold in only the
+    newest bars instead of re-aggregating the whole session on every poll.
+    """
+    symbol: str
+    prev_regular_close: Optional[float] = None
+    after_hours_open: Optional[float] = None
+    last_close: Optional[float] = None
+    high: float = float('-inf')
+    low: float = float('inf')
+    total_volume: int = 0
+    last_timestamp: Optional[pd.Timestamp] = None
+    
+    def update(self, timestamp, open_price, high, low, close, volume, session_bounds):
+        """Fold one minute bar into the running state (bars already seen are skipped)"""
+        if self.last_timestamp is not None and timestamp <= self.last_timestamp:
+            return
+        self.last_timestamp = timestamp
         
-        # Get the last regular session close
-        regular_hours = hist[(hist.index >= market_open) & (hist.index <= market_close)]
-        if regular_hours.empty:
+        market_open, market_close, after_hours_end = session_bounds
+        if market_open <= timestamp <= market_close:
+            self.prev_regular_close = close
+        elif market_close < timestamp <= after_hours_end:
+            if self.after_hours_open is None:
+                self.after_hours_open = open_price
+            self.last_close = close
+            self.high = max(self.high, high)
+            self.low = min(self.low, low)
+            self.total_volume += int(volume)
+    
+    def snapshot(self):
+        """Current metrics as a dict keyed like ACTIVITY_COLUMNS"""
+        if self.prev_regular_close is None:
             return None
-            
-        regular_close = float(regular_hours['Close'].iloc[-1])
         
-        # Get after-hours data
-        after_hours = hist[(hist.index > after_hours_start) & (hist.index <= after_hours_end)]
-        
-        if after_hours.empty:
+        regular_close = self.prev_regular_close
+        if self.after_hours_open is None:
             return {
-                'symbol': symbol,
+                'symbol': self.symbol,
                 'has_activity': False,
                 'regular_close': regular_close
             }
-            
-        # Calculate after-hours metrics
-        ah_open = float(after_hours['Open'].iloc[0])
-        ah_close = float(after_hours['Close'].iloc[-1])
-        ah_high = float(after_hours['High'].max())
-        ah_low = float(after_hours['Low'].min())
-        ah_volume = int(after_hours['Volume'].sum())
         
-        # Calculate changes from regular session close
-        change_amount = ah_close - regular_close
+        change_amount = self.last_close - regular_close
         change_percent = (change_amount / regular_close) * 100 if regular_close > 0 else 0
         
         return {
-            'symbol': symbol,
+            'symbol': self.symbol,
             'has_activity': True,
             'regular_close': regular_close,
-            'after_hours_open': ah_open,
-            'after_hours_close': ah_close,
-            'after_hours_high': ah_high,
-            'after_hours_low': ah_low,
-            'after_hours_volume': ah_volume,
+            'after_hours_open': self.after_hours_open,
+            'after_hours_close': self.last_close,
+            'after_hours_high': self.high,
+            'after_hours_low': self.low,
+            'after_hours_volume': self.total_volume,
             'change_amount': change_amount,
             'change_percent': change_percent,
             'is_significant': abs(change_percent) >= 1.0  # 1%+ move
         }
+
+def update_gap_states(states, data, session_bounds=None):
+    """
+    Feed newly downloaded bars into per-symbol incremental state
+    
+    Args:
+        states: Dict of symbol -> IncrementalGapState (updated in place)
+        data: Multi-index (ticker, field) frame, e.g. the latest poll or the
+            parquet cache from get_cached_intraday when rehydrating after a restart
+        session_bounds: Optional (market_open, market_close, after_hours_end)
+        
+    Returns:
+        The same states dict
+    """
+    if data.empty:
+        return states
+    
+    session_bounds = session_bounds or get_session_bounds()
+    for symbol in data.columns.get_level_values(0).unique():
+        state = states.setdefault(symbol, IncrementalGapState(symbol))
+        bars = data[symbol].dropna(subset=['Close'])
+        if state.last_timestamp is not None:
+            bars = bars[bars.index > state.last_timestamp]
         
-    except Exception as e:
-        print(f"Error processing {symbol}: {e}")
-        return None
+        for timestamp, open_price, high, low, close, volume in bars[
+            ['Open', 'High', 'Low', 'Close', 'Volume']
+        ].itertuples():
+            state.update(timestamp, open_price, high, low, close, volume, session_bounds)
+    
+    return states
 
-def scan_after_hours_movers(symbols, min_change_percent=1.0):
+def scan_after_hours_movers(symbols, min_change_percent=1.0, force_refresh=False):
     """Scan for after-hours movers"""
+    symbols = normalize_symbols(symbols)
     print(f"Scanning {len(symbols)} symbols for after-hours activity...")
     
-    gainers = []
-    losers = []
-    all_activity = []
+    data = get_cached_intraday(symbols, force_refresh=force_refresh)
+    activity = summarize_after_hours(data, get_session_bounds())
     
-    for i, symbol in enumerate(symbols):
-        print(f"Processing {symbol} ({i+1}/{len(symbols)})...")
-        
-        activity = get_after_hours_activity(symbol)
-        if activity and activity['has_activity']:
-            all_activity.append(activity)
-            
-            change_pct = activity['change_percent']
-            if change_pct >= min_change_percent:
-                gainers.append(activity)
-            elif change_pct <= -min_change_percent:
-                losers.append(activity)
-    
-    # Sort by change percentage
-    gainers.sort(key=lambda x: x['change_percent'], reverse=True)
-    losers.sort(key=lambda x: x['change_percent'])
+    # Top 10 by change percentage
+    change_percent = activity['change_percent']
+    gainers = activity[change_percent >= min_change_percent].nlargest(10, 'change_percent')
+    losers = activity[change_percent <= -min_change_percent].nsmallest(10, 'change_percent')
     
     return {
         'scan_time': datetime.now().isoformat(),
         'symbols_scanned': len(symbols),
-        'active_symbols': len(all_activity),
-        'gainers': gainers[:10],  # Top 10
-        'losers': losers[:10],   # Top 10
-        'all_activity': all_activity
+        'active_symbols': len(activity),
+        'gainers': gainers.to_dict('records'),
+        'losers': losers.to_dict('records'),
+        'all_activity': activity.to_dict('records')
     }
 
+def save_scan_results(results, base_path):
+    """
+    Write scan results as JSON, streaming large activity lists to NDJSON
+    
+    When all_activity exceeds NDJSON_THRESHOLD records it is written one
+    record per line to <base_path>_activity.ndjson and the JSON file refers
+    to that file instead of embedding the list.
+    """
+    all_activity = results['all_activity']
+    if len(all_activity) > NDJSON_THRESHOLD:
+        activity_path = f"{base_path}_activity.ndjson"
+        with open(activity_path, 'wb') as f:
+            for record in all_activity:
+                f.write(orjson.dumps(record, default=str, option=ORJSON_OPTIONS))
+                f.write(b"\n")
+        results = {**results, 'all_activity': os.path.basename(activity_path)}
+    
+    with open(f"{base_path}.json", 'wb') as f:
+        f.write(orjson.dumps(results, default=str, option=ORJSON_OPTIONS | orjson.OPT_INDENT_2))
+
 if __name__ == "__main__":
     # Test the after-hours scanning
     symbols = get_sp500_symbols(30)  # Test with 30 symbols
@@ -146,8 +341,7 @@ if __name__ == "__main__":
     
     # Save results
     os.makedirs('data/examples', exist_ok=True)
-    with open(f'data/examples/after_hours_scan_{datetime.now().strftime("%Y%m%d_%H%M")}.json', 'w') as f:
-        json.dump(results, f, indent=2, default=str)
+    save_scan_results(results, f'data/examples/after_hours_scan_{datetime.now().strftime("%Y%m%d_%H%M")}')
     
     # Display top movers
     if results['gainers']:
@@ -5,8 +5,10 @@ Demo: NVIDIA Asset Representation using TradeScout Domain Models
 Shows how real-world market data maps to our clean domain model architecture.
 """
 
+import sys
 from datetime import datetime, time
 from decimal import Decimal
+from typing import List
 
 # Import our domain models
 from tradescout.data_models.domain_models_core import (
@@ -17,250 +19,262 @@ from tradescout.data_models.factories import MarketFactory, MarketSegmentFactory
 from tradescout.data_models.domain_models_analysis import TechnicalIndicators
 
 
+# NVIDIA market data (July 18-20, 2025), built once at import: the values
+# are literal, so every call can share the same objects
+
+# 1. Create Market and Segments
+_NASDAQ = Market(
+    id="NASDAQ",
+    name="NASDAQ Stock Market",
+    market_type=MarketType.STOCK,
+    timezone="America/New_York",
+    currency="USD",
+    regular_open=time(9, 30),
+    regular_close=time(16, 0),
+    pre_market_start=time(4, 0),
+    after_hours_end=time(20, 0),
+    min_tick_size=Decimal('0.01'),
+    trading_days={0, 1, 2, 3, 4}
+)
+
+# Create market segments for NVIDIA
+_TECHNOLOGY = MarketSegment.get_or_create(
+    id="technology",
+    name="Technology",
+    description="Technology companies and software",
+    segment_type="sector"
+)
+
+_SEMICONDUCTORS = MarketSegment.get_or_create(
+    id="semiconductors", 
+    name="Semiconductors",
+    description="Semiconductor and chip manufacturers",
+    segment_type="industry",
+    parent_segment=_TECHNOLOGY
+)
+
+_AI_CHIPS = MarketSegment.get_or_create(
+    id="ai_chips",
+    name="AI/GPU Chips", 
+    description="Artificial Intelligence and Graphics Processing Units",
+    segment_type="sub_industry",
+    parent_segment=_SEMICONDUCTORS
+)
+
+_SP500 = MarketSegment.get_or_create(
+    id="sp500",
+    name="S&P 500",
+    description="S&P 500 Index Component", 
+    segment_type="index"
+)
+
+_NASDAQ100 = MarketSegment.get_or_create(
+    id="nasdaq100",
+    name="NASDAQ-100",
+    description="NASDAQ-100 Index Component",
+    segment_type="index"
+)
+
+_LARGE_CAP = MarketSegment.get_or_create(
+    id="large_cap",
+    name="Large Cap",
+    description="Large capitalization stocks (>$10B market cap)",
+    segment_type="size"
+)
+
+# 2. Create NVIDIA Asset with Real Data
+_NVDA_ASSET = Asset(
+    symbol="NVDA",
+    name="NVIDIA Corporation",
+    asset_type=AssetType.COMMON_STOCK,
+    market=_NASDAQ,
+    currency="USD",
+
+    # Market segments - NVIDIA belongs to multiple classifications
+    segments={
+        _TECHNOLOGY,      # Sector
+        _SEMICONDUCTORS,  # Industry  
+        _AI_CHIPS,        # Sub-industry
+        _SP500,           # Index membership
+        _NASDAQ100,       # Index membership
+        _LARGE_CAP        # Size classification
+    },
+
+    # Corporate data (estimated based on current market data)
+    shares_outstanding=2_440_000_000,  # ~2.44B shares
+    market_cap=Decimal("4210000000000"),  # $4.21 Trillion
+
+    # Trading characteristics
+    is_active=True,
+    min_order_size=Decimal('1'),
+    tick_size=Decimal('0.01'),
+
+    # Metadata
+    created_at=datetime.now(),
+    updated_at=datetime.now()
+)
+
+# 3. Create Current Price Data (July 18, 2025 close)
+_NVDA_PRICE_DATA = PriceData(
+    asset=_NVDA_ASSET,
+    timestamp=datetime(2025, 7, 18, 16, 0, 0),  # Market close
+    price=Decimal("172.41"),          # Close price
+    volume=146_456_416,               # Daily volume
+
+    # OHLC data for the day
+    open_price=Decimal("173.50"),     # Estimated open
+    high_price=Decimal("174.24"),     # Day high
+    low_price=Decimal("171.26"),      # Day low
+
+    # Market context
+    session_type=MarketStatus.OPEN,
+    data_source="live_market_data",
+    data_quality="good"
+)
+
+# 4. Create Market Quote with Analysis
+_NVDA_QUOTE = MarketQuote(
+    asset=_NVDA_ASSET,
+    price_data=_NVDA_PRICE_DATA,
+
+    # Reference data for calculations
+    previous_close=Decimal("173.00"),  # Previous close
+    average_volume=203_628_106,        # Average daily volume
+)
+
+# 5. Create Technical Indicators (sample data)
+_NVDA_TECH = TechnicalIndicators(
+    asset=_NVDA_ASSET,
+    timestamp=datetime(2025, 7, 18, 16, 0, 0),
+    timeframe="1d",
+
+    # Moving averages (estimated)
+    sma_20=Decimal("165.50"),
+    sma_50=Decimal("158.75"),
+    ema_12=Decimal("170.25"),
+    ema_26=Decimal("162.80"),
+
+    # Momentum indicators (estimated)
+    rsi=Decimal("72.5"),              # Slightly overbought
+    macd=Decimal("2.45"),
+    macd_signal=Decimal("1.85"),
+
+    # Volume indicators
+    volume_sma=Decimal("180000000"),  # 20-day volume average
+    volume_ratio=Decimal("0.72"),     # Below average volume
+
+    # Volatility (estimated)
+    atr=Decimal("8.50")               # Average True Range
+)
+
+
 def create_nvidia_with_current_data():
-    """Create NVIDIA asset with current market data (July 18-20, 2025)"""
-    
-    # 1. Create Market and Segments
-    nasdaq = Market(
-        id="NASDAQ",
-        name="NASDAQ Stock Market",
-        market_type=MarketType.STOCK,
-        timezone="America/New_York",
-        currency="USD",
-        regular_open=time(9, 30),
-        regular_close=time(16, 0),
-        pre_market_start=time(4, 0),
-        after_hours_end=time(20, 0),
-        min_tick_size=Decimal('0.01'),
-        trading_days={0, 1, 2, 3, 4}
-    )
-    
-    # Create market segments for NVIDIA
-    technology = MarketSegment(
-        id="technology",
-        name="Technology",
-        description="Technology companies and software",
-        segment_type="sector"
-    )
-    
-    semiconductors = MarketSegment(
-        id="semiconductors", 
-        name="Semiconductors",
-        description="Semiconductor and chip manufacturers",
-        segment_type="industry",
-        parent_segment=technology
-    )
-    
-    ai_chips = MarketSegment(
-        id="ai_chips",
-        name="AI/GPU Chips", 
-        description="Artificial Intelligence and Graphics Processing Units",
-        segment_type="sub_industry",
-        parent_segment=semiconductors
-    )
-    
-    sp500 = MarketSegment(
-        id="sp500",
-        name="S&P 500",
-        description="S&P 500 Index Component", 
-        segment_type="index"
-    )
-    
-    nasdaq100 = MarketSegment(
-        id="nasdaq100",
-        name="NASDAQ-100",
-        description="NASDAQ-100 Index Component",
-        segment_type="index"
-    )
-    
-    large_cap = MarketSegment(
-        id="large_cap",
-        name="Large Cap",
-        description="Large capitalization stocks (>$10B market cap)",
-        segment_type="size"
-    )
-    
-    # 2. Create NVIDIA Asset with Real Data
-    nvidia = Asset(
-        symbol="NVDA",
-        name="NVIDIA Corporation",
-        asset_type=AssetType.COMMON_STOCK,
-        market=nasdaq,
-        currency="USD",
-        
-        # Market segments - NVIDIA belongs to multiple classifications
-        segments={
-            technology,      # Sector
-            semiconductors,  # Industry  
-            ai_chips,       # Sub-industry
-            sp500,          # Index membership
-            nasdaq100,      # Index membership
-            large_cap       # Size classification
-        },
-        
-        # Corporate data (estimated based on current market data)
-        shares_outstanding=2_440_000_000,  # ~2.44B shares
-        market_cap=Decimal("4210000000000"),  # $4.21 Trillion
-        
-        # Trading characteristics
-        is_active=True,
-        min_order_size=Decimal('1'),
-        tick_size=Decimal('0.01'),
-        
-        # Metadata
-        created_at=datetime.now(),
-        updated_at=datetime.now()
-    )
-    
-    # 3. Create Current Price Data (July 18, 2025 close)
-    current_price_data = PriceData(
-        asset=nvidia,
-        timestamp=datetime(2025, 7, 18, 16, 0, 0),  # Market close
-        price=Decimal("172.41"),          # Close price
-        volume=146_456_416,               # Daily volume
-        
-        # OHLC data for the day
-        open_price=Decimal("173.50"),     # Estimated open
-        high_price=Decimal("174.24"),     # Day high
-        low_price=Decimal("171.26"),      # Day low
-        
-        # Market context
-        session_type=MarketStatus.OPEN,
-        data_source="live_market_data",
-        data_quality="good"
-    )
-    
-    # 4. Create Market Quote with Analysis
-    nvidia_quote = MarketQuote(
-        asset=nvidia,
-        price_data=current_price_data,
-        
-        # Reference data for calculations
-        previous_close=Decimal("173.00"),  # Previous close
-        average_volume=203_628_106,        # Average daily volume
-    )
-    
-    # 5. Create Technical Indicators (sample data)
-    nvidia_technicals = TechnicalIndicators(
-        asset=nvidia,
-        timestamp=datetime(2025, 7, 18, 16, 0, 0),
-        timeframe="1d",
-        
-        # Moving averages (estimated)
-        sma_20=Decimal("165.50"),
-        sma_50=Decimal("158.75"),
-        ema_12=Decimal("170.25"),
-        ema_26=Decimal("162.80"),
-        
-        # Momentum indicators (estimated)
-        rsi=Decimal("72.5"),              # Slightly overbought
-        macd=Decimal("2.45"),
-        macd_signal=Decimal("1.85"),
-        
-        # Volume indicators
-        volume_sma=Decimal("180000000"),  # 20-day volume average
-        volume_ratio=Decimal("0.72"),     # Below average volume
-        
-        # Volatility (estimated)
-        atr=Decimal("8.50")               # Average True Range
-    )
-    
-    return nvidia, nvidia_quote, nvidia_technicals
+    """Return the prebuilt NVIDIA asset, quote and technicals (July 18-20, 2025)
+
+    The objects are shared between calls; copy them before mutating.
+    """
+    return _NVDA_ASSET, _NVDA_QUOTE, _NVDA_TECH
 
 
 def print_nvidia_asset_visualization():
     """Create a visual representation of NVIDIA in our domain model"""
     
     nvidia, quote, technicals = create_nvidia_with_current_data()
+    now = datetime.now()
+    SEP = "-" * 30
+    lines: List[str] = []
     
-    print("🎯 TRADESCOUT ASSET MODEL DEMONSTRATION")
-    print("=" * 60)
-    print(f"📊 NVIDIA Corporation Analysis - {datetime.now().strftime('%Y-%m-%d %H:%M')}")
-    print()
+    lines.append("🎯 TRADESCOUT ASSET MODEL DEMONSTRATION")
+    lines.append("=" * 60)
+    lines.append(f"📊 NVIDIA Corporation Analysis - {now:%Y-%m-%d %H:%M}")
+    lines.append("")
     
     # Asset Core Information
-    print("🏢 CORE ASSET INFORMATION")
-    print("-" * 30)
-    print(f"Symbol: {nvidia.symbol}")
-    print(f"Name: {nvidia.name}")
-    print(f"Asset Type: {nvidia.asset_type.value}")
-    print(f"Market: {nvidia.market.name} ({nvidia.market.id})")
-    print(f"Currency: {nvidia.currency}")
-    print(f"ISIN: {nvidia.isin or 'N/A'}")
-    print()
+    lines.append("🏢 CORE ASSET INFORMATION")
+    lines.append(SEP)
+    lines.append(f"Symbol: {nvidia.symbol}")
+    lines.append(f"Name: {nvidia.name}")
+    lines.append(f"Asset Type: {nvidia.asset_type.value}")
+    lines.append(f"Market: {nvidia.market.name} ({nvidia.market.id})")
+    lines.append(f"Currency: {nvidia.currency}")
+    lines.append(f"ISIN: {nvidia.isin or 'N/A'}")
+    lines.append("")
     
     # Market Classification
-    print("📂 MARKET CLASSIFICATION")
-    print("-" * 30)
-    for segment in sorted(nvidia.segments, key=lambda s: s.segment_type):
-        hierarchy = " → ".join(segment.full_hierarchy) if hasattr(segment, 'full_hierarchy') else segment.name
-        print(f"{segment.segment_type.title()}: {hierarchy}")
-    print()
+    lines.append("📂 MARKET CLASSIFICATION")
+    lines.append(SEP)
+    lines.extend(
+        f"{segment.segment_type.title()}: {' → '.join(segment.full_hierarchy)}"
+        for segment in nvidia.segments_by_type
+    )
+    lines.append("")
     
     # Corporate Financials
-    print("💰 CORPORATE FINANCIALS")
-    print("-" * 30)
-    print(f"Shares Outstanding: {nvidia.shares_outstanding:,}")
-    print(f"Market Cap: ${nvidia.market_cap:,.0f}")
-    print(f"Market Cap (Trillions): ${float(nvidia.market_cap)/1_000_000_000_000:.2f}T")
-    print()
+    lines.append("💰 CORPORATE FINANCIALS")
+    lines.append(SEP)
+    lines.append(f"Shares Outstanding: {nvidia.shares_outstanding:,}")
+    lines.append(f"Market Cap: ${nvidia.market_cap:,.0f}")
+    lines.append(f"Market Cap (Trillions): ${float(nvidia.market_cap)/1_000_000_000_000:.2f}T")
+    lines.append("")
     
     # Current Market Data
-    print("📈 CURRENT MARKET DATA")
-    print("-" * 30)
-    print(f"Current Price: ${quote.price_data.price}")
-    print(f"Previous Close: ${quote.previous_close}")
-    print(f"Price Change: ${quote.price_change} ({quote.price_change_percent:+.2f}%)")
-    print(f"Day Range: ${quote.price_data.low_price} - ${quote.price_data.high_price}")
-    print(f"Volume: {quote.price_data.volume:,}")
-    print(f"Avg Volume: {quote.average_volume:,}")
-    print(f"Volume Ratio: {quote.volume_ratio:.2f}x")
-    print()
+    lines.append("📈 CURRENT MARKET DATA")
+    lines.append(SEP)
+    lines.append(f"Current Price: ${quote.price_data.price}")
+    lines.append(f"Previous Close: ${quote.previous_close}")
+    lines.append(f"Price Change: ${quote.price_change:.2f} ({quote.price_change_percent:+.2f}%)")
+    lines.append(f"Day Range: ${quote.price_data.low_price} - ${quote.price_data.high_price}")
+    lines.append(f"Volume: {quote.price_data.volume:,}")
+    lines.append(f"Avg Volume: {quote.average_volume:,}")
+    lines.append(f"Volume Ratio: {quote.volume_ratio:.2f}x")
+    lines.append("")
     
     # Market Status Analysis
-    print("🔍 MOMENTUM ANALYSIS")
-    print("-" * 30)
-    print(f"Gap Status: {'📈 Gap Up' if quote.is_gap_up else '📉 Gap Down' if quote.is_gap_down else '➡️ Normal'}")
-    print(f"Volume Surge: {'🔥 YES' if quote.has_volume_surge else '❌ No'}")
-    print(f"Session: {quote.price_data.session_type.value}")
-    print(f"Near ATH: {'✅ YES' if quote.price_data.price >= Decimal('174.00') else '❌ No'}")
-    print()
+    lines.append("🔍 MOMENTUM ANALYSIS")
+    lines.append(SEP)
+    lines.append(f"Gap Status: {'📈 Gap Up' if quote.is_gap_up else '📉 Gap Down' if quote.is_gap_down else '➡️ Normal'}")
+    lines.append(f"Volume Surge: {'🔥 YES' if quote.has_volume_surge else '❌ No'}")
+    lines.append(f"Session: {quote.price_data.session_type.label}")
+    lines.append(f"Near ATH: {'✅ YES' if quote.price_data.price >= Decimal('174.00') else '❌ No'}")
+    lines.append("")
     
     # Technical Indicators
-    print("📊 TECHNICAL INDICATORS")
-    print("-" * 30)
-    print(f"RSI (14): {technicals.rsi} {'🔴 Overbought' if technicals.is_overbought else '🟢 Normal' if not technicals.is_oversold else '🔵 Oversold'}")
-    print(f"MACD: {technicals.macd} (Signal: {technicals.macd_signal}) {'🔥 Bullish' if technicals.is_macd_bullish else '❄️ Bearish'}")
-    print(f"SMA 20: ${technicals.sma_20}")
-    print(f"SMA 50: ${technicals.sma_50}")
-    print(f"Price vs SMA20: {((quote.price_data.price / technicals.sma_20 - 1) * 100):+.1f}%")
-    print(f"Price vs SMA50: {((quote.price_data.price / technicals.sma_50 - 1) * 100):+.1f}%")
-    print()
+    lines.append("📊 TECHNICAL INDICATORS")
+    lines.append(SEP)
+    lines.append(f"RSI (14): {technicals.rsi} {'🔴 Overbought' if technicals.is_overbought else '🟢 Normal' if not technicals.is_oversold else '🔵 Oversold'}")
+    lines.append(f"MACD: {technicals.macd} (Signal: {technicals.macd_signal}) {'🔥 Bullish' if technicals.is_macd_bullish else '❄️ Bearish'}")
+    lines.append(f"SMA 20: ${technicals.sma_20}")
+    lines.append(f"SMA 50: ${technicals.sma_50}")
+    lines.append(f"Price vs SMA20: {((quote.price_data.price / technicals.sma_20 - 1) * 100):+.1f}%")
+    lines.append(f"Price vs SMA50: {((quote.price_data.price / technicals.sma_50 - 1) * 100):+.1f}%")
+    lines.append("")
     
     # Asset Properties & Methods
-    print("🔧 ASSET MODEL FEATURES")
-    print("-" * 30)
-    print(f"Qualified Symbol: {nvidia.qualified_symbol}")
-    print(f"Primary Segment: {nvidia.primary_segment.name if nvidia.primary_segment else 'N/A'}")
-    print(f"In Tech Sector: {nvidia.is_in_segment('technology')}")
-    print(f"In AI Chips: {nvidia.is_in_segment('ai_chips')}")
-    print(f"In S&P 500: {nvidia.is_in_segment('sp500')}")
-    print(f"Market Open: {nvidia.market.is_trading_day(datetime.now())}")
-    print()
+    lines.append("🔧 ASSET MODEL FEATURES")
+    lines.append(SEP)
+    lines.append(f"Qualified Symbol: {nvidia.qualified_symbol}")
+    lines.append(f"Primary Segment: {nvidia.primary_segment.name if nvidia.primary_segment else 'N/A'}")
+    lines.append(f"In Tech Sector: {nvidia.is_in_segment('technology')}")
+    lines.append(f"In AI Chips: {nvidia.is_in_segment('ai_chips')}")
+    lines.append(f"In S&P 500: {nvidia.is_in_segment('sp500')}")
+    lines.append(f"Market Open: {nvidia.market.is_trading_day(now)}")
+    lines.append("")
     
     # Data Quality & Sources
-    print("📡 DATA METADATA")
-    print("-" * 30)
-    print(f"Data Source: {quote.price_data.data_source}")
-    print(f"Data Quality: {quote.price_data.data_quality}")
-    print(f"Last Updated: {quote.price_data.timestamp}")
-    print(f"Complete OHLC: {quote.price_data.is_complete_bar}")
-    print()
+    lines.append("📡 DATA METADATA")
+    lines.append(SEP)
+    lines.append(f"Data Source: {quote.price_data.data_source}")
+    lines.append(f"Data Quality: {quote.price_data.data_quality}")
+    lines.append(f"Last Updated: {quote.price_data.timestamp}")
+    lines.append(f"Complete OHLC: {quote.price_data.is_complete_bar}")
+    lines.append("")
     
-    print("✅ DOMAIN MODEL DEMONSTRATION COMPLETE")
-    print("=" * 60)
-    print("This shows how real NVIDIA data maps perfectly to our")
-    print("clean Asset, Market, and PriceData domain model architecture!")
+    lines.append("✅ DOMAIN MODEL DEMONSTRATION COMPLETE")
+    lines.append("=" * 60)
+    lines.append("This shows how real NVIDIA data maps perfectly to our")
+    lines.append("clean Asset, Market, and PriceData domain model architecture!")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
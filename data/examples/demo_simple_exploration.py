@@ -8,6 +8,7 @@ during development and command-line exploration.
 
 import time
 import sys
+from functools import partial
 from pathlib import Path
 
 # Import our simple exploration utilities
@@ -46,50 +47,50 @@ def demo_simple_exploration():
     print("-" * 30)
     
     # First call - will fetch and save
-    start_time = time.time()
+    t0 = time.perf_counter_ns()
     nvda_polygon = get_or_fetch_api_data(
         "nvda_polygon_quote",
-        lambda: mock_polygon_api_call("NVDA"),
+        partial(mock_polygon_api_call, "NVDA"),
         "NVIDIA quote from Polygon.io"
     )
-    first_call_time = time.time() - start_time
+    first_call_time = (time.perf_counter_ns() - t0) / 1e9
     print(f"  ⏱️ First call took: {first_call_time:.2f}s")
     
     # Different API for same symbol
-    start_time = time.time()
+    t0 = time.perf_counter_ns()
     nvda_yfinance = get_or_fetch_api_data(
         "nvda_yfinance_quote", 
-        lambda: mock_yfinance_call("NVDA"),
+        partial(mock_yfinance_call, "NVDA"),
         "NVIDIA quote from Yahoo Finance"
     )
-    second_call_time = time.time() - start_time
+    second_call_time = (time.perf_counter_ns() - t0) / 1e9
     print(f"  ⏱️ Second call took: {second_call_time:.2f}s")
     
     print("\n2️⃣ REPEAT CALLS (Will load from files)")
     print("-" * 30)
     
     # Same calls again - should load from files
-    start_time = time.time()
+    t0 = time.perf_counter_ns()
     nvda_polygon_cached = get_or_fetch_api_data(
         "nvda_polygon_quote",
-        lambda: mock_polygon_api_call("NVDA"),
+        partial(mock_polygon_api_call, "NVDA"),
         "NVIDIA quote from Polygon.io"
     )
-    third_call_time = time.time() - start_time
+    third_call_time = (time.perf_counter_ns() - t0) / 1e9
     print(f"  ⚡ Third call (from file) took: {third_call_time:.3f}s")
     
-    start_time = time.time()
+    t0 = time.perf_counter_ns()
     nvda_yfinance_cached = get_or_fetch_api_data(
         "nvda_yfinance_quote",
-        lambda: mock_yfinance_call("NVDA"),
+        partial(mock_yfinance_call, "NVDA"),
         "NVIDIA quote from Yahoo Finance"
     )
-    fourth_call_time = time.time() - start_time
+    fourth_call_time = (time.perf_counter_ns() - t0) / 1e9
     print(f"  ⚡ Fourth call (from file) took: {fourth_call_time:.3f}s")
     
     print(f"\n📊 PERFORMANCE COMPARISON")
     print("-" * 30)
-    print(f"Speed improvement: {first_call_time/third_call_time:.0f}x faster!")
+    print(f"Speed improvement: {first_call_time / max(third_call_time, 1e-9):.0f}x faster!")
     print(f"API calls avoided: 2 out of 4 calls (50%)")
     
     return nvda_polygon, nvda_yfinance
@@ -107,7 +108,7 @@ def demo_exploration_with_refresh():
         # First call saves data
         data = get_or_fetch_api_data(
             f"{symbol.lower()}_quote",
-            lambda s=symbol: mock_polygon_api_call(s),
+            partial(mock_polygon_api_call, symbol),
             f"{symbol} quote data"
         )
         
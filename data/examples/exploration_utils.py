@@ -2,59 +2,84 @@
 """
 Simple API Exploration Utilities
 
-Save and load API results as text files to avoid repeated API calls
-during command-line exploration and development.
+Save and load API results as files (JSON, or parquet for DataFrames) to avoid
+repeated API calls during command-line exploration and development.
 """
 
-import json
 import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+import orjson
+import pandas as pd
+
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 
-def save_api_result(filename: str, data: Dict[str, Any], description: str = ""):
+EXAMPLES_DIR = Path(__file__).parent
+INDEX_PATH = EXAMPLES_DIR / ".index.json"
+
+ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+def save_api_result(filename: str, data: Any, description: str = ""):
     """
-    Save API result as a JSON file in data/examples/
+    Save API result in data/examples/
+    
+    DataFrames are written as parquet (columnar, typed), everything else as JSON.
     
     Args:
-        filename: Name for the file (without .json extension)
+        filename: Name for the file (without extension, may include subdirs)
         data: API response data to save
         description: Optional description of what this data represents
     """
-    filepath = Path(__file__).parent / f"{filename}.json"
-    
-    # Add metadata
-    save_data = {
-        "saved_at": datetime.now().isoformat(),
-        "description": description,
-        "data": data
-    }
-    
-    with open(filepath, 'w') as f:
-        json.dump(save_data, f, indent=2, default=str)
+    saved_at = datetime.now().isoformat()
+    
+    if isinstance(data, pd.DataFrame):
+        filepath = Path(__file__).parent / f"{filename}.parquet"
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        data = data.copy(deep=False)
+        data.attrs = {"saved_at": saved_at, "description": description}
+        data.to_parquet(filepath)
+    else:
+        filepath = Path(__file__).parent / f"{filename}.json"
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Add metadata
+        save_data = {
+            "saved_at": saved_at,
+            "description": description,
+            "data": data
+        }
+        
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(save_data, default=str, option=ORJSON_OPTIONS))
     
+    _update_index(filepath, saved_at, description)
     print(f"📁 Saved API result to {filepath.name}")
 
-def load_api_result(filename: str) -> Optional[Dict[str, Any]]:
+def load_api_result(filename: str) -> Optional[Any]:
     """
     Load previously saved API result
     
     Args:
-        filename: Name of the file (without .json extension)
+        filename: Name of the file (without extension, .parquet or .json is detected)
         
     Returns:
         The saved data, or None if file doesn't exist
     """
-    filepath = Path(__file__).parent / f"{filename}.json"
+    filepath = Path(__file__).parent / f"{filename}.parquet"
+    if filepath.exists():
+        df = pd.read_parquet(filepath)
+        print(f"📂 Loaded API result from {filepath.name} (saved: {df.attrs.get('saved_at', 'unknown')})")
+        return df
     
+    filepath = Path(__file__).parent / f"{filename}.json"
     if not filepath.exists():
         return None
     
-    with open(filepath, 'r') as f:
-        saved_data = json.load(f)
+    with open(filepath, 'rb') as f:
+        saved_data = orjson.loads(f.read())
     
     print(f"📂 Loaded API result from {filepath.name} (saved: {saved_data.get('saved_at', 'unknown')})")
     return saved_data.get('data')
@@ -81,40 +106,99 @@ def get_or_fetch_api_data(filename: str, fetch_function, description: str = "",
     print(f"🌐 Fetching fresh data from API...")
     fresh_data = fetch_function()
     
-    # Save for next time
-    save_api_result(filename, fresh_data, description)
+    # Save for next time, unless the fetch came back empty (retry on next run)
+    if fresh_data is None or getattr(fresh_data, 'empty', False):
+        print(f"⚠️  Empty API result for {filename}, not saving")
+    else:
+        save_api_result(filename, fresh_data, description)
     
     return fresh_data
 
+def _read_file_metadata(filepath: Path) -> Dict[str, Any]:
+    """Read saved_at/description from a result file (slow path for unindexed files)"""
+    if filepath.suffix == ".parquet":
+        import pyarrow.parquet as pq
+        metadata = (pq.read_schema(filepath).pandas_metadata or {}).get("attributes", {})
+    else:
+        with open(filepath, 'rb') as f:
+            metadata = orjson.loads(f.read())
+    
+    return {
+        "saved_at": metadata.get('saved_at', 'unknown'),
+        "description": metadata.get('description', 'No description'),
+        "size": filepath.stat().st_size,
+    }
+
+def _load_index() -> Dict[str, Dict[str, Any]]:
+    """Load the saved-results metadata index, or {} if it is missing/corrupt"""
+    try:
+        with open(INDEX_PATH, 'rb') as f:
+            return orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+
+def _save_index(index: Dict[str, Dict[str, Any]]):
+    with open(INDEX_PATH, 'wb') as f:
+        f.write(orjson.dumps(index, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
+
+def _update_index(filepath: Path, saved_at: str, description: str):
+    """Record a newly saved file in the metadata index"""
+    index = _load_index()
+    index[filepath.relative_to(EXAMPLES_DIR).as_posix()] = {
+        "saved_at": saved_at,
+        "description": description,
+        "size": filepath.stat().st_size,
+    }
+    _save_index(index)
+
 def list_saved_results():
-    """List all saved API results"""
-    examples_dir = Path(__file__).parent
-    json_files = list(examples_dir.glob("*.json"))
+    """
+    List all saved API results
     
-    if not json_files:
+    Metadata comes from data/examples/.index.json (maintained by
+    save_api_result); only files missing from the index are opened, and the
+    index is updated with them.
+    """
+    result_files = sorted(
+        p.relative_to(EXAMPLES_DIR).as_posix()
+        for pattern in ("*.json", "*.parquet")
+        for p in EXAMPLES_DIR.rglob(pattern)
+        if p != INDEX_PATH
+    )
+    
+    if not result_files:
         print("📭 No saved API results found")
         return
     
+    index = _load_index()
+    index_changed = False
+    
     print("📚 Saved API Results:")
     print("-" * 30)
     
-    for filepath in sorted(json_files):
-        try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
-            
-            saved_at = data.get('saved_at', 'unknown')
-            description = data.get('description', 'No description')
-            size_kb = filepath.stat().st_size / 1024
-            
-            print(f"{filepath.name}")
-            print(f"  📅 Saved: {saved_at}")
-            print(f"  📝 Description: {description}")
-            print(f"  📏 Size: {size_kb:.1f} KB")
-            print()
-            
-        except Exception as e:
-            print(f"{filepath.name} (error reading: {e})")
+    for name in result_files:
+        entry = index.get(name)
+        if entry is None:
+            try:
+                entry = _read_file_metadata(EXAMPLES_DIR / name)
+            except Exception as e:
+                print(f"{name} (error reading: {e})")
+                continue
+            index[name] = entry
+            index_changed = True
+        
+        print(f"{name}")
+        print(f"  📅 Saved: {entry['saved_at']}")
+        print(f"  📝 Description: {entry['description']}")
+        print(f"  📏 Size: {entry['size'] / 1024:.1f} KB")
+        print()
+    
+    # Drop entries for deleted files while we're here
+    stale = set(index) - set(result_files)
+    if index_changed or stale:
+        for name in stale:
+            del index[name]
+        _save_index(index)
 
 
 if __name__ == "__main__":
@@ -10,8 +10,11 @@ sys.path.append('/home/ccollins/projects/TradeScout/src')
 from tradescout.web_scraping.cnn_after_hours_scraper import CNNAfterHoursScraper
 import logging
 
-# Set up logging
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
+# Set up logging - DEBUG for our code only, Selenium/urllib3 debug output is huge
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logging.getLogger('tradescout').setLevel(logging.DEBUG)
+logging.getLogger('urllib3').setLevel(logging.WARNING)
+logging.getLogger('selenium').setLevel(logging.WARNING)
 
 def test_cnn_direct():
     """Test CNN scraper directly without clicking tabs"""
@@ -9,10 +9,15 @@ sys.path.append('/home/ccollins/projects/TradeScout/src')
 
 from tradescout.web_scraping.cnn_after_hours_scraper import CNNAfterHoursScraper
 import logging
+import re
 import time
 
-# Set up logging
+# Set up logging - keep Selenium/urllib3 chatter out of the output
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logging.getLogger('urllib3').setLevel(logging.WARNING)
+logging.getLogger('selenium').setLevel(logging.WARNING)
+
+CONSENT_TEXT_PATTERN = re.compile(r'(accept|privacy|terms)', re.IGNORECASE)
 
 def test_cnn_manual():
     """Test CNN scraper non-headless to see popup"""
@@ -33,22 +38,17 @@ def test_cnn_manual():
     from bs4 import BeautifulSoup
     soup = BeautifulSoup(scraper.driver.page_source, 'html.parser')
     
-    # Look for any elements containing "accept", "privacy", "terms"
-    accept_elements = soup.find_all(string=lambda text: text and "accept" in text.lower())
-    privacy_elements = soup.find_all(string=lambda text: text and "privacy" in text.lower()) 
-    terms_elements = soup.find_all(string=lambda text: text and "terms" in text.lower())
-    
-    print(f"\nFound {len(accept_elements)} elements with 'accept' text:")
-    for elem in accept_elements[:5]:  # First 5
-        print(f"  - {elem.strip()}")
-    
-    print(f"\nFound {len(privacy_elements)} elements with 'privacy' text:")
-    for elem in privacy_elements[:5]:  # First 5
-        print(f"  - {elem.strip()}")
-        
-    print(f"\nFound {len(terms_elements)} elements with 'terms' text:")
-    for elem in terms_elements[:5]:  # First 5
-        print(f"  - {elem.strip()}")
+    # Look for any elements containing "accept", "privacy", "terms" in one pass
+    matches = soup.find_all(string=CONSENT_TEXT_PATTERN)
+    groups = {'accept': [], 'privacy': [], 'terms': []}
+    for elem in matches:
+        for keyword in {match.lower() for match in CONSENT_TEXT_PATTERN.findall(elem)}:
+            groups[keyword].append(elem)
+    
+    for keyword, elements in groups.items():
+        print(f"\nFound {len(elements)} elements with '{keyword}' text:")
+        for elem in elements[:5]:  # First 5
+            print(f"  - {elem.strip()}")
     
     print("\nKeeping browser open for 10 more seconds...")
     time.sleep(10)
@@ -11,9 +11,37 @@ sys.path.append('/home/ccollins/projects/TradeScout/src')
 
 from tradescout.web_scraping.cnn_after_hours_scraper import CNNAfterHoursScraper
 import logging
+import re
 
-# Set up logging to see what's happening
+# Set up logging - keep Selenium/urllib3 chatter out of the output
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logging.getLogger('urllib3').setLevel(logging.WARNING)
+logging.getLogger('selenium').setLevel(logging.WARNING)
+
+# Bytes regex/set: ticker text is ASCII, so scan one encoded blob
+SYMBOL_RE = re.compile(rb'\b[A-Z]{2,5}\b')
+COMMON_SYMBOLS = frozenset({b'AAPL', b'MSFT', b'GOOGL', b'AMZN', b'TSLA', b'META', b'NVDA', b'NFLX'})
+GAINERS_TAB_XPATH = " | ".join([
+    "//button[contains(text(), 'Gainer')]",
+    "//a[contains(text(), 'Gainer')]",
+    "//span[contains(text(), 'Gainer')]",
+    "//div[contains(text(), 'Gainer')]",
+    "//*[contains(@class, 'gainer')]",
+    "//*[contains(@data-tab, 'gainer')]",
+    "//button[contains(., 'Gainer')]",
+    "//a[contains(., 'Gainer')]",
+])
+DATA_ROW_XPATH = "//table//tr[position()>1]"  # Present once stock data has rendered
+DEBUG_CNN = bool(os.environ.get('DEBUG_CNN'))
+CELL_SPLIT_RE = re.compile(r'[\t\n]+')
+# Extract only the text we need inside the browser - one WebDriver round trip
+PAGE_DATA_JS = """
+return {
+    tables: document.getElementsByTagName('table').length,
+    rows: Array.from(document.querySelectorAll('table tr'), row => row.innerText),
+    links: Array.from(document.querySelectorAll("a[href*='/markets/stocks/']"), a => a.innerText),
+};
+"""
 
 def test_cnn_scraper():
     """Test the CNN after-hours scraper"""
@@ -47,48 +75,50 @@ def test_cnn_scraper():
     print("\n4. Testing after-hours gainers...")
     try:
         # First let's inspect the HTML structure
-        scraper._setup_driver()
-        scraper.driver.get("https://www.cnn.com/markets/after-hours")
-        import time
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.common.exceptions import TimeoutException
+        
+        # Private driver: settings changed here must not leak into the shared one
+        inspector = CNNAfterHoursScraper(delay_seconds=2.0, headless=True, reuse=False)
+        inspector._setup_driver()
+        inspector.driver.set_page_load_timeout(15)
+        inspector.driver.get("https://www.cnn.com/markets/after-hours")
         
-        # CNN uses JavaScript to load data, so we need to wait longer
+        # CNN uses JavaScript to load data - wait until a data row renders
         print("   Waiting for JavaScript to load stock data...")
-        time.sleep(5)  # Wait for dynamic content to load
+        try:
+            WebDriverWait(inspector.driver, 10).until(
+                EC.presence_of_element_located((By.XPATH, DATA_ROW_XPATH))
+            )
+        except TimeoutException:
+            print("   Stock data rows did not appear within 10s")
         
         # Look for Gainers button/tab and click it
         try:
-            from selenium.webdriver.common.by import By
-            from selenium.webdriver.support.ui import WebDriverWait
-            from selenium.webdriver.support import expected_conditions as EC
-            
-            # Try to find and click gainers tab/button
+            # Try to find and click gainers tab/button - one union XPath, one wait
             print("   Looking for Gainers tab...")
-            gainers_selectors = [
-                "//button[contains(text(), 'Gainer')]",
-                "//a[contains(text(), 'Gainer')]", 
-                "//span[contains(text(), 'Gainer')]",
-                "//div[contains(text(), 'Gainer')]",
-                "//*[contains(@class, 'gainer')]",
-                "//*[contains(@data-tab, 'gainer')]",
-                "//button[contains(., 'Gainer')]",
-                "//a[contains(., 'Gainer')]"
-            ]
-            
-            gainers_element = None
-            for selector in gainers_selectors:
-                try:
-                    gainers_element = WebDriverWait(scraper.driver, 3).until(
-                        EC.element_to_be_clickable((By.XPATH, selector))
-                    )
-                    print(f"   Found Gainers element with selector: {selector}")
-                    break
-                except:
-                    continue
+            try:
+                gainers_element = WebDriverWait(inspector.driver, 5).until(
+                    EC.element_to_be_clickable((By.XPATH, GAINERS_TAB_XPATH))
+                )
+                print("   Found Gainers element")
+            except TimeoutException:
+                gainers_element = None
             
             if gainers_element:
                 print("   Clicking Gainers tab...")
+                old_rows = inspector.driver.find_elements(By.XPATH, DATA_ROW_XPATH)
                 gainers_element.click()
-                time.sleep(3)  # Wait for data to load after click
+                # Wait for the table to re-render rather than a fixed delay
+                try:
+                    WebDriverWait(inspector.driver, 10).until(
+                        EC.staleness_of(old_rows[0]) if old_rows
+                        else EC.presence_of_element_located((By.XPATH, DATA_ROW_XPATH))
+                    )
+                except TimeoutException:
+                    print("   Table did not refresh after click - using current data")
             else:
                 print("   No Gainers tab found - data might be already visible")
                 
@@ -96,38 +126,36 @@ def test_cnn_scraper():
             print(f"   Error looking for Gainers tab: {e}")
         
         # Now inspect the updated page
-        from bs4 import BeautifulSoup
-        soup = BeautifulSoup(scraper.driver.page_source, 'html.parser')
-        
-        # Look for tables, lists, or divs that might contain stock data
         print("   Inspecting page structure for stock data...")
+        page_data = inspector.driver.execute_script(PAGE_DATA_JS)
         
-        # Save the full HTML for inspection if needed
-        with open('/home/ccollins/projects/TradeScout/data/examples/cnn_page_source_after_click.html', 'w') as f:
-            f.write(scraper.driver.page_source)
-        print("   Updated page source saved to data/examples/cnn_page_source_after_click.html")
+        # Save the full HTML for inspection only when debugging
+        if DEBUG_CNN:
+            with open('/home/ccollins/projects/TradeScout/data/examples/cnn_page_source_after_click.html', 'w') as f:
+                f.write(inspector.driver.page_source)
+            print("   Updated page source saved to data/examples/cnn_page_source_after_click.html")
         
         # Look for common patterns
-        tables = soup.find_all('table')
-        print(f"   Found {len(tables)} tables")
+        print(f"   Found {page_data['tables']} tables")
         
-        # Look for elements that might contain stock symbols and percentages
-        potential_stock_elements = soup.find_all(string=lambda text: text and ('%' in str(text) or '+' in str(text) or '-' in str(text)))
-        stock_like_text = [text.strip() for text in potential_stock_elements if text.strip() and len(text.strip()) < 30][:15]
+        # Look for table cells that might contain percentages/changes
+        cells = [cell.strip() for row in page_data['rows'] for cell in CELL_SPLIT_RE.split(row)]
+        stock_like_text = [
+            cell for cell in cells if cell and len(cell) < 30 and ('%' in cell or '+' in cell or '-' in cell)
+        ][:15]
         print(f"   Sample percentage/change text found: {stock_like_text}")
         
-        # Look specifically for stock symbols pattern
-        import re
-        symbol_pattern = r'\b[A-Z]{2,5}\b'
-        all_text = soup.get_text()
-        potential_symbols = re.findall(symbol_pattern, all_text)
-        common_symbols = [s for s in potential_symbols if s in ['AAPL', 'MSFT', 'GOOGL', 'AMZN', 'TSLA', 'META', 'NVDA', 'NFLX']][:10]
+        # Look specifically for stock symbols, only in table rows and stock links
+        blob = ' '.join(page_data['rows'] + page_data['links']).encode()
+        common_symbols = [s.decode() for s in SYMBOL_RE.findall(blob) if s in COMMON_SYMBOLS][:10]
         print(f"   Found common stock symbols: {common_symbols}")
         
-        print("   Keeping browser open for 10 seconds for manual inspection...")
-        time.sleep(10)
+        if DEBUG_CNN:
+            import time
+            print("   Keeping browser open for 10 seconds for manual inspection...")
+            time.sleep(10)
         
-        scraper._cleanup_driver()
+        inspector._cleanup_driver()
         
         gainers = scraper.get_after_hours_gainers(limit=3)
         print(f"   Found {len(gainers)} gainers")
@@ -9,6 +9,8 @@ __version__ = "0.1.0"
 __author__ = "Charlie Collins"
 __description__ = "Personal Market Research Assistant for Momentum Trading"
 
+import importlib
+
 # Core public API exports
 from .data_models.domain_models_core import (
     Asset,
@@ -21,7 +23,12 @@ from .data_models.domain_models_core import (
     MarketStatus,
 )
 from .data_models.interfaces import AssetDataProvider
-from .data_sources.asset_data_provider_yfinance import AssetDataProviderYFinance
+
+# Provider implementations pull in heavy third-party packages (yfinance,
+# pandas), so they are imported on first access instead of at package import
+_LAZY_IMPORTS = {
+    "AssetDataProviderYFinance": ".data_sources.asset_data_provider_yfinance",
+}
 
 __all__ = [
     "Asset",
@@ -35,3 +42,13 @@ __all__ = [
     "AssetDataProvider",
     "AssetDataProviderYFinance",
 ]
+
+
+def __getattr__(name):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
@@ -6,9 +6,33 @@ Core analysis modules:
 - Gap detection and momentum analysis
 - Trade suggestion engine
 - Performance tracking
+
+Implementations are imported lazily (PEP 562) so importing a sibling module
+does not pay for every analysis dependency up front.
 """
 
-from .technical_analysis import TechnicalAnalyzer
-from .gap_scanner import GapScanner
-from .suggestion_engine import SuggestionEngine
-from .performance_tracker import PerformanceTracker
+import importlib
+
+_LAZY_IMPORTS = {
+    "TechnicalAnalyzer": ".technical_analysis",
+    "GapScanner": ".gap_scanner",
+    "GapTypeAnalyzer": ".gap_classifier",
+    "MomentumDetector": ".momentum_detector",
+    "ScanOrchestrator": ".orchestrator",
+    "SuggestionEngine": ".suggestion_engine",
+    "PerformanceTracker": ".performance_tracker",
+    "RiskCalculator": ".risk_calculator",
+    "MarketSessionManager": ".market_session",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
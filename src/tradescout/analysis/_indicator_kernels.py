@@ -0,0 +1,142 @@
+"""
+Technical indicator kernels
+
+Single-pass loops over float64 arrays, JIT-compiled when numba is installed
+(see data_models._kernels). Every kernel returns an array the same length as
+its input with NaN for the warm-up bars, so callers can take the last value
+or keep the whole series.
+"""
+
+import numpy as np
+
+from ..data_models._kernels import njit, prange
+
+
+@njit(cache=True, fastmath=True)
+def sma(a, n):
+    """Simple moving average using a running window sum"""
+    out = np.full(a.shape[0], np.nan)
+    total = 0.0
+    for i in range(a.shape[0]):
+        total += a[i]
+        if i >= n:
+            total -= a[i - n]
+        if i >= n - 1:
+            out[i] = total / n
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def _ema_from(a, n, start):
+    """EMA seeded with the SMA of a[start:start + n]"""
+    out = np.full(a.shape[0], np.nan)
+    if a.shape[0] - start < n:
+        return out
+    alpha = 2.0 / (n + 1)
+    e = 0.0
+    for i in range(start, start + n):
+        e += a[i]
+    e /= n
+    out[start + n - 1] = e
+    for i in range(start + n, a.shape[0]):
+        e = alpha * a[i] + (1.0 - alpha) * e
+        out[i] = e
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def ema(a, n):
+    """Exponential moving average: e = alpha * x + (1 - alpha) * e"""
+    return _ema_from(a, n, 0)
+
+
+@njit(cache=True, fastmath=True)
+def rsi(a, n=14):
+    """Relative strength index with Wilder smoothing"""
+    out = np.full(a.shape[0], np.nan)
+    if a.shape[0] <= n:
+        return out
+    gain = 0.0
+    loss = 0.0
+    for i in range(1, n + 1):
+        delta = a[i] - a[i - 1]
+        if delta > 0:
+            gain += delta
+        else:
+            loss -= delta
+    gain /= n
+    loss /= n
+    for i in range(n, a.shape[0]):
+        if i > n:
+            delta = a[i] - a[i - 1]
+            up = delta if delta > 0 else 0.0
+            down = -delta if delta < 0 else 0.0
+            gain = (gain * (n - 1) + up) / n
+            loss = (loss * (n - 1) + down) / n
+        if loss == 0.0:
+            out[i] = 100.0
+        else:
+            out[i] = 100.0 - 100.0 / (1.0 + gain / loss)
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def macd(a, fast=12, slow=26, signal=9):
+    """Return (macd_line, signal_line, histogram)"""
+    line = ema(a, fast) - ema(a, slow)
+    signal_line = _ema_from(line, signal, slow - 1)
+    return line, signal_line, line - signal_line
+
+
+# No fastmath: missing highs/lows are detected with isnan
+@njit(cache=True)
+def atr(high, low, close, n=14):
+    """Average true range with Wilder smoothing; a NaN high or low uses the close"""
+    size = close.shape[0]
+    out = np.full(size, np.nan)
+    if size <= n:
+        return out
+    highs = np.where(np.isnan(high), close, high)
+    lows = np.where(np.isnan(low), close, low)
+    tr = np.empty(size)
+    tr[0] = highs[0] - lows[0]
+    for i in range(1, size):
+        prev = close[i - 1]
+        tr[i] = max(highs[i] - lows[i], abs(highs[i] - prev), abs(lows[i] - prev))
+    value = 0.0
+    for i in range(1, n + 1):
+        value += tr[i]
+    value /= n
+    out[n] = value
+    for i in range(n + 1, size):
+        value = (value * (n - 1) + tr[i]) / n
+        out[i] = value
+    return out
+
+
+# No fastmath: the padding scan relies on isnan
+@njit(parallel=True, cache=True)
+def indicators_2d(close, high, low, volume, out):
+    """
+    Fill out[k] with indicator k for every row of (N, T) price matrices
+
+    out is (7, N, T), pre-filled with NaN, in the order rsi, macd line, macd
+    signal, atr, sma 20, sma 50, volume ratio (volume over its 20-bar SMA).
+    Rows are independent, so they run in parallel; leading NaN padding is
+    skipped so right-aligned histories warm up from their first real bar.
+    """
+    n_rows, n_bars = close.shape
+    for i in prange(n_rows):
+        start = 0
+        while start < n_bars and np.isnan(close[i, start]):
+            start += 1
+        c = close[i, start:]
+        line, signal_line, _ = macd(c, 12, 26, 9)
+        volume_sma = sma(volume[i, start:], 20)
+        out[0, i, start:] = rsi(c, 14)
+        out[1, i, start:] = line
+        out[2, i, start:] = signal_line
+        out[3, i, start:] = atr(high[i, start:], low[i, start:], c, 14)
+        out[4, i, start:] = sma(c, 20)
+        out[5, i, start:] = sma(c, 50)
+        out[6, i, start:] = volume[i, start:] / volume_sma
@@ -0,0 +1,31 @@
+"""
+Shared trade-level conventions
+
+Stop placement and price/confidence formatting used by every component
+that builds or sizes a TradeSuggestion, so the orchestrator, suggestion
+engine and risk calculator agree on them.
+"""
+
+from decimal import Decimal
+
+from ..data_models.domain_models_analysis import ConfidenceLevel
+
+# Stop distance in ATRs, and as a fraction of entry when ATR is unavailable
+ATR_STOP_MULTIPLE = 1.5
+FALLBACK_STOP_FRACTION = 0.02
+
+
+def confidence_level(score: float) -> ConfidenceLevel:
+    """Bucket a [0, 1] score into a ConfidenceLevel"""
+    if score >= 0.95:
+        return ConfidenceLevel.VERY_HIGH
+    if score >= 0.85:
+        return ConfidenceLevel.HIGH
+    if score >= 0.7:
+        return ConfidenceLevel.MEDIUM
+    return ConfidenceLevel.LOW
+
+
+def money(value: float) -> Decimal:
+    """Price rounded to cents"""
+    return Decimal(f"{value:.2f}")
@@ -0,0 +1,525 @@
+"""
+TradeScout Gap Type Classification
+
+CandidateGapTypeAnalyzer that classifies, scores and assesses gaps on
+N-length arrays. The per-candidate interface methods run the same batch code
+on a single row, so batch screening and one-off analysis always agree.
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..data_models.domain_models_analysis import (
+    GapClassification,
+    GapRiskLevel,
+    GapStrength,
+    GapStrengthMetrics,
+    GapTradabilityAssessment,
+    GapType,
+    TradeSide,
+)
+from ..data_models.domain_models_core import _SLOTS, ExtendedHoursData, MarketQuote
+from .interfaces import CandidateGapTypeAnalyzer
+
+# int8 codes for the batch arrays; UNKNOWN marks rows without reference data
+GAP_TYPES = (
+    GapType.COMMON,
+    GapType.BREAKAWAY,
+    GapType.CONTINUATION,
+    GapType.EXHAUSTION,
+    GapType.UNKNOWN,
+)
+COMMON, BREAKAWAY, CONTINUATION, EXHAUSTION, UNKNOWN = range(len(GAP_TYPES))
+
+GAP_STRENGTHS = (
+    GapStrength.WEAK,
+    GapStrength.MODERATE,
+    GapStrength.STRONG,
+    GapStrength.VERY_STRONG,
+)
+RISK_LEVELS = (
+    GapRiskLevel.LOW,
+    GapRiskLevel.MEDIUM,
+    GapRiskLevel.HIGH,
+    GapRiskLevel.EXTREME,
+)
+STRATEGIES = ("avoid", "momentum", "reversal")
+
+# Research continuation rates per gap type (GAP_TRADING_RESEARCH.md)
+CONTINUATION_RATES = np.array([0.25, 0.70, 0.80, 0.20, 0.0])
+
+# Gap-size bin edges in percent: common < 2 <= breakaway <= 5 < continuation <= 7
+GAP_BIN_EDGES = np.array([2.0, 5.0, 7.0])
+VOLUME_CONFIRMATION_RATIO = 2.0
+
+# Same edges for a side="left" searchsorted: the first edge is nudged down one
+# ulp so a gap of exactly 2% lands in the breakaway bin
+_LUT_EDGES = np.array([np.nextafter(2.0, 0.0), 5.0, 7.0])
+# Gap type code by [size bin, volume confirmed]
+_GAP_TYPE_TABLE = np.array(
+    [
+        [COMMON, COMMON],
+        [BREAKAWAY, BREAKAWAY],
+        [EXHAUSTION, CONTINUATION],
+        [EXHAUSTION, EXHAUSTION],
+    ],
+    dtype=np.int8,
+)
+
+POSITION_SIZE_BY_RISK = (Decimal("2.0"), Decimal("1.0"), Decimal("0.5"), Decimal("0"))
+
+# Batch-run statistics are kept per calendar day for at most this many days
+MAX_STATS_LOOKBACK_DAYS = 365
+
+ASSESSMENT_DTYPE = np.dtype(
+    [
+        ("gap_type", np.int8),
+        ("confidence", np.float64),
+        ("strength", np.float64),
+        ("tradeable", np.bool_),
+        ("strategy", np.int8),
+        ("risk", np.int8),
+        ("quality", np.float64),
+    ]
+)
+
+
+def _decimal(value: float, places: str = "0.0001") -> Decimal:
+    return Decimal(str(float(value))).quantize(Decimal(places))
+
+
+@dataclass(**_SLOTS)
+class _GapDay:
+    """Batch-run aggregates for one calendar day"""
+
+    type_counts: np.ndarray  # int64 per GAP_TYPES code
+    total: int = 0
+    tradeable: int = 0
+    confidence_sum: float = 0.0
+
+    def add(self, rows: np.ndarray) -> None:
+        self.type_counts += np.bincount(rows["gap_type"], minlength=len(GAP_TYPES))
+        self.total += rows.shape[0]
+        self.tradeable += int(rows["tradeable"].sum())
+        self.confidence_sum += float(rows["confidence"].sum())
+
+
+class GapTypeAnalyzer(CandidateGapTypeAnalyzer):
+    """Research-threshold gap classifier with vectorized batch screening"""
+
+    def __init__(self):
+        self._days: Dict[date, _GapDay] = {}
+
+    # Batch stages
+
+    def classify_gap_type_batch(
+        self, opens, prev_closes, volumes, avg_volumes
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Classify N gaps at once
+
+        Returns:
+            (gap_type_codes int8[N], confidence float64[N], probs float64[N, 4])
+            where probs holds per-type probabilities in GAP_TYPES order
+        """
+        gap_pct = self._gap_percents(opens, prev_closes)
+        vol_ratio = self._volume_ratios(volumes, avg_volumes)
+        abs_gap = np.abs(gap_pct)
+        confirmed = vol_ratio >= VOLUME_CONFIRMATION_RATIO
+
+        size_bin = np.searchsorted(_LUT_EDGES, abs_gap, side="left")
+        codes = _GAP_TYPE_TABLE[size_bin, confirmed.astype(np.intp)]
+        codes[np.isnan(abs_gap)] = UNKNOWN
+
+        # Confidence grows with distance from the nearest bin edge and with
+        # volume confirmation
+        margin = np.min(np.abs(abs_gap[:, None] - GAP_BIN_EDGES), axis=1)
+        confidence = 0.5 + 0.3 * np.clip(margin, 0.0, 1.0) + 0.2 * confirmed
+        confidence[codes == UNKNOWN] = 0.0
+
+        probs = np.repeat(((1.0 - confidence) / 3.0)[:, None], 4, axis=1)
+        known = np.flatnonzero(codes != UNKNOWN)
+        probs[known, codes[known]] = confidence[known]
+        probs[codes == UNKNOWN] = 0.0
+        return codes, confidence, probs
+
+    def analyze_gap_strength_batch(
+        self, volumes, avg_volumes, catalyst_scores=None, alignment_scores=None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Score gap strength for N candidates
+
+        Args:
+            catalyst_scores: News catalyst quality 0-1 per row (default 0)
+            alignment_scores: Share of technical/market confirmations 0-1
+                per row (default 0)
+
+        Returns:
+            (strength_score float64[N], strength_codes int8[N])
+        """
+        vol_ratio = self._volume_ratios(volumes, avg_volumes)
+        n = vol_ratio.shape[0]
+        catalyst = np.zeros(n) if catalyst_scores is None else catalyst_scores
+        alignment = np.zeros(n) if alignment_scores is None else alignment_scores
+
+        volume_score = np.where(
+            vol_ratio >= 3.0,
+            0.4,
+            np.where(vol_ratio >= 2.0, 0.3, np.where(vol_ratio >= 1.5, 0.15, 0.0)),
+        )
+        score = volume_score + 0.3 * np.asarray(catalyst) + 0.3 * np.asarray(alignment)
+        codes = np.searchsorted([0.3, 0.5, 0.7], score, side="right").astype(np.int8)
+        return score, codes
+
+    def assess_tradability_batch(
+        self, gap_codes, confidence, gap_pct, strength_scores
+    ) -> np.ndarray:
+        """Combine classification and strength arrays into ASSESSMENT_DTYPE rows"""
+        tradeable = (
+            (gap_codes != COMMON)
+            & (gap_codes != UNKNOWN)
+            & (confidence >= 0.6)
+            & (np.abs(gap_pct) >= 2.0)
+        )
+        # Mirrors GapClassification.risk_level
+        risk = np.select(
+            [
+                (gap_codes == CONTINUATION) & (confidence >= 0.8),
+                (gap_codes == BREAKAWAY) & (confidence >= 0.7),
+                gap_codes == EXHAUSTION,
+            ],
+            [0, 1, 2],
+            default=3,
+        )
+        strategy = np.where(~tradeable, 0, np.where(gap_codes == EXHAUSTION, 2, 1))
+        # Mirrors GapTradabilityAssessment.trade_quality_score
+        quality = np.minimum(
+            1.0,
+            confidence * 0.4
+            + strength_scores * 0.4
+            + np.where(risk <= 1, 1.0, 0.2) * 0.2,
+        )
+
+        out = np.empty(len(gap_codes), dtype=ASSESSMENT_DTYPE)
+        out["gap_type"] = gap_codes
+        out["confidence"] = confidence
+        out["strength"] = strength_scores
+        out["tradeable"] = tradeable
+        out["strategy"] = strategy
+        out["risk"] = risk
+        out["quality"] = np.where(tradeable, quality, 0.0)
+        return out
+
+    # Per-candidate interface
+
+    def classify_gap_type(
+        self,
+        quote: MarketQuote,
+        extended_data: ExtendedHoursData,
+        historical_context: Optional[Dict[str, any]] = None,
+    ) -> GapClassification:
+        """Classify a single gap from extended-hours price vs regular close"""
+        price = float(extended_data.price_data.price)
+        prev_close = float(extended_data.regular_session_close)
+        codes, confidence, _ = self.classify_gap_type_batch(
+            [price],
+            [prev_close],
+            [extended_data.price_data.volume],
+            [quote.average_volume or np.nan],
+        )
+        return self._build_classification(
+            quote, codes[0], confidence[0], price, prev_close, historical_context
+        )
+
+    def analyze_gap_strength(
+        self,
+        gap_classification: GapClassification,
+        volume_data: Dict[str, Decimal],
+        market_context: Dict[str, any],
+    ) -> GapStrengthMetrics:
+        """Score a single gap from volume data and market context flags"""
+        volume_ratio = float(volume_data.get("volume_ratio", 0))
+        news_present = bool(market_context.get("news_catalyst_present", False))
+        catalyst_quality = float(market_context.get("catalyst_quality_score", 0))
+        flags = {
+            name: bool(market_context.get(name, False))
+            for name in (
+                "technical_breakout",
+                "trend_alignment",
+                "support_resistance_break",
+                "market_alignment",
+                "sector_momentum",
+            )
+        }
+
+        score, codes = self.analyze_gap_strength_batch(
+            [volume_ratio],
+            [1.0],
+            [catalyst_quality if news_present else 0.0],
+            [sum(flags.values()) / len(flags)],
+        )
+        return GapStrengthMetrics(
+            asset=gap_classification.asset,
+            timestamp=datetime.now(),
+            volume_ratio=_decimal(volume_ratio),
+            volume_confirmation=volume_ratio >= VOLUME_CONFIRMATION_RATIO,
+            premarket_volume_surge=bool(
+                volume_data.get("premarket_volume_surge", False)
+            ),
+            news_catalyst_present=news_present,
+            catalyst_quality_score=_decimal(catalyst_quality),
+            overall_strength=GAP_STRENGTHS[codes[0]],
+            strength_score=_decimal(score[0]),
+            catalyst_type=market_context.get("catalyst_type", ""),
+            overall_market_trend=market_context.get("overall_market_trend", ""),
+            **flags,
+        )
+
+    def assess_tradability(
+        self,
+        gap_classification: GapClassification,
+        strength_metrics: GapStrengthMetrics,
+        risk_parameters: Optional[Dict[str, any]] = None,
+    ) -> GapTradabilityAssessment:
+        """Assess a single classified and scored gap"""
+        row = self.assess_tradability_batch(
+            np.array([GAP_TYPES.index(gap_classification.gap_type)]),
+            np.array([float(gap_classification.confidence_score)]),
+            np.array([float(gap_classification.gap_percent)]),
+            np.array([float(strength_metrics.strength_score)]),
+        )[0]
+        return self._build_assessment(
+            gap_classification, strength_metrics, row, risk_parameters
+        )
+
+    def batch_analyze_candidates(
+        self, candidates: List[MarketQuote], top_k: Optional[int] = None
+    ) -> List[GapTradabilityAssessment]:
+        """
+        Analyze candidates as arrays and materialize only the best top_k
+
+        Args:
+            candidates: Market quotes with potential gaps
+            top_k: Number of assessments to return (default: all)
+
+        Returns:
+            Assessments sorted by trade quality score, best first
+        """
+        n = len(candidates)
+        if n == 0:
+            return []
+
+        bars = [q.price_data for q in candidates]
+        opens = np.fromiter(
+            (float(b.open_price or b.price) for b in bars), np.float64, n
+        )
+        prev_closes = np.fromiter(
+            (float(q.previous_close or "nan") for q in candidates), np.float64, n
+        )
+        volumes = np.fromiter((b.volume for b in bars), np.float64, n)
+        avg_volumes = np.fromiter(
+            (q.average_volume or np.nan for q in candidates), np.float64, n
+        )
+
+        codes, confidence, _ = self.classify_gap_type_batch(
+            opens, prev_closes, volumes, avg_volumes
+        )
+        strength, strength_codes = self.analyze_gap_strength_batch(
+            volumes, avg_volumes
+        )
+        gap_pct = self._gap_percents(opens, prev_closes)
+        rows = self.assess_tradability_batch(codes, confidence, gap_pct, strength)
+        self._record_run(rows)
+
+        k = n if top_k is None else min(top_k, n)
+        if k <= 0:
+            return []
+        quality = rows["quality"]
+        top = np.argpartition(-quality, k - 1)[:k] if k < n else np.arange(n)
+        top = top[np.argsort(-quality[top], kind="stable")]
+
+        vol_ratio = self._volume_ratios(volumes, avg_volumes)
+        assessments = []
+        for i in top:
+            quote = candidates[i]
+            classification = self._build_classification(
+                quote, codes[i], confidence[i], opens[i], prev_closes[i]
+            )
+            metrics = GapStrengthMetrics(
+                asset=quote.asset,
+                timestamp=classification.timestamp,
+                volume_ratio=_decimal(np.nan_to_num(vol_ratio[i])),
+                volume_confirmation=bool(vol_ratio[i] >= VOLUME_CONFIRMATION_RATIO),
+                premarket_volume_surge=bool(vol_ratio[i] >= 3.0),
+                technical_breakout=False,
+                trend_alignment=False,
+                support_resistance_break=False,
+                news_catalyst_present=False,
+                catalyst_quality_score=Decimal("0"),
+                market_alignment=False,
+                sector_momentum=False,
+                overall_strength=GAP_STRENGTHS[strength_codes[i]],
+                strength_score=_decimal(strength[i]),
+            )
+            assessments.append(self._build_assessment(classification, metrics, rows[i]))
+        return assessments
+
+    def get_gap_statistics(self, lookback_days: int = 30) -> Dict[str, any]:
+        """
+        Gap type frequencies and tradeable rate from recent batch runs
+
+        Runs are aggregated per calendar day, so the window covers whole
+        days, and at most MAX_STATS_LOOKBACK_DAYS of them.
+        """
+        first = (datetime.now() - timedelta(days=lookback_days)).date()
+        counts = np.zeros(len(GAP_TYPES), dtype=np.int64)
+        total = tradeable = 0
+        confidence_sum = 0.0
+        for day, stats in self._days.items():
+            if day >= first:
+                counts += stats.type_counts
+                total += stats.total
+                tradeable += stats.tradeable
+                confidence_sum += stats.confidence_sum
+
+        return {
+            "lookback_days": lookback_days,
+            "total_candidates": total,
+            "gap_type_counts": {
+                gap_type.value: int(count) for gap_type, count in zip(GAP_TYPES, counts)
+            },
+            "tradeable_rate": tradeable / total if total else 0.0,
+            "average_confidence": confidence_sum / total if total else 0.0,
+        }
+
+    # Helpers
+
+    def _record_run(self, rows: np.ndarray) -> None:
+        """Fold a batch run into today's aggregates and drop expired days"""
+        today = datetime.now().date()
+        stats = self._days.get(today)
+        if stats is None:
+            stats = self._days[today] = _GapDay(
+                np.zeros(len(GAP_TYPES), dtype=np.int64)
+            )
+            oldest = today - timedelta(days=MAX_STATS_LOOKBACK_DAYS)
+            for day in [d for d in self._days if d < oldest]:
+                del self._days[day]
+        stats.add(rows)
+
+    @staticmethod
+    def _gap_percents(opens, prev_closes) -> np.ndarray:
+        opens = np.asarray(opens, dtype=np.float64)
+        prev_closes = np.asarray(prev_closes, dtype=np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(
+                prev_closes > 0, (opens / prev_closes - 1.0) * 100.0, np.nan
+            )
+
+    @staticmethod
+    def _volume_ratios(volumes, avg_volumes) -> np.ndarray:
+        volumes = np.asarray(volumes, dtype=np.float64)
+        avg_volumes = np.asarray(avg_volumes, dtype=np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(avg_volumes > 0, volumes / avg_volumes, np.nan)
+
+    def _build_classification(
+        self,
+        quote: MarketQuote,
+        code: int,
+        confidence: float,
+        price: float,
+        prev_close: float,
+        historical_context: Optional[Dict[str, any]] = None,
+    ) -> GapClassification:
+        gap_type = GAP_TYPES[code]
+        if gap_type == GapType.UNKNOWN:
+            gap_amount = gap_pct = 0.0
+        else:
+            gap_amount = price - prev_close
+            gap_pct = gap_amount * 100.0 / prev_close
+        continuation = CONTINUATION_RATES[code]
+        size_category = ("small", "medium", "large", "extreme")[
+            int(np.searchsorted(GAP_BIN_EDGES, abs(gap_pct), side="right"))
+        ]
+
+        warning_flags = []
+        if gap_type == GapType.UNKNOWN:
+            warning_flags.append("missing_reference_data")
+        elif gap_type == GapType.EXHAUSTION:
+            warning_flags.append("possible_exhaustion")
+        if historical_context and historical_context.get("trend_direction"):
+            trend_up = historical_context["trend_direction"] == "up"
+            if trend_up != (gap_pct > 0):
+                warning_flags.append("gap_against_trend")
+
+        return GapClassification(
+            asset=quote.asset,
+            timestamp=datetime.now(),
+            gap_type=gap_type,
+            confidence_score=_decimal(confidence),
+            gap_percent=_decimal(gap_pct),
+            gap_amount=_decimal(gap_amount),
+            size_category=size_category,
+            expected_fill_probability=_decimal(
+                1.0 - continuation if code != UNKNOWN else 0.0
+            ),
+            expected_continuation_probability=_decimal(continuation),
+            classification_reason=f"{abs(gap_pct):.2f}% gap",
+            warning_flags=warning_flags,
+        )
+
+    def _build_assessment(
+        self,
+        classification: GapClassification,
+        metrics: GapStrengthMetrics,
+        row: np.void,
+        risk_parameters: Optional[Dict[str, any]] = None,
+    ) -> GapTradabilityAssessment:
+        risk_parameters = risk_parameters or {}
+        strategy = STRATEGIES[row["strategy"]]
+        gap_up = classification.gap_percent >= 0
+        # Reversals trade against the gap direction
+        long_side = gap_up != (strategy == "reversal")
+
+        position_size = POSITION_SIZE_BY_RISK[row["risk"]]
+        if "max_position_size_percent" in risk_parameters:
+            cap = Decimal(str(risk_parameters["max_position_size_percent"]))
+            position_size = min(position_size, cap)
+
+        return GapTradabilityAssessment(
+            asset=classification.asset,
+            timestamp=classification.timestamp,
+            gap_classification=classification,
+            strength_metrics=metrics,
+            is_tradeable=bool(row["tradeable"]),
+            recommended_strategy=strategy,
+            recommended_side=TradeSide.LONG if long_side else TradeSide.SHORT,
+            risk_level=RISK_LEVELS[row["risk"]],
+            optimal_entry_timing=(
+                "avoid"
+                if strategy == "avoid"
+                else "immediate" if row["risk"] == 0 else "1hour_rule"
+            ),
+            suggested_hold_time=(
+                "swing"
+                if classification.gap_type == GapType.CONTINUATION
+                else "intraday"
+            ),
+            suggested_position_size_percent=position_size,
+            stop_loss_percent=Decimal(
+                str(risk_parameters.get("stop_loss_percent", "2.0"))
+            ),
+            take_profit_percent=Decimal(
+                str(risk_parameters.get("take_profit_percent", "3.0"))
+            ),
+            trading_rationale=(
+                f"{classification.gap_type.value} gap, "
+                f"quality {float(row['quality']):.2f}"
+            ),
+            primary_risks=list(classification.warning_flags),
+        )
@@ -0,0 +1,178 @@
+"""
+TradeScout Gap Scanner
+
+MarketScanner over an in-memory quote universe. Quotes are loaded once into
+parallel float64 arrays so gap and volume scans are single vectorized passes
+with boolean masks, returning record arrays of the hits rather than
+MarketQuote objects (``quotes_at`` fetches those on demand). News is
+flattened into (symbol, item) rows once, so catalyst scans are an age mask.
+"""
+
+from datetime import datetime, timedelta
+from typing import Iterable, List, Sequence
+
+import numpy as np
+
+from ..data_models.domain_models_analysis import MarketEvent, NewsCatalystBatch
+from ..data_models.domain_models_core import MarketQuote, NewsItem
+from .interfaces import MarketScanner
+
+
+NS_PER_HOUR = 3_600_000_000_000
+
+# Record layouts returned by the gap and volume scans; "row" indexes the
+# scanned universe (see GapScanner.quotes_at)
+GAP_SCAN_DTYPE = np.dtype(
+    [
+        ("row", np.int64),
+        ("symbol", "U16"),
+        ("gap_pct", np.float64),
+        ("prev_close", np.float64),
+        ("premarket", np.float64),
+    ]
+)
+VOLUME_SCAN_DTYPE = np.dtype(
+    [
+        ("row", np.int64),
+        ("symbol", "U16"),
+        ("volume_ratio", np.float64),
+        ("volume", np.float64),
+        ("avg_volume", np.float64),
+    ]
+)
+
+
+def _float_or_nan(value) -> float:
+    return float(value) if value else np.nan
+
+
+def _sentiment(item: NewsItem) -> float:
+    if item.sentiment_score is None:
+        return np.nan
+    return float(item.sentiment_score)
+
+
+def _to_ns(moment: datetime) -> int:
+    return round(moment.timestamp() * 1e6) * 1000
+
+
+class GapScanner(MarketScanner):
+    """Scan a quote universe for gaps, volume spikes, news and earnings"""
+
+    def __init__(
+        self,
+        quotes: Iterable[MarketQuote] = (),
+        news: Iterable[NewsItem] = (),
+        events: Iterable[MarketEvent] = (),
+    ):
+        self.news: List[NewsItem] = list(news)
+        self.events: List[MarketEvent] = list(events)
+        self.load_quotes(quotes)
+
+    def load_news(self, news: Iterable[NewsItem]) -> None:
+        """Replace the news feed and re-index it against the universe"""
+        self.news = list(news)
+        self._index_news()
+
+    def load_quotes(self, quotes: Iterable[MarketQuote]) -> None:
+        """Replace the scanned universe, converting prices to float64 once"""
+        self._quotes: List[MarketQuote] = list(quotes)
+        n = len(self._quotes)
+        self.symbols = np.array([q.asset.symbol for q in self._quotes], dtype=object)
+        self.last = np.fromiter(
+            (float(q.price_data.price) for q in self._quotes), np.float64, n
+        )
+        self.prev_close = np.fromiter(
+            (_float_or_nan(q.previous_close) for q in self._quotes), np.float64, n
+        )
+        self.vol = np.fromiter(
+            (q.price_data.volume for q in self._quotes), np.float64, n
+        )
+        self.avg_vol = np.fromiter(
+            (_float_or_nan(q.average_volume) for q in self._quotes), np.float64, n
+        )
+        self._index_news()
+
+    def _index_news(self) -> None:
+        """Flatten news into one row per scanned symbol each item mentions"""
+        symbol_for = {q.asset.qualified_symbol: q.asset.symbol for q in self._quotes}
+        rows = [
+            (symbol_for[asset.qualified_symbol], item)
+            for item in self.news
+            for asset in item.related_assets
+            if asset.qualified_symbol in symbol_for
+        ]
+        if not rows:
+            self.news_rows = NewsCatalystBatch.empty()
+            return
+        n = len(rows)
+        self.news_rows = NewsCatalystBatch(
+            symbols=np.array([symbol for symbol, _ in rows], dtype=object),
+            ts_ns=np.fromiter(
+                (_to_ns(item.timestamp) for _, item in rows), np.int64, n
+            ),
+            sentiment=np.fromiter(
+                (_sentiment(item) for _, item in rows), np.float32, n
+            ),
+            news_refs=np.empty(n, dtype=object),
+        )
+        self.news_rows.news_refs[:] = [item for _, item in rows]
+
+    def __len__(self) -> int:
+        return len(self._quotes)
+
+    def gap_percents(self) -> np.ndarray:
+        """Percent change from previous close, NaN without a reference"""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return (self.last / self.prev_close - 1.0) * 100.0
+
+    def volume_ratios(self) -> np.ndarray:
+        """Volume relative to average, NaN without an average"""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return self.vol / self.avg_vol
+
+    def quotes_at(self, rows: Sequence[int]) -> List[MarketQuote]:
+        """MarketQuote objects for universe rows, e.g. a scan's "row" field"""
+        return [self._quotes[i] for i in rows]
+
+    def scan_pre_market_gaps(self, min_gap_percent: float = 1.0) -> np.recarray:
+        """Rows gapping up or down by at least min_gap_percent"""
+        gap_pct = self.gap_percents()
+        hits = np.flatnonzero(np.abs(gap_pct) >= float(min_gap_percent))
+        out = np.empty(len(hits), dtype=GAP_SCAN_DTYPE)
+        out["row"] = hits
+        out["symbol"] = self.symbols[hits]
+        out["gap_pct"] = gap_pct[hits]
+        out["prev_close"] = self.prev_close[hits]
+        out["premarket"] = self.last[hits]
+        return out.view(np.recarray)
+
+    def scan_volume_spikes(self, min_volume_ratio: float = 2.0) -> np.recarray:
+        """Rows trading at least min_volume_ratio times average volume"""
+        ratios = self.volume_ratios()
+        hits = np.flatnonzero(ratios >= float(min_volume_ratio))
+        out = np.empty(len(hits), dtype=VOLUME_SCAN_DTYPE)
+        out["row"] = hits
+        out["symbol"] = self.symbols[hits]
+        out["volume_ratio"] = ratios[hits]
+        out["volume"] = self.vol[hits]
+        out["avg_volume"] = self.avg_vol[hits]
+        return out.view(np.recarray)
+
+    def scan_news_catalysts(self, max_age_hours: int = 24) -> NewsCatalystBatch:
+        """News rows for scanned symbols published within max_age_hours"""
+        cutoff_ns = _to_ns(datetime.now()) - max_age_hours * NS_PER_HOUR
+        return self.news_rows.since(cutoff_ns)
+
+    def scan_earnings_plays(self, days_ahead: int = 1) -> List[MarketEvent]:
+        """Earnings events scheduled within the next days_ahead days"""
+        now = datetime.now()
+        horizon = now + timedelta(days=days_ahead)
+        plays = [
+            event
+            for event in self.events
+            if event.event_type == "earnings"
+            and now <= (event.scheduled_time or event.timestamp) <= horizon
+        ]
+        plays.sort(key=lambda event: event.scheduled_time or event.timestamp)
+        return plays
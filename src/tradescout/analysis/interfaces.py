@@ -8,18 +8,27 @@ and performance tracking.
 
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 from decimal import Decimal
 
+import numpy as np
+
 from ..data_models.domain_models_core import (
     Asset,
     MarketQuote,
+    PriceSeries,
+    QuoteArray,
     ExtendedHoursData,
-    NewsItem,
-    SocialSentiment,
 )
 from ..data_models.domain_models_analysis import (
     TechnicalIndicators,
+    TechnicalIndicatorsBatch,
+    GapMomentumResult,
+    VolumeMomentumResult,
+    NewsMomentumResult,
+    NewsFeatures,
+    NewsCatalystBatch,
+    SuggestionInput,
     TradeSuggestion,
     ActualTrade,
     PerformanceMetrics,
@@ -33,13 +42,22 @@ from ..data_models.domain_models_analysis import (
 )
 
 
+# Price history accepted by TechnicalAnalyzer; QuoteArray is the fast path and
+# a raw ndarray is read as (T, 5) open/high/low/close/volume columns
+QuoteInput = Union[QuoteArray, PriceSeries, np.ndarray, List[MarketQuote]]
+
+
 class MomentumDetector(ABC):
-    """Abstract interface for detecting momentum opportunities"""
+    """Abstract interface for detecting momentum opportunities
+
+    Analysis methods return small frozen result objects with float fields
+    rather than dicts, so scoring reads attributes instead of string keys.
+    """
 
     @abstractmethod
     def analyze_gap_momentum(
         self, quote: MarketQuote, extended_data: ExtendedHoursData
-    ) -> Dict[str, any]:
+    ) -> GapMomentumResult:
         """
         Analyze gap momentum based on price action
 
@@ -48,14 +66,14 @@ class MomentumDetector(ABC):
             extended_data: Pre-market or after-hours data
 
         Returns:
-            Dictionary with momentum analysis results
+            Gap momentum result
         """
         pass
 
     @abstractmethod
     def analyze_volume_momentum(
         self, quote: MarketQuote, historical_volume: List[int]
-    ) -> Dict[str, any]:
+    ) -> VolumeMomentumResult:
         """
         Analyze volume-based momentum
 
@@ -64,37 +82,60 @@ class MomentumDetector(ABC):
             historical_volume: Historical volume data for comparison
 
         Returns:
-            Dictionary with volume momentum analysis
+            Volume momentum result
         """
         pass
 
     @abstractmethod
     def analyze_news_momentum(
-        self, symbol: str, news: List[NewsItem], sentiment: Optional[SocialSentiment]
-    ) -> Dict[str, any]:
+        self, symbol: str, features: NewsFeatures
+    ) -> NewsMomentumResult:
         """
         Analyze momentum from news and sentiment
 
         Args:
             symbol: Stock symbol
-            news: Recent news items
-            sentiment: Social sentiment data
+            features: News and social sentiment aggregated at ingestion
+                (see NewsFeatures.from_news)
+
+        Returns:
+            News/sentiment momentum result
+        """
+        pass
+
+    @abstractmethod
+    def analyze_news_momentum_batch(self, features: np.ndarray) -> np.ndarray:
+        """
+        News momentum strength for many symbols at once
+
+        Args:
+            features: NEWS_FEATURES_DTYPE structured array, one row per
+                symbol (see NewsFeatures.to_array)
 
         Returns:
-            Dictionary with news/sentiment momentum analysis
+            float64 strengths (0.0 to 1.0), matching analyze_news_momentum
         """
         pass
 
     @abstractmethod
     def calculate_momentum_score(
-        self, symbol: str, analysis_data: Dict[str, any]
-    ) -> Decimal:
+        self,
+        symbol: str,
+        gap: GapMomentumResult,
+        volume: VolumeMomentumResult,
+        news: Optional[NewsMomentumResult] = None,
+    ) -> float:
         """
         Calculate overall momentum score
 
+        Scores stay float64 so ranking and thresholds run as native float
+        math; quantize with ``float_to_decimal`` only when persisting.
+
         Args:
             symbol: Stock symbol
-            analysis_data: Combined analysis data
+            gap: Result of analyze_gap_momentum()
+            volume: Result of analyze_volume_momentum()
+            news: Result of analyze_news_momentum(), if available
 
         Returns:
             Momentum score (0.0 to 1.0)
@@ -103,15 +144,23 @@ class MomentumDetector(ABC):
 
 
 class TechnicalAnalyzer(ABC):
-    """Abstract interface for technical analysis"""
+    """Abstract interface for technical analysis
+
+    Methods take price history as a QuoteArray (float64 OHLCV columns), a
+    PriceSeries, a raw (T, 5) OHLCV ndarray or, for compatibility, a list of
+    MarketQuote. Implementations normalize with ``QuoteArray.coerce(quotes)``
+    and may then assume C-contiguous float64 columns, ready for vectorized or
+    JIT-compiled math; Decimal is only used for the values handed back to
+    callers.
+    """
 
     @abstractmethod
-    def analyze_trend(self, quotes: List[MarketQuote]) -> Dict[str, any]:
+    def analyze_trend(self, quotes: QuoteInput) -> Dict[str, any]:
         """
         Analyze price trend
 
         Args:
-            quotes: Historical price quotes
+            quotes: Historical price columns, oldest first
 
         Returns:
             Trend analysis results
@@ -119,12 +168,12 @@ class TechnicalAnalyzer(ABC):
         pass
 
     @abstractmethod
-    def detect_breakout_patterns(self, quotes: List[MarketQuote]) -> List[str]:
+    def detect_breakout_patterns(self, quotes: QuoteInput) -> List[str]:
         """
         Detect breakout patterns
 
         Args:
-            quotes: Historical price quotes
+            quotes: Historical price columns, oldest first
 
         Returns:
             List of detected patterns
@@ -133,13 +182,13 @@ class TechnicalAnalyzer(ABC):
 
     @abstractmethod
     def calculate_support_resistance(
-        self, quotes: List[MarketQuote]
+        self, quotes: QuoteInput
     ) -> Tuple[Decimal, Decimal]:
         """
         Calculate key support and resistance levels
 
         Args:
-            quotes: Historical price quotes
+            quotes: Historical price columns, oldest first
 
         Returns:
             Tuple of (support_level, resistance_level)
@@ -147,21 +196,43 @@ class TechnicalAnalyzer(ABC):
         pass
 
     @abstractmethod
-    def analyze_indicators(self, quotes: List[MarketQuote]) -> TechnicalIndicators:
+    def analyze_indicators(self, quotes: QuoteInput) -> TechnicalIndicators:
         """
         Calculate technical indicators
 
         Args:
-            quotes: Historical price quotes
+            quotes: Historical price columns, oldest first
 
         Returns:
             Technical indicators object
         """
         pass
 
+    @abstractmethod
+    def analyze_indicators_bulk(
+        self,
+        closes: np.ndarray,
+        highs: np.ndarray,
+        lows: np.ndarray,
+        volumes: np.ndarray,
+    ) -> TechnicalIndicatorsBatch:
+        """
+        Indicator series for many symbols at once
+
+        Inputs are (n_symbols, n_bars) float64 matrices, e.g. slices of
+        ``stack_quote_arrays``; shorter histories are NaN-padded at the front.
+        Implementations should run one vectorized or JIT-compiled pass over
+        the matrices (parallel over the symbol axis) rather than looping
+        ``analyze_indicators`` per symbol.
+
+        Returns:
+            Full indicator series, same shape as the inputs
+        """
+        pass
+
     @abstractmethod
     def is_favorable_setup(
-        self, indicators: TechnicalIndicators, momentum_score: Decimal
+        self, indicators: TechnicalIndicators, momentum_score: float
     ) -> bool:
         """
         Determine if technical setup is favorable for trade
@@ -177,15 +248,25 @@ class TechnicalAnalyzer(ABC):
 
 
 class RiskCalculator(ABC):
-    """Abstract interface for risk/reward calculations"""
+    """Abstract interface for risk/reward calculations
+
+    Prices and ratios are float64: implementations should keep the math in
+    floats (or float64 arrays) and never convert to Decimal inside loops.
+    Money fields are quantized to Decimal only at the persistence boundary.
+
+    The ``*_bulk`` methods size and place stops for many candidates at once.
+    Their array arguments broadcast against each other under the usual numpy
+    rules, so a scalar applies to every candidate; the scalar methods give
+    the same results as a one-element bulk call.
+    """
 
     @abstractmethod
     def calculate_position_size(
         self,
-        account_balance: Decimal,
-        risk_per_trade: Decimal,
-        entry_price: Decimal,
-        stop_loss: Decimal,
+        account_balance: float,
+        risk_per_trade: float,
+        entry_price: float,
+        stop_loss: float,
     ) -> int:
         """
         Calculate appropriate position size
@@ -204,11 +285,11 @@ class RiskCalculator(ABC):
     @abstractmethod
     def calculate_stop_loss(
         self,
-        entry_price: Decimal,
+        entry_price: float,
         side: TradeSide,
-        volatility: Decimal,
-        support_resistance: Tuple[Decimal, Decimal],
-    ) -> Decimal:
+        volatility: float,
+        support_resistance: Tuple[float, float],
+    ) -> float:
         """
         Calculate optimal stop loss level
 
@@ -226,11 +307,11 @@ class RiskCalculator(ABC):
     @abstractmethod
     def calculate_take_profit_levels(
         self,
-        entry_price: Decimal,
-        stop_loss: Decimal,
+        entry_price: float,
+        stop_loss: float,
         side: TradeSide,
-        target_ratio: Decimal = Decimal(1.5),
-    ) -> Tuple[Decimal, Decimal]:
+        target_ratio: float = 1.5,
+    ) -> Tuple[float, float]:
         """
         Calculate take profit levels
 
@@ -245,13 +326,81 @@ class RiskCalculator(ABC):
         """
         pass
 
+    @abstractmethod
+    def calculate_position_size_bulk(
+        self,
+        account_balance: float,
+        risk_per_trade: float,
+        entry: np.ndarray,
+        stop: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Calculate position sizes for many candidates
+
+        Args:
+            account_balance: Current account balance
+            risk_per_trade: Risk percentage (e.g., 0.02 for 2%)
+            entry: Planned entry prices
+            stop: Stop loss prices
+
+        Returns:
+            int64 share counts, 0 where entry and stop coincide
+        """
+        pass
+
+    @abstractmethod
+    def calculate_stop_loss_bulk(
+        self,
+        entry: np.ndarray,
+        is_long: np.ndarray,
+        volatility: np.ndarray,
+        support: np.ndarray,
+        resistance: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Calculate stop loss levels for many candidates
+
+        Args:
+            entry: Entry prices
+            is_long: True for LONG candidates, False for SHORT
+            volatility: Current volatility measure (NaN if unknown)
+            support: Support levels
+            resistance: Resistance levels
+
+        Returns:
+            float64 stop loss prices
+        """
+        pass
+
+    @abstractmethod
+    def calculate_take_profit_levels_bulk(
+        self,
+        entry: np.ndarray,
+        stop: np.ndarray,
+        target_ratio: float = 1.5,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calculate take profit levels for many candidates
+
+        The side follows from which side of the entry the stop is on.
+
+        Args:
+            entry: Entry prices
+            stop: Stop loss prices
+            target_ratio: Risk/reward ratio target
+
+        Returns:
+            Tuple of float64 (take_profit_1, take_profit_2) arrays
+        """
+        pass
+
     @abstractmethod
     def validate_risk_reward(
         self,
-        entry: Decimal,
-        stop: Decimal,
-        take_profit: Decimal,
-        min_ratio: Decimal = Decimal(1.0),
+        entry: float,
+        stop: float,
+        take_profit: float,
+        min_ratio: float = 1.0,
     ) -> bool:
         """
         Validate risk/reward ratio meets minimum requirements
@@ -273,14 +422,16 @@ class SuggestionEngine(ABC):
 
     @abstractmethod
     def generate_suggestion(
-        self, symbol: str, analysis_data: Dict[str, any]
+        self, symbol: str, analysis: Union[SuggestionInput, Dict[str, any]]
     ) -> Optional[TradeSuggestion]:
         """
         Generate a trade suggestion based on analysis
 
         Args:
             symbol: Stock symbol
-            analysis_data: Combined analysis results
+            analysis: Combined analysis results; numeric inputs live in its
+                MomentumFeatures. A plain dict is accepted for backward
+                compatibility (see SuggestionInput.from_dict)
 
         Returns:
             Trade suggestion or None if no valid setup
@@ -400,7 +551,13 @@ class PerformanceTracker(ABC):
 
 
 class MarketSessionManager(ABC):
-    """Abstract interface for managing market sessions and timing"""
+    """Abstract interface for managing market sessions and timing
+
+    get_current_session and is_market_open are called per symbol inside
+    scan loops. Implementations may memoize them on the current epoch second
+    (see analysis.market_session); the cached computation must then depend
+    only on that second, not on mutable state.
+    """
 
     @abstractmethod
     def get_current_session(self) -> str:
@@ -486,9 +643,7 @@ class MarketScanner(ABC):
     """Abstract interface for scanning the market for opportunities"""
 
     @abstractmethod
-    def scan_pre_market_gaps(
-        self, min_gap_percent: Decimal = Decimal(1.0)
-    ) -> List[MarketQuote]:
+    def scan_pre_market_gaps(self, min_gap_percent: float = 1.0) -> np.recarray:
         """
         Scan for pre-market gaps
 
@@ -496,14 +651,13 @@ class MarketScanner(ABC):
             min_gap_percent: Minimum gap percentage to include
 
         Returns:
-            List of stocks with significant gaps
+            One record per gapping stock with symbol, gap_pct, prev_close and
+            premarket price fields, so callers can rank and filter as arrays
         """
         pass
 
     @abstractmethod
-    def scan_volume_spikes(
-        self, min_volume_ratio: Decimal = Decimal(2.0)
-    ) -> List[MarketQuote]:
+    def scan_volume_spikes(self, min_volume_ratio: float = 2.0) -> np.recarray:
         """
         Scan for unusual volume activity
 
@@ -511,14 +665,13 @@ class MarketScanner(ABC):
             min_volume_ratio: Minimum volume ratio vs average
 
         Returns:
-            List of stocks with volume spikes
+            One record per stock with a spike, with symbol, volume_ratio,
+            volume and avg_volume fields
         """
         pass
 
     @abstractmethod
-    def scan_news_catalysts(
-        self, max_age_hours: int = 24
-    ) -> List[Tuple[str, List[NewsItem]]]:
+    def scan_news_catalysts(self, max_age_hours: int = 24) -> NewsCatalystBatch:
         """
         Scan for stocks with recent news catalysts
 
@@ -526,7 +679,7 @@ class MarketScanner(ABC):
             max_age_hours: Maximum age of news to consider
 
         Returns:
-            List of (symbol, news_items) tuples
+            Flat (symbol, news item) rows; ``group_by_symbol()`` regroups them
         """
         pass
 
@@ -582,11 +735,32 @@ class AnalysisOrchestrator(ABC):
         """
         pass
 
+    @abstractmethod
+    def analyze_batch(
+        self, quotes_by_symbol: Dict[str, QuoteArray]
+    ) -> Dict[str, Optional[TradeSuggestion]]:
+        """
+        Analyze many symbols' histories in one pass
+
+        Implementations can stack the histories into (n_symbols, n_bars)
+        arrays and compute indicators across all symbols at once.
+
+        Args:
+            quotes_by_symbol: Recent bars per symbol, oldest first
+
+        Returns:
+            Trade suggestion (or None) for every input symbol
+        """
+        pass
+
     @abstractmethod
     def analyze_symbol(self, symbol: str) -> Optional[TradeSuggestion]:
         """
         Perform comprehensive analysis on a single symbol
 
+        Implementations typically fetch the symbol's history and delegate to
+        ``analyze_batch``.
+
         Args:
             symbol: Stock symbol to analyze
 
@@ -0,0 +1,89 @@
+"""
+TradeScout Market Session Management
+
+Concrete MarketSessionManager for a single Market. Session lookups are
+memoized per wall-clock second, so a scan that asks "is the market open?"
+once per symbol resolves the timezone and session bounds once per second
+rather than once per call.
+"""
+
+import time
+from datetime import datetime, timedelta
+from datetime import time as dt_time
+from functools import lru_cache
+from typing import Callable, Optional
+from zoneinfo import ZoneInfo
+
+from ..data_models.domain_models_core import Market, MarketStatus
+from . import interfaces
+
+# Sessions in which each analysis type is due
+ANALYSIS_SESSIONS = {
+    "morning": frozenset({MarketStatus.PRE_MARKET}),
+    "realtime": frozenset({MarketStatus.OPEN}),
+    "evening": frozenset({MarketStatus.AFTER_HOURS, MarketStatus.CLOSED}),
+}
+
+
+class MarketSessionManager(interfaces.MarketSessionManager):
+    """Session timing for one market, cached at one-second resolution"""
+
+    def __init__(self, market: Market, clock: Callable[[], float] = time.time):
+        """
+        Args:
+            market: Market whose hours and trading days apply; treated as
+                read-only, since cached sessions are not invalidated
+            clock: Source of epoch seconds, replaceable in tests
+        """
+        self.market = market
+        self.clock = clock
+        self._tz = ZoneInfo(market.timezone)
+        # Per instance, so the cache never outlives or mixes up markets
+        self._session_at = lru_cache(maxsize=4)(self._compute_session)
+
+    def _compute_session(self, epoch_second: int) -> MarketStatus:
+        return self.market.session_at(datetime.fromtimestamp(epoch_second, self._tz))
+
+    def current_status(self) -> MarketStatus:
+        """Current session as a MarketStatus, memoized for the current second"""
+        return self._session_at(int(self.clock()))
+
+    def get_current_session(self) -> str:
+        """Current session label, e.g. pre_market"""
+        return self.current_status().label
+
+    def is_market_open(self) -> bool:
+        """True during the regular session"""
+        return self.current_status() == MarketStatus.OPEN
+
+    def time_until_market_open(self) -> timedelta:
+        """Time until the next regular-session open"""
+        return self._time_until(self.market.regular_open)
+
+    def time_until_market_close(self) -> timedelta:
+        """Time until the next regular-session close"""
+        return self._time_until(self.market.regular_close)
+
+    def should_run_analysis(self, analysis_type: str) -> bool:
+        """Whether the current session is one in which analysis_type runs"""
+        sessions = ANALYSIS_SESSIONS.get(analysis_type)
+        if sessions is None:
+            raise ValueError(f"Unknown analysis type: {analysis_type}")
+        return self.current_status() in sessions
+
+    def _time_until(self, at: dt_time) -> timedelta:
+        now = datetime.fromtimestamp(self.clock(), self._tz)
+        moment = self._next_trading_time(now, at)
+        if moment is None:
+            return timedelta(0)
+        # Same-tzinfo subtraction is wall-clock; timestamps handle DST shifts
+        return timedelta(seconds=moment.timestamp() - now.timestamp())
+
+    def _next_trading_time(self, now: datetime, at: dt_time) -> Optional[datetime]:
+        """First trading-day occurrence of wall-clock time ``at`` after now"""
+        for days in range(8):
+            day = (now + timedelta(days=days)).date()
+            moment = datetime.combine(day, at, tzinfo=self._tz)
+            if moment > now and self.market.is_trading_day(moment):
+                return moment
+        return None
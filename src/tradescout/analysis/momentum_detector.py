@@ -0,0 +1,238 @@
+"""
+TradeScout Momentum Detection
+
+Concrete MomentumDetector producing typed gap, volume and news results and
+combining them into a single momentum score. The score is computed from a
+MomentumFeatures record of floats, unpacked into the compiled scorer's
+float64 arguments. Strategies with their own component weights get a scorer
+generated with those weights as constants.
+"""
+
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from ..data_models._kernels import njit
+from ..data_models.domain_models_analysis import (
+    GapMomentumResult,
+    MomentumFeatures,
+    NewsFeatures,
+    NewsMomentumResult,
+    TechnicalIndicators,
+    VolumeMomentumResult,
+)
+from ..data_models.domain_models_core import ExtendedHoursData, MarketQuote
+from . import interfaces
+
+# Gap size (percent) and volume ratio at which strength saturates at 1.0
+FULL_STRENGTH_GAP_PERCENT = 5.0
+FULL_STRENGTH_VOLUME_RATIO = 3.0
+# News items needed for full news strength and confidence
+FULL_STRENGTH_NEWS_COUNT = 5
+FULL_CONFIDENCE_NEWS_COUNT = 3
+# Bars of volume history needed for full volume confidence
+FULL_CONFIDENCE_VOLUME_BARS = 20
+
+GAP_WEIGHT = 0.40
+VOLUME_WEIGHT = 0.35
+NEWS_WEIGHT = 0.25
+# Adjustments when technicals are supplied
+MACD_CONFIRMATION = 0.05
+RSI_STRETCHED_PENALTY = 0.10
+
+DEFAULT_WEIGHTS = {
+    "gap": GAP_WEIGHT,
+    "volume": VOLUME_WEIGHT,
+    "news": NEWS_WEIGHT,
+    "macd": MACD_CONFIRMATION,
+    "rsi_penalty": RSI_STRETCHED_PENALTY,
+}
+
+_SCORER_SIGNATURE = "float64(float64, float64, float64, float64, float64, float64)"
+
+# Same body as _momentum_score, with each weight formatted in as a literal
+_SCORER_TEMPLATE = """
+def scorer(gap_pct, vol_ratio, rsi, macd, macd_sig, news_score):
+    gap_up = gap_pct >= 0.0
+    score = (
+        {gap!r} * min(abs(gap_pct) / {full_gap!r}, 1.0)
+        + {volume!r} * min(vol_ratio / {full_volume!r}, 1.0)
+        + {news!r} * news_score
+    )
+    if not (np.isnan(macd) or np.isnan(macd_sig)):
+        if (macd > macd_sig) == gap_up:
+            score += {macd!r}
+        else:
+            score -= {macd!r}
+    if not np.isnan(rsi) and ((gap_up and rsi > 80.0) or (not gap_up and rsi < 20.0)):
+        score -= {rsi_penalty!r}
+    return min(max(score, 0.0), 1.0)
+"""
+
+
+# Explicit signature: compiled eagerly at import (and cached) under numba
+# rather than on the first scored symbol. No fastmath: it would let LLVM
+# drop the NaN checks for missing technicals.
+@njit(_SCORER_SIGNATURE, cache=True)
+def _momentum_score(gap_pct, vol_ratio, rsi, macd, macd_sig, news_score):
+    """Weighted momentum score in [0, 1]; NaN technicals are ignored"""
+    gap_up = gap_pct >= 0.0
+    score = (
+        GAP_WEIGHT * min(abs(gap_pct) / FULL_STRENGTH_GAP_PERCENT, 1.0)
+        + VOLUME_WEIGHT * min(vol_ratio / FULL_STRENGTH_VOLUME_RATIO, 1.0)
+        + NEWS_WEIGHT * news_score
+    )
+    if not (np.isnan(macd) or np.isnan(macd_sig)):
+        if (macd > macd_sig) == gap_up:
+            score += MACD_CONFIRMATION
+        else:
+            score -= MACD_CONFIRMATION
+    if not np.isnan(rsi) and ((gap_up and rsi > 80.0) or (not gap_up and rsi < 20.0)):
+        score -= RSI_STRETCHED_PENALTY
+    return min(max(score, 0.0), 1.0)
+
+
+def _news_strength(headline_count, avg_sentiment):
+    """Coverage times absolute sentiment; scalars or arrays"""
+    coverage = np.minimum(headline_count / FULL_STRENGTH_NEWS_COUNT, 1.0)
+    return coverage * np.abs(avg_sentiment)
+
+
+def _float_or_nan(value) -> float:
+    return np.nan if value is None else float(value)
+
+
+def compile_scorer(weights: Dict[str, float]) -> Callable[..., float]:
+    """
+    Build a momentum scorer with the given weights baked in as constants
+
+    Missing keys fall back to DEFAULT_WEIGHTS. The scorer takes the same
+    arguments as ``_momentum_score``, which is returned for the default
+    weights; under numba others are compiled once per distinct set.
+    """
+    unknown = set(weights) - set(DEFAULT_WEIGHTS)
+    if unknown:
+        raise ValueError(f"Unknown momentum weights: {sorted(unknown)}")
+    merged = {**DEFAULT_WEIGHTS, **weights}
+    values = tuple(float(merged[k]) for k in DEFAULT_WEIGHTS)
+    if values == tuple(DEFAULT_WEIGHTS.values()):
+        return _momentum_score
+    return _compile_scorer(values)
+
+
+@lru_cache(maxsize=None)
+def _compile_scorer(values) -> Callable[..., float]:
+    source = _SCORER_TEMPLATE.format(
+        full_gap=FULL_STRENGTH_GAP_PERCENT,
+        full_volume=FULL_STRENGTH_VOLUME_RATIO,
+        **dict(zip(DEFAULT_WEIGHTS, values)),
+    )
+    namespace = {"np": np}
+    exec(source, namespace)
+    # Generated code has no source file, so numba's on-disk cache is not used
+    return njit(_SCORER_SIGNATURE)(namespace["scorer"])
+
+
+class MomentumDetector(interfaces.MomentumDetector):
+    """Gap, volume and news momentum with a weighted composite score"""
+
+    def __init__(self, weights: Optional[Dict[str, float]] = None):
+        """
+        Args:
+            weights: Per-strategy overrides of DEFAULT_WEIGHTS; swapping
+                strategies swaps the compiled scorer
+        """
+        self.weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+        self._score = compile_scorer(weights) if weights else _momentum_score
+
+    def analyze_gap_momentum(
+        self, quote: MarketQuote, extended_data: ExtendedHoursData
+    ) -> GapMomentumResult:
+        """Strength grows with gap size; volume confirmation adds confidence"""
+        gap_pct = float(extended_data.gap_percent)
+        volume_ratio = float(quote.volume_ratio) if quote.volume_ratio else 0.0
+        return GapMomentumResult(
+            gap_pct=gap_pct,
+            strength=min(abs(gap_pct) / FULL_STRENGTH_GAP_PERCENT, 1.0),
+            direction=int(np.sign(gap_pct)),
+            confidence=0.5
+            + 0.5 * min(volume_ratio / FULL_STRENGTH_VOLUME_RATIO, 1.0),
+        )
+
+    def analyze_volume_momentum(
+        self, quote: MarketQuote, historical_volume: List[int]
+    ) -> VolumeMomentumResult:
+        """Compare current volume with the historical average"""
+        average = float(np.mean(historical_volume)) if historical_volume else 0.0
+        ratio = quote.price_data.volume / average if average > 0 else 0.0
+        return VolumeMomentumResult(
+            volume_ratio=ratio,
+            strength=min(ratio / FULL_STRENGTH_VOLUME_RATIO, 1.0),
+            is_surge=ratio > MarketQuote.VOLUME_SURGE_RATIO,
+            confidence=min(len(historical_volume) / FULL_CONFIDENCE_VOLUME_BARS, 1.0),
+        )
+
+    def analyze_news_momentum(
+        self, symbol: str, features: NewsFeatures
+    ) -> NewsMomentumResult:
+        """Average sentiment scaled by headline coverage"""
+        return NewsMomentumResult(
+            news_count=features.headline_count,
+            sentiment=features.avg_sentiment,
+            strength=float(
+                _news_strength(features.headline_count, features.avg_sentiment)
+            ),
+            confidence=min(features.sentiment_count / FULL_CONFIDENCE_NEWS_COUNT, 1.0),
+        )
+
+    def analyze_news_momentum_batch(self, features: np.ndarray) -> np.ndarray:
+        """Strength for every row of a NEWS_FEATURES_DTYPE array"""
+        return _news_strength(features["headline_count"], features["avg_sentiment"])
+
+    def build_features(
+        self,
+        gap: GapMomentumResult,
+        volume: VolumeMomentumResult,
+        news: Optional[NewsMomentumResult] = None,
+        indicators: Optional[TechnicalIndicators] = None,
+    ) -> MomentumFeatures:
+        """Flatten analysis results into scorer inputs; news against the gap is 0"""
+        news_score = 0.0
+        if news is not None and np.sign(news.sentiment) == gap.direction:
+            news_score = news.strength
+
+        if indicators is None:
+            return MomentumFeatures(gap.gap_pct, volume.volume_ratio, news_score)
+        return MomentumFeatures(
+            gap_pct=gap.gap_pct,
+            volume_ratio=volume.volume_ratio,
+            news_score=news_score,
+            rsi=_float_or_nan(indicators.rsi),
+            macd=_float_or_nan(indicators.macd),
+            macd_signal=_float_or_nan(indicators.macd_signal),
+            atr=_float_or_nan(indicators.atr),
+        )
+
+    def score_features(self, features: MomentumFeatures) -> float:
+        """
+        Weighted gap/volume/news strength from precomputed features
+
+        MACD agreeing with the gap direction adds a little, and an RSI
+        already stretched in the gap direction takes some away.
+        """
+        f = features
+        return self._score(
+            f.gap_pct, f.volume_ratio, f.rsi, f.macd, f.macd_signal, f.news_score
+        )
+
+    def calculate_momentum_score(
+        self,
+        symbol: str,
+        gap: GapMomentumResult,
+        volume: VolumeMomentumResult,
+        news: Optional[NewsMomentumResult] = None,
+        indicators: Optional[TechnicalIndicators] = None,
+    ) -> float:
+        """Score the features built from the analysis results"""
+        return self.score_features(self.build_features(gap, volume, news, indicators))
@@ -0,0 +1,264 @@
+"""
+TradeScout Analysis Orchestrator
+
+Coordinates scans over a symbol universe. Per-symbol indicator and momentum
+math runs in one kernel over a stacked (N, T, 5) OHLCV tensor, parallelised
+across symbols with prange when numba is installed; TradeSuggestion objects
+are only built for symbols that clear the score threshold.
+"""
+
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..data_models._kernels import njit, prange
+from ..data_models.domain_models_analysis import (
+    MomentumFeatures,
+    SuggestionInput,
+    TradeSide,
+    TradeSuggestion,
+)
+from ..data_models.domain_models_core import QuoteArray
+from . import _indicator_kernels as kernels
+from .interfaces import AnalysisOrchestrator
+from .momentum_detector import (
+    FULL_STRENGTH_GAP_PERCENT,
+    FULL_STRENGTH_VOLUME_RATIO,
+    GAP_WEIGHT,
+    MACD_CONFIRMATION,
+    RSI_STRETCHED_PENALTY,
+    VOLUME_WEIGHT,
+)
+from .suggestion_engine import SuggestionEngine
+
+# Column order of the stacked OHLCV tensor
+OPEN, HIGH, LOW, CLOSE, VOLUME = range(5)
+
+# Bit flags written by the scan kernel
+FLAG_GAP_UP = 1
+FLAG_GAP_DOWN = 2
+FLAG_VOLUME_SURGE = 4
+FLAG_TREND_UP = 8
+
+# Bars needed for the 26-period EMA plus the prior-close gap reference
+MIN_SCAN_BARS = 27
+VOLUME_LOOKBACK = 20
+
+# Scans have no news input, so scores are scaled by the share of the
+# momentum score that gap and volume can reach
+PRICE_WEIGHT = GAP_WEIGHT + VOLUME_WEIGHT
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def _scan_kernel(quote_matrix, lengths, out_scores, out_flags):
+    """Score every symbol in a right-aligned (N, T, 5) OHLCV tensor"""
+    n_symbols, n_bars = quote_matrix.shape[0], quote_matrix.shape[1]
+    for i in prange(n_symbols):
+        out_scores[i] = 0.0
+        out_flags[i] = 0
+        size = lengths[i]
+        if size < MIN_SCAN_BARS:
+            continue
+        bars = quote_matrix[i, n_bars - size :]
+        close = bars[:, CLOSE]
+        volume = bars[:, VOLUME]
+
+        gap_pct = (bars[size - 1, OPEN] / close[size - 2] - 1.0) * 100.0
+        window = min(VOLUME_LOOKBACK, size - 1)
+        avg_volume = volume[size - 1 - window : size - 1].mean()
+        vol_ratio = volume[size - 1] / avg_volume if avg_volume > 0 else 0.0
+        ema_fast = kernels.ema(close, 12)[size - 1]
+        ema_slow = kernels.ema(close, 26)[size - 1]
+        rsi = kernels.rsi(close, 14)[size - 1]
+
+        flags = 0
+        if gap_pct > 1.0:
+            flags |= FLAG_GAP_UP
+        elif gap_pct < -1.0:
+            flags |= FLAG_GAP_DOWN
+        if vol_ratio > 2.0:
+            flags |= FLAG_VOLUME_SURGE
+        if ema_fast > ema_slow:
+            flags |= FLAG_TREND_UP
+
+        # MomentumDetector's weighting, with the EMA 12/26 spread (the MACD
+        # line) standing in for MACD-vs-signal confirmation
+        gap_up = gap_pct >= 0.0
+        score = (
+            GAP_WEIGHT * min(abs(gap_pct) / FULL_STRENGTH_GAP_PERCENT, 1.0)
+            + VOLUME_WEIGHT * min(vol_ratio / FULL_STRENGTH_VOLUME_RATIO, 1.0)
+        )
+        if (ema_fast > ema_slow) == gap_up:
+            score += MACD_CONFIRMATION
+        else:
+            score -= MACD_CONFIRMATION
+        if (gap_up and rsi > 80.0) or (not gap_up and rsi < 20.0):
+            score -= RSI_STRETCHED_PENALTY
+        out_scores[i] = min(max(score / PRICE_WEIGHT, 0.0), 1.0)
+        out_flags[i] = flags
+
+
+def stack_ohlcv(
+    arrays: Sequence[QuoteArray], pad_value: float = np.nan
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Stack QuoteArrays into a right-aligned (N, T, 5) float64 tensor
+
+    Shorter histories are padded at the front with pad_value so the latest
+    bar of every symbol sits at index T - 1. Returns (tensor, lengths).
+    """
+    lengths = np.array([len(a) for a in arrays], dtype=np.int64)
+    n_bars = int(lengths.max()) if len(arrays) else 0
+    tensor = np.full((len(arrays), n_bars, 5), pad_value)
+    for i, bars in enumerate(arrays):
+        size = lengths[i]
+        if size:
+            tensor[i, n_bars - size :] = np.column_stack(
+                (bars.open, bars.high, bars.low, bars.close, bars.volume)
+            )
+    return tensor, lengths
+
+
+def stack_quote_arrays(
+    quotes_by_symbol: Dict[str, QuoteArray], pad_value: float = np.nan
+) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """
+    Stack per-symbol histories for cross-symbol array math
+
+    Returns (symbols, tensor, mask): the right-aligned (N, T, 5) tensor from
+    stack_ohlcv, so ``tensor[:, :, CLOSE]`` is an (N, T) close matrix, and a
+    boolean (N, T) mask of real (unpadded) bars.
+    """
+    symbols = list(quotes_by_symbol)
+    tensor, lengths = stack_ohlcv(
+        [quotes_by_symbol[s] for s in symbols], pad_value=pad_value
+    )
+    mask = np.arange(tensor.shape[1]) >= tensor.shape[1] - lengths[:, None]
+    return symbols, tensor, mask
+
+
+class ScanOrchestrator(AnalysisOrchestrator):
+    """Momentum scan over a watchlist using a stacked-array scan kernel"""
+
+    def __init__(
+        self,
+        history_provider: Callable[[str], Optional[QuoteArray]],
+        watchlist: Sequence[str] = (),
+        min_score: float = 0.6,
+        target_ratio: float = 1.5,
+    ):
+        """
+        Args:
+            history_provider: Returns recent bars for a symbol, oldest first
+            watchlist: Symbols covered by morning/evening analysis
+            min_score: Minimum momentum score for a suggestion
+            target_ratio: Reward/risk ratio for the first take-profit level
+        """
+        self.history_provider = history_provider
+        self.watchlist = list(watchlist)
+        self.min_score = min_score
+        self.target_ratio = target_ratio
+        self.suggestion_engine = SuggestionEngine(
+            min_score=min_score, target_ratio=target_ratio
+        )
+
+    def score_symbols(
+        self, symbols: Sequence[str]
+    ) -> Tuple[List[str], List[QuoteArray], np.ndarray, np.ndarray]:
+        """Fetch histories and run the scan kernel once over all of them"""
+        names, histories = [], []
+        for symbol in symbols:
+            bars = self.history_provider(symbol)
+            if bars is not None and len(bars):
+                names.append(symbol)
+                histories.append(bars)
+        scores, flags = self._scan(histories)
+        return names, histories, scores, flags
+
+    def run_realtime_scan(self, symbols: List[str]) -> List[TradeSuggestion]:
+        """Scan symbols and return suggestions for winners, best first"""
+        names, histories, scores, flags = self.score_symbols(symbols)
+        winners = np.flatnonzero(scores >= self.min_score)
+        winners = winners[np.argsort(-scores[winners], kind="stable")]
+        suggestions = (
+            self._build_suggestion(histories[i], names[i], scores[i], flags[i])
+            for i in winners
+        )
+        return [s for s in suggestions if s is not None]
+
+    def analyze_batch(
+        self, quotes_by_symbol: Dict[str, QuoteArray]
+    ) -> Dict[str, Optional[TradeSuggestion]]:
+        """Score all histories in one kernel call; None for non-winners"""
+        symbols = list(quotes_by_symbol)
+        results: Dict[str, Optional[TradeSuggestion]] = dict.fromkeys(symbols)
+        scored = [s for s in symbols if len(quotes_by_symbol[s])]
+        histories = [quotes_by_symbol[s] for s in scored]
+        scores, flags = self._scan(histories)
+        for i in np.flatnonzero(scores >= self.min_score):
+            results[scored[i]] = self._build_suggestion(
+                histories[i], scored[i], scores[i], flags[i]
+            )
+        return results
+
+    def analyze_symbol(self, symbol: str) -> Optional[TradeSuggestion]:
+        """Analyze a single symbol through analyze_batch"""
+        bars = self.history_provider(symbol)
+        if bars is None:
+            return None
+        return self.analyze_batch({symbol: bars})[symbol]
+
+    def run_morning_analysis(self) -> List[TradeSuggestion]:
+        """Scan the watchlist"""
+        return self.run_realtime_scan(self.watchlist)
+
+    def run_evening_analysis(self) -> Dict[str, any]:
+        """Score the watchlist without building suggestions"""
+        names, _, scores, flags = self.score_symbols(self.watchlist)
+        return {
+            "timestamp": datetime.now(),
+            "symbols_scanned": len(names),
+            "momentum_scores": dict(zip(names, scores.tolist())),
+            "volume_surges": [
+                name
+                for name, flag in zip(names, flags)
+                if flag & FLAG_VOLUME_SURGE
+            ],
+        }
+
+    @staticmethod
+    def _scan(histories: Sequence[QuoteArray]) -> Tuple[np.ndarray, np.ndarray]:
+        scores = np.zeros(len(histories))
+        flags = np.zeros(len(histories), dtype=np.int8)
+        if histories:
+            tensor, lengths = stack_ohlcv(histories)
+            _scan_kernel(tensor, lengths, scores, flags)
+        return scores, flags
+
+    def _build_suggestion(
+        self, bars: QuoteArray, symbol: str, score: float, flags: int
+    ) -> Optional[TradeSuggestion]:
+        """Stops, targets and validation are the SuggestionEngine's"""
+        gap_pct = (float(bars.open[-1]) / float(bars.close[-2]) - 1.0) * 100.0
+        atr = kernels.atr(bars.high, bars.low, bars.close, 14)[-1]
+
+        supporting = []
+        if flags & (FLAG_GAP_UP | FLAG_GAP_DOWN):
+            supporting.append(f"{gap_pct:+.2f}% gap")
+        if flags & FLAG_VOLUME_SURGE:
+            supporting.append("volume surge")
+        if flags & FLAG_TREND_UP:
+            supporting.append("EMA 12 above EMA 26")
+
+        analysis = SuggestionInput(
+            asset=bars.asset,
+            entry_price=float(bars.close[-1]),
+            momentum_score=float(score),
+            features=MomentumFeatures(gap_pct=gap_pct, volume_ratio=np.nan, atr=atr),
+            side=TradeSide.SHORT if flags & FLAG_GAP_DOWN else TradeSide.LONG,
+            volume_surge=bool(flags & FLAG_VOLUME_SURGE),
+            technical_setup=bool(flags & FLAG_TREND_UP),
+            supporting_factors=tuple(supporting),
+        )
+        return self.suggestion_engine.generate_suggestion(symbol, analysis)
@@ -0,0 +1,309 @@
+"""
+TradeScout Performance Tracking
+
+In-memory PerformanceTracker that keeps running aggregates per calendar day.
+Recording a trade or a suggestion outcome updates one day's counters in
+O(1); period metrics sum the day buckets in the window, so their cost
+depends on the number of active days, not on the number of trades.
+"""
+
+import math
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Dict, List, Optional
+
+from ..data_models.domain_models_analysis import (
+    ActualTrade,
+    PerformanceMetrics,
+    TradeStatus,
+    TradeSuggestion,
+)
+from ..data_models.domain_models_core import _SLOTS
+from . import interfaces
+
+
+@dataclass(**_SLOTS)
+class RunningStats:
+    """Count, sums and sum of squares of a stream of returns"""
+
+    n: int = 0
+    wins: int = 0
+    losses: int = 0
+    sum_return: float = 0.0
+    sum_sq: float = 0.0
+
+    def add(self, value: float) -> None:
+        self.n += 1
+        self.wins += value > 0
+        self.losses += value < 0
+        self.sum_return += value
+        self.sum_sq += value * value
+
+    def remove(self, value: float) -> None:
+        self.n -= 1
+        self.wins -= value > 0
+        self.losses -= value < 0
+        self.sum_return -= value
+        self.sum_sq -= value * value
+
+    def merge(self, other: "RunningStats") -> None:
+        self.n += other.n
+        self.wins += other.wins
+        self.losses += other.losses
+        self.sum_return += other.sum_return
+        self.sum_sq += other.sum_sq
+
+    @property
+    def mean(self) -> float:
+        return self.sum_return / self.n if self.n else 0.0
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation"""
+        if self.n < 2:
+            return 0.0
+        variance = (self.sum_sq - self.n * self.mean**2) / (self.n - 1)
+        return math.sqrt(max(variance, 0.0))
+
+
+@dataclass(**_SLOTS)
+class _TradeDay:
+    """Closed-trade aggregates for one exit date"""
+
+    returns: RunningStats
+    pnl: float = 0.0
+    gross_profit: float = 0.0
+    gross_loss: float = 0.0
+    best: float = -math.inf
+    worst: float = math.inf
+    hold_minutes: int = 0
+    held: int = 0
+
+    def add(self, trade: ActualTrade, trade_return: float) -> None:
+        pnl = float(trade.realized_pnl)
+        self.returns.add(trade_return)
+        self.pnl += pnl
+        self.gross_profit += max(pnl, 0.0)
+        self.gross_loss -= min(pnl, 0.0)
+        self.best = max(self.best, pnl)
+        self.worst = min(self.worst, pnl)
+        if trade.hold_time_minutes is not None:
+            self.hold_minutes += trade.hold_time_minutes
+            self.held += 1
+
+
+@dataclass(**_SLOTS)
+class _SuggestionDay:
+    """Suggestion counts and resolved-outcome returns for one date"""
+
+    outcomes: RunningStats
+    total: int = 0
+    followed: int = 0
+
+
+def _decimal(value: float, places: str = "0.0001") -> Decimal:
+    return Decimal(str(float(value))).quantize(Decimal(places))
+
+
+def _trade_day(trade: ActualTrade) -> date:
+    return (trade.exit_time or trade.entry_time).date()
+
+
+def _trade_return(trade: ActualTrade) -> float:
+    """Realized P&L as a percent of the entry cost basis"""
+    cost = float(trade.entry_price) * trade.shares
+    return float(trade.realized_pnl) * 100.0 / cost if cost else 0.0
+
+
+def _suggestion_outcome(suggestion: TradeSuggestion) -> Optional[float]:
+    """
+    Percent return of a suggestion once its excursions resolve it
+
+    Reaching the first target counts as a win worth the target distance;
+    otherwise reaching the stop counts as a loss of the stop distance.
+    Returns None while neither has been reached.
+    """
+    if suggestion.max_profit_reached is None or not suggestion.suggested_entry:
+        return None
+    entry = float(suggestion.suggested_entry)
+    if suggestion.max_profit_reached >= suggestion.profit_potential_1:
+        return float(suggestion.profit_potential_1) * 100.0 / entry
+    if (suggestion.max_loss_reached or 0) >= suggestion.risk_amount:
+        return -float(suggestion.risk_amount) * 100.0 / entry
+    return None
+
+
+class PerformanceTracker(interfaces.PerformanceTracker):
+    """Suggestion and trade performance from incrementally updated day buckets"""
+
+    def __init__(self):
+        self._suggestions: Dict[str, TradeSuggestion] = {}
+        self._outcomes: Dict[str, float] = {}
+        self._trades: Dict[str, ActualTrade] = {}
+        self._followed: Dict[str, str] = {}  # suggestion id -> trade id
+        self._suggestion_days: Dict[date, _SuggestionDay] = {}
+        self._trade_days: Dict[date, _TradeDay] = {}
+        self._trade_ids_by_day: Dict[date, List[str]] = {}
+
+    def track_suggestion_performance(self, suggestion: TradeSuggestion) -> None:
+        """Start tracking a suggestion; outcomes already set are counted"""
+        if suggestion.id in self._suggestions:
+            return
+        self._suggestions[suggestion.id] = suggestion
+        self._suggestion_day(suggestion).total += 1
+        self._apply_outcome(suggestion)
+
+    def record_actual_trade(self, trade: ActualTrade) -> None:
+        """Record a trade; call again with the same id when it closes"""
+        previous = self._trades.get(trade.id)
+        self._trades[trade.id] = trade
+
+        suggestion = self._suggestions.get(trade.suggestion_id)
+        if suggestion is not None and suggestion.id not in self._followed:
+            self._followed[suggestion.id] = trade.id
+            self._suggestion_day(suggestion).followed += 1
+            suggestion.status = TradeStatus.EXECUTED
+
+        if previous is not None and previous.realized_pnl is not None:
+            # Re-recording a closed trade: rebuild the affected day(s)
+            old_day = _trade_day(previous)
+            self._trade_ids_by_day[old_day].remove(trade.id)
+            self._rebuild_trade_day(old_day)
+        if trade.realized_pnl is None:
+            return
+        day = _trade_day(trade)
+        self._trade_ids_by_day.setdefault(day, []).append(trade.id)
+        if previous is not None and previous.realized_pnl is not None:
+            self._rebuild_trade_day(day)
+        else:
+            self._trade_day_stats(day).add(trade, _trade_return(trade))
+
+    def update_suggestion_outcome(
+        self, suggestion_id: str, max_profit: Decimal, max_loss: Decimal
+    ) -> None:
+        """Record per-share favorable/adverse excursions for a suggestion"""
+        suggestion = self._suggestions.get(suggestion_id)
+        if suggestion is None:
+            raise KeyError(f"Suggestion {suggestion_id} is not tracked")
+        previous = self._outcomes.pop(suggestion_id, None)
+        if previous is not None:
+            self._suggestion_day(suggestion).outcomes.remove(previous)
+        suggestion.max_profit_reached = max_profit
+        suggestion.max_loss_reached = max_loss
+        self._apply_outcome(suggestion)
+
+    def calculate_period_performance(
+        self, start_date: datetime, end_date: datetime
+    ) -> PerformanceMetrics:
+        """Combine the day buckets between start_date and end_date inclusive"""
+        first, last = start_date.date(), end_date.date()
+        suggestions = RunningStats()
+        total_suggestions = followed = 0
+        for day, stats in self._suggestion_days.items():
+            if first <= day <= last:
+                suggestions.merge(stats.outcomes)
+                total_suggestions += stats.total
+                followed += stats.followed
+
+        trades = RunningStats()
+        days = sorted(d for d in self._trade_days if first <= d <= last)
+        pnl = gross_profit = gross_loss = 0.0
+        best, worst = -math.inf, math.inf
+        hold_minutes = held = 0
+        # Drawdown on the end-of-day cumulative P&L curve
+        peak = max_drawdown = 0.0
+        for day in days:
+            stats = self._trade_days[day]
+            trades.merge(stats.returns)
+            pnl += stats.pnl
+            gross_profit += stats.gross_profit
+            gross_loss += stats.gross_loss
+            best, worst = max(best, stats.best), min(worst, stats.worst)
+            hold_minutes += stats.hold_minutes
+            held += stats.held
+            peak = max(peak, pnl)
+            max_drawdown = max(max_drawdown, peak - pnl)
+
+        return PerformanceMetrics(
+            period_start=start_date,
+            period_end=end_date,
+            total_suggestions=total_suggestions,
+            suggestions_followed=followed,
+            winning_suggestions=suggestions.wins,
+            losing_suggestions=suggestions.losses,
+            suggestion_win_rate=_decimal(
+                suggestions.wins / suggestions.n if suggestions.n else 0.0
+            ),
+            avg_suggestion_return=_decimal(suggestions.mean),
+            total_trades=trades.n,
+            winning_trades=trades.wins,
+            losing_trades=trades.losses,
+            trade_win_rate=_decimal(trades.wins / trades.n if trades.n else 0.0),
+            total_pnl=_decimal(pnl, "0.01"),
+            avg_trade_return=_decimal(trades.mean),
+            best_trade=_decimal(best if trades.n else 0.0, "0.01"),
+            worst_trade=_decimal(worst if trades.n else 0.0, "0.01"),
+            max_drawdown=_decimal(max_drawdown, "0.01"),
+            # Per-trade mean over standard deviation, not annualized
+            sharpe_ratio=(
+                _decimal(trades.mean / trades.std) if trades.std > 0 else None
+            ),
+            profit_factor=(
+                _decimal(gross_profit / gross_loss) if gross_loss > 0 else None
+            ),
+            avg_hold_time_minutes=(
+                _decimal(hold_minutes / held, "0.1") if held else None
+            ),
+        )
+
+    def get_suggestion_accuracy(self, lookback_days: int = 30) -> Dict[str, Decimal]:
+        """Win rate and average return of suggestions resolved in the window"""
+        first = (datetime.now() - timedelta(days=lookback_days)).date()
+        outcomes = RunningStats()
+        total = followed = 0
+        for day, stats in self._suggestion_days.items():
+            if day >= first:
+                outcomes.merge(stats.outcomes)
+                total += stats.total
+                followed += stats.followed
+        return {
+            "total_suggestions": Decimal(total),
+            "resolved_suggestions": Decimal(outcomes.n),
+            "win_rate": _decimal(outcomes.wins / outcomes.n if outcomes.n else 0.0),
+            "avg_return_percent": _decimal(outcomes.mean),
+            "return_std_percent": _decimal(outcomes.std),
+            "follow_rate": _decimal(followed / total if total else 0.0),
+        }
+
+    # Helpers
+
+    def _suggestion_day(self, suggestion: TradeSuggestion) -> _SuggestionDay:
+        day = suggestion.timestamp.date()
+        stats = self._suggestion_days.get(day)
+        if stats is None:
+            stats = self._suggestion_days[day] = _SuggestionDay(RunningStats())
+        return stats
+
+    def _trade_day_stats(self, day: date) -> _TradeDay:
+        stats = self._trade_days.get(day)
+        if stats is None:
+            stats = self._trade_days[day] = _TradeDay(RunningStats())
+        return stats
+
+    def _apply_outcome(self, suggestion: TradeSuggestion) -> None:
+        outcome = _suggestion_outcome(suggestion)
+        if outcome is not None:
+            self._outcomes[suggestion.id] = outcome
+            self._suggestion_day(suggestion).outcomes.add(outcome)
+
+    def _rebuild_trade_day(self, day: date) -> None:
+        trade_ids = self._trade_ids_by_day.get(day)
+        if not trade_ids:
+            self._trade_days.pop(day, None)
+            self._trade_ids_by_day.pop(day, None)
+            return
+        stats = self._trade_days[day] = _TradeDay(RunningStats())
+        for trade_id in trade_ids:
+            trade = self._trades[trade_id]
+            stats.add(trade, _trade_return(trade))
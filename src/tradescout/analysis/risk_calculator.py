@@ -0,0 +1,150 @@
+"""
+TradeScout Risk Calculation
+
+Concrete RiskCalculator with position sizing, stops and targets computed on
+float64 arrays. The scalar interface methods are one-element calls into the
+bulk versions, so sizing a single trade and a whole candidate list agree.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+from ..data_models.domain_models_analysis import TradeSide
+from . import interfaces
+from ._trade_levels import ATR_STOP_MULTIPLE, FALLBACK_STOP_FRACTION
+
+
+def _f64(value) -> np.ndarray:
+    return np.asarray(value, dtype=np.float64)
+
+
+class RiskCalculator(interfaces.RiskCalculator):
+    """Fixed-fraction sizing with volatility stops tightened to structure"""
+
+    def __init__(
+        self,
+        stop_multiple: float = ATR_STOP_MULTIPLE,
+        max_position_fraction: float = 1.0,
+    ):
+        """
+        Args:
+            stop_multiple: Stop distance in units of volatility
+            max_position_fraction: Largest share of the account one position
+                may cost, regardless of how tight its stop is
+        """
+        self.stop_multiple = stop_multiple
+        self.max_position_fraction = max_position_fraction
+
+    def calculate_position_size(
+        self,
+        account_balance: float,
+        risk_per_trade: float,
+        entry_price: float,
+        stop_loss: float,
+    ) -> int:
+        """Shares risking risk_per_trade of the account down to the stop"""
+        shares = self.calculate_position_size_bulk(
+            account_balance, risk_per_trade, [entry_price], [stop_loss]
+        )
+        return int(shares[0])
+
+    def calculate_position_size_bulk(
+        self,
+        account_balance: float,
+        risk_per_trade: float,
+        entry: np.ndarray,
+        stop: np.ndarray,
+    ) -> np.ndarray:
+        """floor(risk budget / per-share risk), capped by buying power"""
+        entry, stop = np.broadcast_arrays(_f64(entry), _f64(stop))
+        per_share = np.abs(entry - stop)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            shares = np.minimum(
+                account_balance * risk_per_trade / per_share,
+                account_balance * self.max_position_fraction / entry,
+            )
+        shares = np.where(np.isfinite(shares) & (per_share > 0), shares, 0.0)
+        return np.floor(np.clip(shares, 0.0, None)).astype(np.int64)
+
+    def calculate_stop_loss(
+        self,
+        entry_price: float,
+        side: TradeSide,
+        volatility: float,
+        support_resistance: Tuple[float, float],
+    ) -> float:
+        """Volatility stop, tightened to support/resistance when closer"""
+        support, resistance = support_resistance
+        stop = self.calculate_stop_loss_bulk(
+            [entry_price], side == TradeSide.LONG, volatility, support, resistance
+        )
+        return float(stop[0])
+
+    def calculate_stop_loss_bulk(
+        self,
+        entry: np.ndarray,
+        is_long: np.ndarray,
+        volatility: np.ndarray,
+        support: np.ndarray,
+        resistance: np.ndarray,
+    ) -> np.ndarray:
+        """
+        stop_multiple volatilities from entry, or FALLBACK_STOP_FRACTION of
+        entry when volatility is unknown. A support (long) or resistance
+        (short) level between that stop and the entry becomes the stop.
+        """
+        entry, volatility = _f64(entry), _f64(volatility)
+        support, resistance = _f64(support), _f64(resistance)
+        is_long = np.asarray(is_long, dtype=bool)
+        direction = np.where(is_long, 1.0, -1.0)
+
+        usable = np.isfinite(volatility) & (volatility > 0)
+        distance = np.where(
+            usable, self.stop_multiple * volatility, FALLBACK_STOP_FRACTION * entry
+        )
+        stop = entry - direction * distance
+
+        # Comparisons with a NaN level are False, so missing levels are ignored
+        long_level = is_long & (support > stop) & (support < entry)
+        short_level = ~is_long & (resistance < stop) & (resistance > entry)
+        stop = np.where(long_level, support, stop)
+        return np.where(short_level, resistance, stop)
+
+    def calculate_take_profit_levels(
+        self,
+        entry_price: float,
+        stop_loss: float,
+        side: TradeSide,
+        target_ratio: float = 1.5,
+    ) -> Tuple[float, float]:
+        """Targets target_ratio and twice target_ratio risks past entry"""
+        first, second = self.calculate_take_profit_levels_bulk(
+            [entry_price], [stop_loss], target_ratio
+        )
+        return float(first[0]), float(second[0])
+
+    def calculate_take_profit_levels_bulk(
+        self,
+        entry: np.ndarray,
+        stop: np.ndarray,
+        target_ratio: float = 1.5,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Signed risk (entry - stop) projected past entry"""
+        entry = _f64(entry)
+        risk = entry - _f64(stop)
+        return entry + target_ratio * risk, entry + 2 * target_ratio * risk
+
+    def validate_risk_reward(
+        self,
+        entry: float,
+        stop: float,
+        take_profit: float,
+        min_ratio: float = 1.0,
+    ) -> bool:
+        """Stop and target on opposite sides of entry, reward/risk >= min"""
+        risk = entry - stop
+        reward = take_profit - entry
+        if risk == 0 or (risk > 0) != (reward > 0):
+            return False
+        return reward / risk >= min_ratio
@@ -0,0 +1,151 @@
+"""
+TradeScout Suggestion Engine
+
+Concrete SuggestionEngine turning combined analysis results into
+TradeSuggestions. Ranking and filtering work on a float64 array of confidence
+scores; filtering picks the top K with np.argpartition, so only the returned
+suggestions are fully ordered.
+"""
+
+from decimal import Decimal
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+from ..data_models.domain_models_analysis import (
+    SuggestionInput,
+    TradeSide,
+    TradeSuggestion,
+)
+from . import interfaces
+from ._trade_levels import (
+    ATR_STOP_MULTIPLE,
+    FALLBACK_STOP_FRACTION,
+    confidence_level,
+    money,
+)
+
+
+def _scores(suggestions: Sequence[TradeSuggestion]) -> np.ndarray:
+    return np.fromiter(
+        (float(s.confidence_score) for s in suggestions),
+        np.float64,
+        len(suggestions),
+    )
+
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k highest scores, best first (ties keep input order)"""
+    n = len(scores)
+    k = min(k, n)
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    if k < n:
+        # argpartition picks arbitrarily among scores tied with the k-th, so
+        # keep every candidate at or above it and let the sort choose
+        kth = -np.partition(-scores, k - 1)[k - 1]
+        candidates = np.flatnonzero(~(scores < kth))
+    else:
+        candidates = np.arange(n)
+    order = np.lexsort((candidates, -scores[candidates]))
+    return candidates[order[:k]]
+
+
+class SuggestionEngine(interfaces.SuggestionEngine):
+    """Momentum-score driven suggestions with ATR-based stops"""
+
+    def __init__(
+        self,
+        min_score: float = 0.6,
+        target_ratio: float = 1.5,
+        min_risk_reward: float = 1.0,
+    ):
+        """
+        Args:
+            min_score: Minimum momentum score for a suggestion
+            target_ratio: Reward/risk ratio for the first take-profit level
+            min_risk_reward: Minimum reward/risk ratio a suggestion must offer
+        """
+        self.min_score = min_score
+        self.target_ratio = target_ratio
+        self.min_risk_reward = min_risk_reward
+
+    def generate_suggestion(
+        self, symbol: str, analysis: Union[SuggestionInput, Dict[str, object]]
+    ) -> Optional[TradeSuggestion]:
+        """
+        Build a suggestion from combined analysis results
+
+        A legacy dict is converted with ``SuggestionInput.from_dict``. Stops
+        sit ATR_STOP_MULTIPLE ATRs from entry when ATR is known. Without an
+        explicit side, a gap down is traded short.
+        """
+        if isinstance(analysis, dict):
+            analysis = SuggestionInput.from_dict(analysis)
+        entry = analysis.entry_price
+        score = analysis.momentum_score
+        if analysis.asset is None or np.isnan(entry) or score < self.min_score:
+            return None
+
+        gap_pct = analysis.features.gap_pct
+        side = analysis.side
+        if side is None:
+            side = TradeSide.SHORT if gap_pct < 0 else TradeSide.LONG
+        direction = 1.0 if side == TradeSide.LONG else -1.0
+
+        atr = analysis.features.atr
+        if np.isfinite(atr) and atr > 0:
+            risk = ATR_STOP_MULTIPLE * atr
+        else:
+            risk = FALLBACK_STOP_FRACTION * entry
+
+        suggestion = TradeSuggestion(
+            asset=analysis.asset,
+            side=side,
+            confidence=confidence_level(score),
+            confidence_score=Decimal(f"{score:.4f}"),
+            suggested_entry=money(entry),
+            stop_loss=money(entry - direction * risk),
+            take_profit_1=money(entry + direction * risk * self.target_ratio),
+            take_profit_2=money(entry + direction * risk * self.target_ratio * 2),
+            risk_reward_ratio=Decimal(str(self.target_ratio)),
+            rationale=f"{symbol} momentum score {score:.2f}",
+            supporting_factors=list(analysis.supporting_factors),
+            gap_percent=None if np.isnan(gap_pct) else Decimal(f"{gap_pct:.4f}"),
+            volume_surge=analysis.volume_surge,
+            news_catalyst=analysis.news_catalyst,
+            technical_setup=analysis.technical_setup,
+        )
+        return suggestion if self.validate_suggestion(suggestion) else None
+
+    def rank_suggestions(
+        self, suggestions: List[TradeSuggestion]
+    ) -> List[TradeSuggestion]:
+        """All suggestions by confidence score, best first"""
+        order = np.argsort(-_scores(suggestions), kind="stable")
+        return [suggestions[i] for i in order]
+
+    def filter_suggestions(
+        self, suggestions: List[TradeSuggestion], max_suggestions: int = 5
+    ) -> List[TradeSuggestion]:
+        """
+        Best valid suggestions, best first
+
+        Selects the top max_suggestions in linear time, so there is no need
+        to rank the full list first.
+        """
+        valid = [s for s in suggestions if self.validate_suggestion(s)]
+        return [valid[i] for i in top_k_indices(_scores(valid), max_suggestions)]
+
+    def validate_suggestion(self, suggestion: TradeSuggestion) -> bool:
+        """Score threshold, stop/target on the right sides, and reward/risk"""
+        if float(suggestion.confidence_score) < self.min_score:
+            return False
+        entry = suggestion.suggested_entry
+        if suggestion.side == TradeSide.LONG:
+            ordered = suggestion.stop_loss < entry < suggestion.take_profit_1
+        else:
+            ordered = suggestion.take_profit_1 < entry < suggestion.stop_loss
+        return ordered and suggestion.risk_reward_ratio >= Decimal(
+            str(self.min_risk_reward)
+        )
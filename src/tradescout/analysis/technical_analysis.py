@@ -0,0 +1,169 @@
+"""
+TradeScout Technical Analysis
+
+Concrete TechnicalAnalyzer running the indicator kernels over QuoteArray
+columns; PriceSeries and quote lists are converted once on entry. All math
+is float64; results are converted to Decimal once, when the
+TechnicalIndicators / support-resistance values are built.
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..data_models.domain_models_analysis import (
+    TechnicalIndicators,
+    TechnicalIndicatorsBatch,
+)
+from ..data_models.domain_models_core import QuoteArray
+from . import _indicator_kernels as kernels
+from . import interfaces
+
+# Bars used for breakout and support/resistance windows
+LOOKBACK_BARS = 20
+# Momentum score at or above which a setup can be favorable
+FAVORABLE_MOMENTUM = 0.6
+
+
+def _last(series: np.ndarray) -> Optional[float]:
+    """Final value of an indicator series, None during warm-up"""
+    if series.shape[0] == 0 or np.isnan(series[-1]):
+        return None
+    return float(series[-1])
+
+
+def _to_decimal(value: Optional[float]) -> Optional[Decimal]:
+    return None if value is None else Decimal(f"{value:.4f}")
+
+
+class TechnicalAnalyzer(interfaces.TechnicalAnalyzer):
+    """Indicator-based technical analysis on float64 price columns"""
+
+    def __init__(self, timeframe: str = "1d"):
+        self.timeframe = timeframe
+
+    def analyze_trend(self, quotes: interfaces.QuoteInput) -> Dict[str, any]:
+        """Classify trend from the 20/50-bar SMA relationship"""
+        quotes = QuoteArray.coerce(quotes)
+        close = np.ascontiguousarray(quotes.close, dtype=np.float64)
+        sma_fast = _last(kernels.sma(close, 20))
+        sma_slow = _last(kernels.sma(close, 50))
+
+        direction = "sideways"
+        if sma_fast is not None and sma_slow is not None:
+            if sma_fast > sma_slow and close[-1] > sma_fast:
+                direction = "up"
+            elif sma_fast < sma_slow and close[-1] < sma_fast:
+                direction = "down"
+
+        return {"direction": direction, "sma_20": sma_fast, "sma_50": sma_slow}
+
+    def detect_breakout_patterns(self, quotes: interfaces.QuoteInput) -> List[str]:
+        """Detect range breakouts and volume breakouts on the latest bar"""
+        quotes = QuoteArray.coerce(quotes)
+        if len(quotes) <= LOOKBACK_BARS:
+            return []
+
+        close = quotes.close
+        window = slice(-LOOKBACK_BARS - 1, -1)
+        highs = np.where(np.isnan(quotes.high), close, quotes.high)[window]
+        lows = np.where(np.isnan(quotes.low), close, quotes.low)[window]
+
+        patterns = []
+        if close[-1] > highs.max():
+            patterns.append("breakout_high")
+        elif close[-1] < lows.min():
+            patterns.append("breakdown_low")
+        if quotes.volume[-1] > 2.0 * quotes.volume[window].mean():
+            patterns.append("volume_breakout")
+        return patterns
+
+    def calculate_support_resistance(
+        self, quotes: interfaces.QuoteInput
+    ) -> Tuple[Decimal, Decimal]:
+        """Lowest low and highest high over the lookback window"""
+        quotes = QuoteArray.coerce(quotes)
+        close = quotes.close[-LOOKBACK_BARS:]
+        lows = quotes.low[-LOOKBACK_BARS:]
+        highs = quotes.high[-LOOKBACK_BARS:]
+        support = np.nanmin(np.where(np.isnan(lows), close, lows))
+        resistance = np.nanmax(np.where(np.isnan(highs), close, highs))
+        return _to_decimal(float(support)), _to_decimal(float(resistance))
+
+    def analyze_indicators(self, quotes: interfaces.QuoteInput) -> TechnicalIndicators:
+        """Run the indicator kernels and wrap the latest values"""
+        quotes = QuoteArray.coerce(quotes)
+        close = np.ascontiguousarray(quotes.close, dtype=np.float64)
+        volume = np.ascontiguousarray(quotes.volume, dtype=np.float64)
+        macd_line, macd_signal, macd_hist = kernels.macd(close)
+
+        sma_20 = kernels.sma(close, 20)
+        deviation = _last(_rolling_std(close, 20))
+        sma_last = _last(sma_20)
+        volume_sma = _last(kernels.sma(volume, 20))
+
+        bollinger_upper = bollinger_lower = None
+        if sma_last is not None and deviation is not None:
+            bollinger_upper = sma_last + 2 * deviation
+            bollinger_lower = sma_last - 2 * deviation
+
+        volume_ratio = None
+        if volume_sma and len(volume):
+            volume_ratio = float(volume[-1]) / volume_sma
+
+        values = {
+            "sma_20": sma_last,
+            "sma_50": _last(kernels.sma(close, 50)),
+            "ema_12": _last(kernels.ema(close, 12)),
+            "ema_26": _last(kernels.ema(close, 26)),
+            "rsi": _last(kernels.rsi(close, 14)),
+            "macd": _last(macd_line),
+            "macd_signal": _last(macd_signal),
+            "macd_histogram": _last(macd_hist),
+            "volume_sma": volume_sma,
+            "volume_ratio": volume_ratio,
+            "bollinger_upper": bollinger_upper,
+            "bollinger_lower": bollinger_lower,
+            "atr": _last(kernels.atr(quotes.high, quotes.low, close, 14)),
+        }
+
+        return TechnicalIndicators(
+            asset=quotes.asset,
+            timestamp=datetime.now(),
+            timeframe=self.timeframe,
+            **{name: _to_decimal(value) for name, value in values.items()},
+        )
+
+    def analyze_indicators_bulk(
+        self,
+        closes: np.ndarray,
+        highs: np.ndarray,
+        lows: np.ndarray,
+        volumes: np.ndarray,
+    ) -> TechnicalIndicatorsBatch:
+        """All symbols' indicator series in one parallel kernel call"""
+        closes, highs, lows, volumes = (
+            np.ascontiguousarray(np.atleast_2d(a), dtype=np.float64)
+            for a in (closes, highs, lows, volumes)
+        )
+        out = np.full((7,) + closes.shape, np.nan)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            kernels.indicators_2d(closes, highs, lows, volumes, out)
+        return TechnicalIndicatorsBatch(*out)
+
+    def is_favorable_setup(
+        self, indicators: TechnicalIndicators, momentum_score: float
+    ) -> bool:
+        """Strong momentum without an overbought RSI"""
+        return momentum_score >= FAVORABLE_MOMENTUM and not indicators.is_overbought
+
+
+def _rolling_std(a: np.ndarray, n: int) -> np.ndarray:
+    """Population standard deviation over a trailing window"""
+    out = np.full(a.shape[0], np.nan)
+    if a.shape[0] >= n:
+        windows = np.lib.stride_tricks.sliding_window_view(a, n)
+        out[n - 1 :] = windows.std(axis=1)
+    return out
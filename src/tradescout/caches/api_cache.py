@@ -5,18 +5,57 @@ Intelligent caching for free-tier APIs with rate limits.
 Always checks cache before making external API calls.
 """
 
+import gzip
 import json
 import os
 import hashlib
-from datetime import datetime, timedelta
+import orjson
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache, partial
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional, Callable
-from dataclasses import dataclass, asdict
+from typing import Dict, Any, List, Optional, Callable, Iterator, Tuple
+from dataclasses import dataclass, asdict, field
 from enum import Enum
 import logging
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_CACHE_DIR = "data/cache"
+CACHE_SUFFIX = ".json"
+COMPRESSED_SUFFIX = ".json.gz"
+
+# Payloads smaller than this don't shrink enough to be worth gzip overhead
+MIN_COMPRESS_BYTES = 200
+
+# orjson output is already compact; non-str keys match stdlib json behaviour
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+# Return from an api_function when upstream reports the cached copy is current
+# (e.g. HTTP 304); the entry's mtime is bumped instead of rewriting it
+NOT_MODIFIED = object()
+
+INDEX_FILENAME = "index.db"
+INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    provider TEXT NOT NULL,
+    endpoint TEXT,
+    policy TEXT,
+    path TEXT NOT NULL,
+    mtime REAL NOT NULL,
+    size INTEGER NOT NULL,
+    params TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_entries_mtime ON entries(mtime);
+CREATE INDEX IF NOT EXISTS idx_entries_provider ON entries(provider);
+"""
+
 
 class CachePolicy(Enum):
     """Cache policies for different data types"""
@@ -34,14 +73,18 @@ class CachePolicy(Enum):
 class CacheConfig:
     """Configuration for cache behavior"""
 
-    base_dir: str = "data/cache"
+    # Read at construction so tests can redirect DEFAULT_CACHE_DIR
+    base_dir: str = field(default_factory=lambda: DEFAULT_CACHE_DIR)
     max_size_mb: int = 500  # 500MB cache limit
     default_ttl_minutes: int = 30  # Default 30 minutes
-    compress_data: bool = True  # Compress JSON data
+    compress_data: bool = True  # Gzip JSON data (small entries stay plain)
     enabled: bool = True  # Can disable for testing
+    memory_cache_size: int = 1024  # In-process LRU entries (0 disables)
 
     # TTL by data type
     ttl_policies: Dict[CachePolicy, int] = None
+    # Minutes past TTL that cached_api_call may still serve while refreshing
+    stale_windows: Dict[CachePolicy, int] = None
 
     def __post_init__(self):
         if self.ttl_policies is None:
@@ -54,6 +97,57 @@ class CacheConfig:
                 CachePolicy.FUNDAMENTAL: 10080,  # 1 week
                 CachePolicy.HISTORICAL: 43200,  # 30 days
             }
+        if self.stale_windows is None:
+            self.stale_windows = {
+                CachePolicy.REAL_TIME: 5,
+                CachePolicy.INTRADAY: 5,
+                CachePolicy.PREMARKET: 5,
+                CachePolicy.AFTERHOURS: 5,
+                CachePolicy.DAILY: 60,  # 1 hour
+                CachePolicy.FUNDAMENTAL: 1440,  # 1 day
+                CachePolicy.HISTORICAL: 1440,  # 1 day
+            }
+
+
+def _canonical_params(value: Any) -> Any:
+    """
+    Order-independent, hashable form of API params for cache keys
+
+    Dict keys are compared by repr so 1 and "1" stay distinct and mixed key
+    types still sort; lists become tuples and sets become sorted tuples.
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((repr(k), _canonical_params(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_canonical_params(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(repr(v) for v in value))
+    return value
+
+
+def _default_file_mode() -> int:
+    """Mode open() would give a new file under the process umask"""
+    # umask can only be read by setting it; done once at import, before any
+    # cache threads exist
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+# mkstemp creates files 0600; cache entries get the usual umask-based mode
+_CACHE_FILE_MODE = _default_file_mode()
+
+
+@lru_cache(maxsize=2048)
+def _hash_cache_key(serialized: bytes) -> str:
+    """
+    Hash serialized key material; memoized since batches repeat the same calls
+
+    Keyed on the repr bytes rather than the params tuple: tuples compare
+    1 == 1.0 == True, which would hand those params each other's hash.
+    """
+    # Non-cryptographic use: 16-byte BLAKE2b keeps 32-char hex filenames
+    return hashlib.blake2b(serialized, digest_size=16).hexdigest()
 
 
 class APICache:
@@ -63,14 +157,31 @@ class APICache:
     Features:
     - Automatic cache key generation
     - TTL-based expiration by data type
+    - In-process LRU in front of the filesystem
+    - Single-flight API calls (concurrent misses share one request)
+    - Stale-while-revalidate (serve recently expired data, refresh in background)
+    - SQLite metadata index (no per-file scans for size, cleanup, eviction)
     - Size management (LRU eviction)
     - Cache statistics and monitoring
     - Easy cache clearing and management
     """
 
+    # Shared by all instances; threads are only started on first refresh
+    _refresh_executor = ThreadPoolExecutor(
+        max_workers=4, thread_name_prefix="api-cache-refresh"
+    )
+
     def __init__(self, config: CacheConfig = None):
         self.config = config or CacheConfig()
         self.cache_dir = Path(self.config.base_dir)
+        # Freshness checks compare epoch floats; precompute TTLs in seconds
+        self._ttl_seconds = {
+            policy: minutes * 60 for policy, minutes in self.config.ttl_policies.items()
+        }
+        self._stale_seconds = {
+            policy: self._ttl_seconds[policy] + self.config.stale_windows.get(policy, 0) * 60
+            for policy in self._ttl_seconds
+        }
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
         # Cache subdirectories by provider
@@ -85,32 +196,187 @@ class APICache:
         for provider_dir in self.providers.values():
             provider_dir.mkdir(exist_ok=True)
 
-        self.stats = {"hits": 0, "misses": 0, "saves": 0, "evictions": 0}
+        self.stats = {
+            "hits": 0,
+            "memory_hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "saves": 0,
+            "evictions": 0,
+        }
+
+        # cache_key -> (stored_at epoch, data), most recently used last
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+        # cache_key -> Future for API calls currently in progress
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+        self._index_lock = threading.Lock()
+        self._index = self._open_index()
+
+    def _open_index(self) -> sqlite3.Connection:
+        """Open (and backfill if new) the SQLite metadata index"""
+        conn = sqlite3.connect(
+            self.cache_dir / INDEX_FILENAME, check_same_thread=False
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(INDEX_SCHEMA)
+
+        if conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0] == 0:
+            self._backfill_index(conn)
+        return conn
+
+    def _backfill_index(self, conn: sqlite3.Connection):
+        """Index cache files written before the index existed"""
+        rows = []
+        for provider_name, entry in self._iter_entries():
+            try:
+                cache_entry = self._read_entry(entry.path)
+                stat = entry.stat()
+            except (json.JSONDecodeError, IOError, EOFError):
+                os.unlink(entry.path)
+                continue
+            rows.append(
+                (
+                    entry.name.split(".", 1)[0],
+                    provider_name,
+                    cache_entry.get("endpoint"),
+                    cache_entry.get("policy", CachePolicy.INTRADAY.value),
+                    f"{provider_name}/{entry.name}",
+                    stat.st_mtime,
+                    stat.st_size,
+                    orjson.dumps(cache_entry.get("params", {}), default=str).decode(),
+                )
+            )
+
+        if rows:
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+            logger.info("Cache index backfilled with %d entries", len(rows))
+
+    def _iter_entries(self) -> Iterator[Tuple[str, os.DirEntry]]:
+        """Yield (provider, DirEntry) for every cache file in one scandir pass"""
+        for provider_name, provider_dir in self.providers.items():
+            with os.scandir(provider_dir) as it:
+                for entry in it:
+                    if entry.name.endswith((CACHE_SUFFIX, COMPRESSED_SUFFIX)):
+                        yield provider_name, entry
+
+    def _index_query(self, sql: str, params: tuple = ()) -> list:
+        """Run a read query against the metadata index"""
+        with self._index_lock:
+            return self._index.execute(sql, params).fetchall()
+
+    def _index_write(self, sql: str, params: tuple = ()):
+        """Run a write against the metadata index in its own transaction"""
+        with self._index_lock, self._index:
+            self._index.execute(sql, params)
+
+    def _provider_bucket(self, provider: str) -> str:
+        """Provider directory name used for a provider (unknown -> general)"""
+        return provider if provider in self.providers else "general"
+
+    def _remove_indexed(self, rows: list) -> int:
+        """Delete (key, path) index rows and their cache files"""
+        for cache_key, rel_path in rows:
+            (self.cache_dir / rel_path).unlink(missing_ok=True)
+            with self._lock:
+                self._memory.pop(cache_key, None)
+
+        if rows:
+            with self._index_lock, self._index:
+                self._index.executemany(
+                    "DELETE FROM entries WHERE key = ?", [(k,) for k, _ in rows]
+                )
+        return len(rows)
 
     def get_cache_key(
         self, provider: str, endpoint: str, params: Dict[str, Any]
     ) -> str:
         """Generate consistent cache key from API call parameters"""
-        # Create deterministic key from provider + endpoint + sorted params
-        param_str = json.dumps(params, sort_keys=True, default=str)
-        combined = f"{provider}:{endpoint}:{param_str}"
-        return hashlib.md5(combined.encode()).hexdigest()
+        # Create deterministic key from provider + endpoint + canonical params
+        canonical = _canonical_params(params)
+        return _hash_cache_key(repr((provider, endpoint, canonical)).encode())
 
     def get_cache_path(self, provider: str, cache_key: str) -> Path:
         """Get file path for cache entry"""
         provider_dir = self.providers.get(provider, self.providers["general"])
-        return provider_dir / f"{cache_key}.json"
+        suffix = COMPRESSED_SUFFIX if self.config.compress_data else CACHE_SUFFIX
+        return provider_dir / f"{cache_key}{suffix}"
+
+    def _resolve_cache_path(self, provider: str, cache_key: str) -> Path:
+        """Find the existing file for a cache entry, plain or gzipped"""
+        cache_path = self.get_cache_path(provider, cache_key)
+        if cache_path.exists():
+            return cache_path
+        alternate = self._alternate_path(cache_path)
+        return alternate if alternate.exists() else cache_path
+
+    @staticmethod
+    def _alternate_path(cache_path: Path) -> Path:
+        """Swap a cache path between its plain and gzipped variants"""
+        if cache_path.name.endswith(COMPRESSED_SUFFIX):
+            return cache_path.with_name(cache_path.name[: -len(COMPRESSED_SUFFIX)] + CACHE_SUFFIX)
+        return cache_path.with_name(cache_path.name[: -len(CACHE_SUFFIX)] + COMPRESSED_SUFFIX)
+
+    @staticmethod
+    def _read_entry(cache_path) -> Dict[str, Any]:
+        """Load a cache entry (Path or str), decompressing gzipped files"""
+        if os.fspath(cache_path).endswith(COMPRESSED_SUFFIX):
+            with gzip.open(cache_path, "rb") as f:
+                return orjson.loads(f.read())
+        with open(cache_path, "rb") as f:
+            return orjson.loads(f.read())
+
+    def _write_entry(self, cache_path: Path, cache_entry: Dict[str, Any]) -> tuple:
+        """Write a cache entry as compact JSON, gzipped when worthwhile
+
+        Returns:
+            (path actually written, serialized JSON bytes)
+        """
+        serialized = orjson.dumps(cache_entry, option=ORJSON_OPTIONS, default=str)
+        compress = self.config.compress_data and len(serialized) >= MIN_COMPRESS_BYTES
+
+        if cache_path.name.endswith(COMPRESSED_SUFFIX) != compress:
+            # Drop any stale copy in the other format before switching paths
+            cache_path.unlink(missing_ok=True)
+            cache_path = self._alternate_path(cache_path)
+
+        payload = gzip.compress(serialized, compresslevel=6) if compress else serialized
+
+        # Write a temp file and rename over the entry so readers never see a
+        # partial write; .tmp names are ignored by directory walks
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+        try:
+            try:
+                view = memoryview(payload)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
+            os.chmod(tmp_path, _CACHE_FILE_MODE)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+        return cache_path, serialized
 
     def is_fresh(self, cache_path: Path, policy: CachePolicy) -> bool:
         """Check if cached data is still fresh based on policy"""
-        if not cache_path.exists():
+        try:
+            mtime = os.stat(os.fspath(cache_path)).st_mtime
+        except FileNotFoundError:
             return False
 
-        file_time = datetime.fromtimestamp(cache_path.stat().st_mtime)
-        ttl_minutes = self.config.ttl_policies[policy]
-        expiry_time = file_time + timedelta(minutes=ttl_minutes)
+        return self._is_fresh_at(mtime, policy)
 
-        return datetime.now() < expiry_time
+    def _is_fresh_at(self, mtime: float, policy: CachePolicy) -> bool:
+        """Check freshness from an indexed modification time"""
+        return time.time() < mtime + self._ttl_seconds[policy]
 
     def get(
         self,
@@ -135,27 +401,41 @@ class APICache:
             return None
 
         cache_key = self.get_cache_key(provider, endpoint, params)
-        cache_path = self.get_cache_path(provider, cache_key)
 
-        if self.is_fresh(cache_path, policy):
+        found, data = self._memory_get(cache_key, policy)
+        if found:
+            self._record("hits", "memory_hits")
+            logger.info("Cache HIT: %s:%s (memory)", provider, endpoint)
+            return data
+
+        # Path and mtime come from the index - no exists()/stat() per lookup
+        row = self._index_query(
+            "SELECT path, mtime FROM entries WHERE key = ?", (cache_key,)
+        )
+        if row and self._is_fresh_at(row[0][1], policy):
+            rel_path, mtime = row[0]
+            cache_path = self.cache_dir / rel_path
             try:
-                with open(cache_path, "r") as f:
-                    cache_entry = json.load(f)
+                cache_entry = self._read_entry(cache_path)
 
-                self.stats["hits"] += 1
-                logger.info(
-                    f"Cache HIT: {provider}:{endpoint} (age: {self._get_age_minutes(cache_path):.1f}m)"
-                )
+                self._record("hits")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "Cache HIT: %s:%s (age: %.1fm)",
+                        provider, endpoint, (time.time() - mtime) / 60,
+                    )
 
+                self._memory_put(cache_key, cache_entry["data"], mtime)
                 return cache_entry["data"]
 
-            except (json.JSONDecodeError, KeyError, IOError) as e:
-                logger.warning(f"Cache read error for {cache_key}: {e}")
+            except (json.JSONDecodeError, KeyError, IOError, EOFError) as e:
+                logger.warning("Cache read error for %s: %s", cache_key, e)
                 # Remove corrupted cache file
                 cache_path.unlink(missing_ok=True)
+                self._index_write("DELETE FROM entries WHERE key = ?", (cache_key,))
 
-        self.stats["misses"] += 1
-        logger.info(f"Cache MISS: {provider}:{endpoint}")
+        self._record("misses")
+        logger.info("Cache MISS: %s:%s", provider, endpoint)
         return None
 
     def set(
@@ -184,7 +464,7 @@ class APICache:
 
         try:
             cache_key = self.get_cache_key(provider, endpoint, params)
-            cache_path = self.get_cache_path(provider, cache_key)
+            cache_path = self._resolve_cache_path(provider, cache_key)
 
             cache_entry = {
                 "provider": provider,
@@ -196,12 +476,28 @@ class APICache:
                 "ttl_minutes": self.config.ttl_policies[policy],
             }
 
-            with open(cache_path, "w") as f:
-                json.dump(cache_entry, f, indent=2, default=str)
+            cache_path, serialized = self._write_entry(cache_path, cache_entry)
+            stat = cache_path.stat()
+            self._index_write(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    cache_key,
+                    cache_path.parent.name,
+                    endpoint,
+                    policy.value,
+                    f"{cache_path.parent.name}/{cache_path.name}",
+                    stat.st_mtime,
+                    stat.st_size,
+                    orjson.dumps(params, option=ORJSON_OPTIONS, default=str).decode(),
+                ),
+            )
+            if self.config.memory_cache_size > 0:
+                # Keep the JSON form in memory so hits match what disk would return
+                self._memory_put(cache_key, orjson.loads(serialized)["data"], time.time())
 
-            self.stats["saves"] += 1
+            self._record("saves")
             logger.debug(
-                f"Cache SAVE: {provider}:{endpoint} (TTL: {self.config.ttl_policies[policy]}m)"
+                "Cache SAVE: %s:%s (TTL: %sm)", provider, endpoint, self.config.ttl_policies[policy]
             )
 
             # Check cache size and evict if needed
@@ -210,7 +506,7 @@ class APICache:
             return True
 
         except (IOError, TypeError) as e:
-            logger.error(f"Cache save error: {e}")
+            logger.error("Cache save error: %s", e)
             return False
 
     def cached_api_call(
@@ -236,21 +532,193 @@ class APICache:
         Returns:
             API response data (from cache or fresh API call)
         """
+        cache_key = self.get_cache_key(provider, endpoint, params)
+
         # Skip cache if force refresh requested
         if not force_refresh:
             cached_data = self.get(provider, endpoint, params, policy)
             if cached_data is not None:
                 return cached_data
 
-        # Cache miss or force refresh - make API call
+            # Recently expired: answer now, refresh in the background
+            stale_data = self._get_stale(cache_key, policy)
+            if stale_data is not None:
+                self._record("stale_hits")
+                future, is_leader = self._begin_flight(cache_key)
+                if is_leader:
+                    logger.info("Cache STALE: %s:%s (refreshing in background)", provider, endpoint)
+                    self._refresh_executor.submit(
+                        self._background_refresh,
+                        cache_key, future, provider, endpoint, params, api_function, policy,
+                    )
+                return stale_data
+
+        # Single-flight: concurrent callers for the same key wait on one call
+        future, is_leader = self._begin_flight(cache_key)
+        if not is_leader:
+            logger.info("API CALL: %s:%s (joining in-flight request)", provider, endpoint)
+            return future.result()
+
         call_reason = "force refresh" if force_refresh else "cache miss"
-        logger.info(f"API CALL: {provider}:{endpoint} ({call_reason})")
-        fresh_data = api_function()
+        return self._fetch_and_store(
+            cache_key, future, provider, endpoint, params, api_function, policy, call_reason
+        )
+
+    def cached_api_call_many(
+        self,
+        provider: str,
+        endpoint: str,
+        params_list: List[Dict[str, Any]],
+        api_function: Callable[[Dict[str, Any]], Any],
+        policy: CachePolicy = CachePolicy.INTRADAY,
+        force_refresh: bool = False,
+        max_workers: int = 4,
+    ) -> List[Any]:
+        """
+        Bulk version of cached_api_call for scanning many symbols
 
-        # Save to cache (even on force refresh)
-        self.set(provider, endpoint, params, fresh_data, policy)
+        Duplicate params are fetched once, the in-process cache is probed
+        under a single lock, and the remaining calls run in parallel.
 
-        return fresh_data
+        Args:
+            provider: API provider name
+            endpoint: API endpoint name
+            params_list: API call parameters, one dict per call
+            api_function: Called with a params dict for each call not in cache
+            policy: Cache policy
+            force_refresh: Bypass cache and make fresh API calls
+            max_workers: Maximum concurrent API calls
+
+        Returns:
+            Results in the same order as params_list
+        """
+        keys = [self.get_cache_key(provider, endpoint, p) for p in params_list]
+        unique = dict(zip(keys, params_list))
+
+        results = {} if force_refresh else self._memory_get_many(unique, policy)
+        if results:
+            self._record("hits", "memory_hits", count=len(results))
+            logger.info("Cache HIT: %s:%s x%d (memory)", provider, endpoint, len(results))
+
+        pending = {k: p for k, p in unique.items() if k not in results}
+        if pending:
+            def call(params):
+                return self.cached_api_call(
+                    provider, endpoint, params, partial(api_function, params),
+                    policy, force_refresh,
+                )
+
+            if len(pending) == 1:
+                (key, params), = pending.items()
+                results[key] = call(params)
+            else:
+                workers = min(max_workers, len(pending))
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    futures = {k: pool.submit(call, p) for k, p in pending.items()}
+                    for key, future in futures.items():
+                        results[key] = future.result()
+
+        return [results[key] for key in keys]
+
+    def _begin_flight(self, cache_key: str) -> Tuple[Future, bool]:
+        """Register an in-flight API call; returns (future, is_leader)"""
+        with self._lock:
+            future = self._inflight.get(cache_key)
+            if future is not None:
+                return future, False
+            future = Future()
+            self._inflight[cache_key] = future
+            return future, True
+
+    def _fetch_and_store(
+        self,
+        cache_key: str,
+        future: Future,
+        provider: str,
+        endpoint: str,
+        params: Dict[str, Any],
+        api_function: Callable,
+        policy: CachePolicy,
+        call_reason: str,
+    ) -> Any:
+        """Make the API call as flight leader, cache it and resolve waiters"""
+        try:
+            logger.info("API CALL: %s:%s (%s)", provider, endpoint, call_reason)
+            fresh_data = api_function()
+
+            if fresh_data is NOT_MODIFIED:
+                if self.touch(provider, endpoint, params):
+                    fresh_data = self.get(provider, endpoint, params, policy)
+                else:
+                    logger.warning("%s:%s not modified but nothing cached", provider, endpoint)
+                    fresh_data = None
+            else:
+                # Save to cache (even on force refresh)
+                self.set(provider, endpoint, params, fresh_data, policy)
+
+            future.set_result(fresh_data)
+            return fresh_data
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(cache_key, None)
+
+    def _background_refresh(self, *args):
+        """Run a stale-while-revalidate refresh, logging instead of raising"""
+        try:
+            self._fetch_and_store(*args, "stale-while-revalidate")
+        except Exception as e:
+            logger.warning("Background cache refresh failed: %s", e)
+
+    def _get_stale(self, cache_key: str, policy: CachePolicy) -> Optional[Any]:
+        """Return expired data still inside the policy's stale window"""
+        if not self.config.enabled:
+            return None
+        row = self._index_query(
+            "SELECT path, mtime FROM entries WHERE key = ?", (cache_key,)
+        )
+        if not row or time.time() >= row[0][1] + self._stale_seconds[policy]:
+            return None
+
+        try:
+            return self._read_entry(self.cache_dir / row[0][0])["data"]
+        except (json.JSONDecodeError, KeyError, IOError, EOFError):
+            return None
+
+    def touch(self, provider: str, endpoint: str, params: Dict[str, Any]) -> bool:
+        """
+        Mark an existing cache entry fresh without rewriting it
+
+        Args:
+            provider: API provider name
+            endpoint: API endpoint name
+            params: API call parameters
+
+        Returns:
+            True if an entry existed and was refreshed
+        """
+        cache_key = self.get_cache_key(provider, endpoint, params)
+        row = self._index_query("SELECT path FROM entries WHERE key = ?", (cache_key,))
+        if not row:
+            return False
+
+        now = time.time()
+        try:
+            os.utime(self.cache_dir / row[0][0], (now, now))
+        except FileNotFoundError:
+            self._index_write("DELETE FROM entries WHERE key = ?", (cache_key,))
+            return False
+
+        self._index_write("UPDATE entries SET mtime = ? WHERE key = ?", (now, cache_key))
+        with self._lock:
+            entry = self._memory.get(cache_key)
+            if entry is not None:
+                self._memory[cache_key] = (now, entry[1])
+
+        logger.debug("Cache TOUCH: %s:%s", provider, endpoint)
+        return True
 
     def invalidate(
         self, provider: str = None, endpoint: str = None, symbol: str = None
@@ -266,55 +734,49 @@ class APICache:
         Returns:
             Number of cache entries removed
         """
-        removed_count = 0
-
+        conditions, args = [], []
         if provider and provider in self.providers:
-            search_dirs = [self.providers[provider]]
-        else:
-            search_dirs = list(self.providers.values())
-
-        for provider_dir in search_dirs:
-            for cache_file in provider_dir.glob("*.json"):
-                should_remove = False
-
-                try:
-                    with open(cache_file, "r") as f:
-                        cache_entry = json.load(f)
-
-                    # Check if matches invalidation criteria
-                    if endpoint and cache_entry.get("endpoint") == endpoint:
-                        should_remove = True
-                    elif (
-                        symbol
-                        and symbol.upper() in str(cache_entry.get("params", {})).upper()
-                    ):
-                        should_remove = True
-                    elif not endpoint and not symbol:  # Remove all for provider
-                        should_remove = True
-
-                    if should_remove:
-                        cache_file.unlink()
-                        removed_count += 1
-
-                except (json.JSONDecodeError, IOError):
-                    # Remove corrupted files
-                    cache_file.unlink()
-                    removed_count += 1
-
-        logger.info(f"Cache invalidated: {removed_count} entries removed")
+            conditions.append("provider = ?")
+            args.append(provider)
+
+        # Endpoint and symbol match either-or, as before
+        matchers, match_args = [], []
+        if endpoint:
+            matchers.append("endpoint = ?")
+            match_args.append(endpoint)
+        if symbol:
+            matchers.append("instr(UPPER(params), ?) > 0")
+            match_args.append(symbol.upper())
+        if matchers:
+            conditions.append(f"({' OR '.join(matchers)})")
+            args.extend(match_args)
+
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        rows = self._index_query(f"SELECT key, path FROM entries{where}", tuple(args))
+        removed_count = self._remove_indexed(rows)
+
+        logger.info("Cache invalidated: %d entries removed", removed_count)
         return removed_count
 
     def clear_all(self) -> int:
         """Clear entire cache"""
-        return self.invalidate()
+        removed_count = self.invalidate()
+
+        # Sweep any files the index doesn't know about
+        for _, entry in self._iter_entries():
+            os.unlink(entry.path)
+            removed_count += 1
+        return removed_count
 
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
         cache_size_mb = self._calculate_cache_size() / (1024 * 1024)
-        file_count = sum(len(list(d.glob("*.json"))) for d in self.providers.values())
+        file_count = self._index_query("SELECT COUNT(*) FROM entries")[0][0]
+        with self._lock:
+            stats = dict(self.stats)
         hit_rate = (
-            self.stats["hits"] / (self.stats["hits"] + self.stats["misses"])
-            if (self.stats["hits"] + self.stats["misses"]) > 0
+            stats["hits"] / (stats["hits"] + stats["misses"])
+            if (stats["hits"] + stats["misses"]) > 0
             else 0
         )
 
@@ -324,68 +786,104 @@ class APICache:
             "file_count": file_count,
             "max_size_mb": self.config.max_size_mb,
             "utilization": f"{(cache_size_mb / self.config.max_size_mb):.1%}",
-            **self.stats,
+            **stats,
         }
 
     def cleanup_expired(self) -> int:
         """Remove expired cache entries"""
-        removed_count = 0
-
-        for provider_dir in self.providers.values():
-            for cache_file in provider_dir.glob("*.json"):
-                try:
-                    with open(cache_file, "r") as f:
-                        cache_entry = json.load(f)
-
-                    policy = CachePolicy(cache_entry.get("policy", "intraday"))
-                    if not self.is_fresh(cache_file, policy):
-                        cache_file.unlink()
-                        removed_count += 1
-
-                except (json.JSONDecodeError, IOError):
-                    cache_file.unlink()
-                    removed_count += 1
+        now = time.time()
+        rows = []
+        for policy, ttl_seconds in self._ttl_seconds.items():
+            rows.extend(
+                self._index_query(
+                    "SELECT key, path FROM entries WHERE policy = ? AND mtime <= ?",
+                    (policy.value, now - ttl_seconds),
+                )
+            )
+        removed_count = self._remove_indexed(rows)
 
-        logger.info(f"Cache cleanup: {removed_count} expired entries removed")
+        logger.info("Cache cleanup: %d expired entries removed", removed_count)
         return removed_count
 
+    def _record(self, *names: str, count: int = 1):
+        """Increment stats counters; safe across refresh/caller threads"""
+        with self._lock:
+            for name in names:
+                self.stats[name] += count
+
+    def _memory_get(self, cache_key: str, policy: CachePolicy) -> tuple:
+        """Look up an in-process entry; returns (found, data)"""
+        if self.config.memory_cache_size <= 0:
+            return False, None
+
+        with self._lock:
+            entry = self._memory.get(cache_key)
+            if entry is None:
+                return False, None
+
+            stored_at, data = entry
+            if time.time() >= stored_at + self._ttl_seconds[policy]:
+                return False, None
+
+            self._memory.move_to_end(cache_key)
+            return True, data
+
+    def _memory_get_many(self, cache_keys, policy: CachePolicy) -> Dict[str, Any]:
+        """Look up several in-process entries under one lock acquisition"""
+        if not self.config.enabled or self.config.memory_cache_size <= 0:
+            return {}
+
+        found = {}
+        cutoff = time.time() - self._ttl_seconds[policy]
+        with self._lock:
+            for cache_key in cache_keys:
+                entry = self._memory.get(cache_key)
+                if entry is not None and entry[0] > cutoff:
+                    self._memory.move_to_end(cache_key)
+                    found[cache_key] = entry[1]
+        return found
+
+    def _memory_put(self, cache_key: str, data: Any, stored_at: float):
+        """Store an in-process entry, dropping the least recently used"""
+        if self.config.memory_cache_size <= 0:
+            return
+
+        with self._lock:
+            self._memory[cache_key] = (stored_at, data)
+            self._memory.move_to_end(cache_key)
+            while len(self._memory) > self.config.memory_cache_size:
+                self._memory.popitem(last=False)
+
     def _get_age_minutes(self, cache_path: Path) -> float:
         """Get age of cache file in minutes"""
-        file_time = datetime.fromtimestamp(cache_path.stat().st_mtime)
-        return (datetime.now() - file_time).total_seconds() / 60
+        return (time.time() - os.stat(os.fspath(cache_path)).st_mtime) / 60
 
     def _calculate_cache_size(self) -> int:
         """Calculate total cache size in bytes"""
-        total_size = 0
-        for provider_dir in self.providers.values():
-            for cache_file in provider_dir.glob("*.json"):
-                total_size += cache_file.stat().st_size
-        return total_size
+        return self._index_query("SELECT COALESCE(SUM(size), 0) FROM entries")[0][0]
 
     def _maybe_evict_old_entries(self):
         """Evict old entries if cache size exceeds limit"""
-        current_size_mb = self._calculate_cache_size() / (1024 * 1024)
-
-        if current_size_mb > self.config.max_size_mb:
-            # Get all cache files with timestamps
-            all_files = []
-            for provider_dir in self.providers.values():
-                for cache_file in provider_dir.glob("*.json"):
-                    all_files.append((cache_file, cache_file.stat().st_mtime))
-
-            # Sort by age (oldest first)
-            all_files.sort(key=lambda x: x[1])
-
-            # Remove oldest files until under limit
-            for cache_file, _ in all_files:
-                cache_file.unlink()
-                self.stats["evictions"] += 1
-
-                current_size_mb = self._calculate_cache_size() / (1024 * 1024)
-                if current_size_mb <= self.config.max_size_mb * 0.8:  # Leave 20% buffer
+        current_size = self._calculate_cache_size()
+        max_size = self.config.max_size_mb * 1024 * 1024
+
+        if current_size > max_size:
+            target_size = max_size * 0.8  # Leave 20% buffer
+
+            # Walk oldest first, tracking the running size instead of re-summing
+            evicted = []
+            for cache_key, rel_path, size in self._index_query(
+                "SELECT key, path, size FROM entries ORDER BY mtime"
+            ):
+                if current_size <= target_size:
                     break
+                evicted.append((cache_key, rel_path))
+                current_size -= size
+
+            self._remove_indexed(evicted)
+            self._record("evictions", count=len(evicted))
 
-            logger.info(f"Cache eviction completed. Size: {current_size_mb:.1f}MB")
+            logger.info("Cache eviction completed. Size: %.1fMB", current_size / (1024 * 1024))
 
 
 # Global cache instance
@@ -414,6 +912,20 @@ def cached_api_call(
     )
 
 
+def cached_api_call_many(
+    provider: str,
+    endpoint: str,
+    params_list: List[Dict[str, Any]],
+    api_function: Callable[[Dict[str, Any]], Any],
+    policy: CachePolicy = CachePolicy.INTRADAY,
+    force_refresh: bool = False,
+) -> List[Any]:
+    """Convenience function for bulk cached API calls"""
+    return get_api_cache().cached_api_call_many(
+        provider, endpoint, params_list, api_function, policy, force_refresh
+    )
+
+
 # CLI-style functions for cache management
 def clear_cache(provider: str = None):
     """Clear cache for provider or all"""
@@ -464,5 +976,16 @@ if __name__ == "__main__":
         CachePolicy.REAL_TIME,
     )
 
+    # Bulk lookup: duplicates collapse and misses are fetched in parallel
+    symbols = ["NVDA", "TSLA", "AMD", "INTC", "NVDA", "TSLA"]
+    quotes = cached_api_call_many(
+        "yfinance",
+        "get_quote",
+        [{"symbol": symbol} for symbol in symbols],
+        lambda params: {"symbol": params["symbol"], "price": 100.0},
+        CachePolicy.REAL_TIME,
+    )
+    print(f"Bulk quotes: {len(quotes)} results, {len(set(symbols))} unique symbols")
+
     print("\nCache Stats:")
     cache_stats()
@@ -4,8 +4,13 @@ Linux/WSL Development Environment
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 # Base Paths  
 PROJECT_ROOT = Path(__file__).parent.parent.parent.parent  # Go up to actual project root
 DATA_DIR = PROJECT_ROOT / "data"
@@ -28,6 +33,34 @@ API_RATE_LIMITS = {
     "reddit_requests_per_minute": 60,
 }
 
+# Shared HTTP connection pool settings (keepalive across Yahoo requests)
+HTTP_SESSION_CONFIG = {
+    "pool_connections": 8,
+    "pool_maxsize": 16,
+    "max_retries": 3,
+    "backoff_factor": 0.3,
+    "retry_status_codes": [429, 500, 502, 503, 504],
+}
+
+
+@lru_cache(maxsize=1)
+def get_http_session() -> requests.Session:
+    """Shared requests.Session so TCP/TLS connections are reused across calls"""
+    retry = Retry(
+        total=HTTP_SESSION_CONFIG["max_retries"],
+        backoff_factor=HTTP_SESSION_CONFIG["backoff_factor"],
+        status_forcelist=HTTP_SESSION_CONFIG["retry_status_codes"],
+    )
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_SESSION_CONFIG["pool_connections"],
+        pool_maxsize=HTTP_SESSION_CONFIG["pool_maxsize"],
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
 # Market Hours (Eastern Time)
 MARKET_HOURS = {
     "market_open": "09:30",
@@ -132,3 +165,29 @@ API_CONFIG = {
         "user_agent": os.getenv("REDDIT_USER_AGENT", "TradeScout/1.0"),
     },
 }
+
+# Single lookup table for section access via get()
+CONFIG = {
+    "database": DATABASE_CONFIG,
+    "api_rate_limits": API_RATE_LIMITS,
+    "http_session": HTTP_SESSION_CONFIG,
+    "market_hours": MARKET_HOURS,
+    "analysis": ANALYSIS_CONFIG,
+    "email": EMAIL_CONFIG,
+    "web": WEB_CONFIG,
+    "logging": LOGGING_CONFIG,
+    "cron_schedules": CRON_SCHEDULES,
+    "dev": DEV_CONFIG,
+    "api": API_CONFIG,
+}
+
+
+@lru_cache(maxsize=None)
+def get(key: str) -> dict:
+    """
+    Get a configuration section by name, e.g. get("analysis")["min_gap_percentage"]
+
+    Raises:
+        KeyError: If the section does not exist
+    """
+    return CONFIG[key]
@@ -21,7 +21,7 @@ try:
 except ImportError:
     logging.getLogger(__name__).warning("python-dotenv not installed, environment variables from .env will not be loaded")
 
-from .local_config import API_CONFIG
+from . import local_config
 from ..data_sources.multi_provider_coordinator import MultiProviderCoordinator
 from ..data_sources.asset_data_provider_yfinance import AssetDataProviderYFinance
 from ..data_sources.asset_data_provider_polygon import AssetDataProviderPolygon
@@ -43,7 +43,7 @@ class ProviderConfigManager:
     
     def __init__(self):
         """Initialize provider configuration manager"""
-        self.api_config = API_CONFIG
+        self.api_config = local_config.get("api")
     
     def get_available_providers(self) -> List[Tuple[str, dict, bool]]:
         """
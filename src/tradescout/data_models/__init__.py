@@ -14,13 +14,28 @@ from .domain_models_core import (
     Market,
     MarketSegment,
     PriceData,
+    PriceSeries,
+    PRICE_DTYPE,
     MarketQuote,
+    QuoteBatch,
+    QuoteArray,
     ExtendedHoursData,
     NewsItem,
+    NewsIndex,
     SocialSentiment,
     AssetType,
     MarketType,
     MarketStatus,
+    batch_clock,
+    Ticks,
+    from_ticks,
+    to_ticks,
+    ticks_to_decimal,
+    float_to_decimal,
+    segment_bit,
+    weekday_mask,
+    WEEKDAYS,
+    ALL_DAYS,
 )
 
 # Analysis models
@@ -30,6 +45,14 @@ from .domain_models_analysis import (
     PerformanceMetrics,
     MarketEvent,
     TechnicalIndicators,
+    TechnicalIndicatorsBatch,
+    GapMomentumResult,
+    VolumeMomentumResult,
+    NewsMomentumResult,
+    NewsFeatures,
+    MomentumFeatures,
+    SuggestionInput,
+    NewsCatalystBatch,
     TradeSide,
     TradeStatus,
     ConfidenceLevel,
@@ -0,0 +1,61 @@
+"""
+Numeric kernels for domain model calculations
+
+Float-typed helpers behind the gap, quote and sentiment metrics. They are
+JIT-compiled with numba when it is installed and run as plain Python/NumPy
+otherwise, so numba stays an optional speed-up rather than a dependency.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(fastmath=True, cache=True)
+def gap_metrics(price, ref):
+    """Return (amount, percent) for a price relative to a reference price"""
+    amount = price - ref
+    if ref > 0:
+        return amount, amount * 100.0 / ref
+    return amount, 0.0
+
+
+@njit(fastmath=True, cache=True)
+def bullish_ratio(bullish, total):
+    """Share of bullish mentions, 0.0 when there are no mentions"""
+    if total == 0:
+        return 0.0
+    return bullish / total
+
+
+@njit(fastmath=True, cache=True)
+def sentiment_bucket(score):
+    """Bucket a sentiment score: 2 strong, 1 moderate, 0 weak"""
+    abs_score = abs(score)
+    if abs_score > 0.6:
+        return 2
+    if abs_score > 0.3:
+        return 1
+    return 0
+
+
+def gap_metrics_vec(prices, refs):
+    """Vectorized gap_metrics over parallel arrays"""
+    prices = np.asarray(prices, dtype=np.float64)
+    refs = np.asarray(refs, dtype=np.float64)
+    amounts = prices - refs
+    percents = np.zeros_like(amounts)
+    np.divide(amounts * 100.0, refs, out=percents, where=refs > 0)
+    return amounts, percents
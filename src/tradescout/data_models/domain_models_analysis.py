@@ -9,10 +9,12 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
 import uuid
 
-from .domain_models_core import Asset
+import numpy as np
+
+from .domain_models_core import _SLOTS, Asset, NewsItem, SocialSentiment
 
 
 class TradeSide(Enum):
@@ -68,7 +70,7 @@ class GapRiskLevel(Enum):
     EXTREME = "extreme"  # Avoid - manipulation/thin volume risk
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class TechnicalIndicators:
     """Technical analysis indicators for an asset"""
 
@@ -117,6 +119,261 @@ class TechnicalIndicators:
         )
 
 
+@dataclass(**_SLOTS)
+class TechnicalIndicatorsBatch:
+    """Indicator series for many symbols, each an (n_symbols, n_bars) array
+
+    Rows follow the input price matrices; NaN marks warm-up and padding.
+    """
+
+    rsi: np.ndarray
+    macd_line: np.ndarray
+    macd_signal: np.ndarray
+    atr: np.ndarray
+    sma_fast: np.ndarray  # 20-bar SMA
+    sma_slow: np.ndarray  # 50-bar SMA
+    volume_ratio: np.ndarray  # volume over its 20-bar SMA
+
+    def __len__(self) -> int:
+        return self.rsi.shape[0]
+
+    def latest(self) -> Dict[str, np.ndarray]:
+        """Last-bar value of every indicator, one (n_symbols,) array each"""
+        return {
+            "rsi": self.rsi[:, -1],
+            "macd_line": self.macd_line[:, -1],
+            "macd_signal": self.macd_signal[:, -1],
+            "atr": self.atr[:, -1],
+            "sma_fast": self.sma_fast[:, -1],
+            "sma_slow": self.sma_slow[:, -1],
+            "volume_ratio": self.volume_ratio[:, -1],
+        }
+
+
+@dataclass(frozen=True, **_SLOTS)
+class GapMomentumResult:
+    """Gap momentum for one asset; direction is 1 up, -1 down, 0 flat"""
+
+    gap_pct: float
+    strength: float  # 0.0 to 1.0
+    direction: int
+    confidence: float  # 0.0 to 1.0
+
+
+@dataclass(frozen=True, **_SLOTS)
+class VolumeMomentumResult:
+    """Volume momentum relative to recent average volume"""
+
+    volume_ratio: float
+    strength: float  # 0.0 to 1.0
+    is_surge: bool
+    confidence: float  # 0.0 to 1.0
+
+
+@dataclass(frozen=True, **_SLOTS)
+class NewsMomentumResult:
+    """News and social sentiment momentum"""
+
+    news_count: int
+    sentiment: float  # -1.0 to 1.0
+    strength: float  # 0.0 to 1.0
+    confidence: float  # 0.0 to 1.0
+
+
+# NewsItem.category values that count as catalysts, one bit each
+NEWS_CATALYST_BITS: Dict[str, int] = {
+    "earnings": 1 << 0,
+    "merger": 1 << 1,
+    "regulatory": 1 << 2,
+    "guidance": 1 << 3,
+    "analyst": 1 << 4,
+    "product": 1 << 5,
+}
+
+NEWS_FEATURES_DTYPE = np.dtype(
+    [
+        ("headline_count", np.int32),
+        ("sentiment_count", np.int32),
+        ("avg_sentiment", np.float64),
+        ("max_relevance", np.float64),
+        ("catalyst_flags", np.int64),
+    ]
+)
+
+
+@dataclass(frozen=True, **_SLOTS)
+class NewsFeatures:
+    """News and social sentiment for one symbol, aggregated at ingestion
+
+    Built once per symbol with ``from_news`` so momentum analysis reads a
+    handful of numbers instead of re-walking NewsItem objects on every pass.
+    """
+
+    headline_count: int = 0
+    sentiment_count: int = 0  # news items with a score, plus social sentiment
+    avg_sentiment: float = 0.0  # -1.0 to 1.0, 0.0 when nothing is scored
+    max_relevance: float = 0.0  # highest impact_score, 0.0 to 1.0
+    catalyst_flags: int = 0  # OR of NEWS_CATALYST_BITS
+
+    @classmethod
+    def from_news(
+        cls, news: Iterable[NewsItem], sentiment: Optional[SocialSentiment] = None
+    ) -> "NewsFeatures":
+        count = 0
+        scores = []
+        relevance = 0.0
+        flags = 0
+        for item in news:
+            count += 1
+            if item.sentiment_score is not None:
+                scores.append(float(item.sentiment_score))
+            if item.impact_score is not None:
+                relevance = max(relevance, float(item.impact_score))
+            flags |= NEWS_CATALYST_BITS.get(item.category, 0)
+        if sentiment is not None:
+            scores.append(float(sentiment.sentiment_score))
+        return cls(
+            headline_count=count,
+            sentiment_count=len(scores),
+            avg_sentiment=sum(scores) / len(scores) if scores else 0.0,
+            max_relevance=relevance,
+            catalyst_flags=flags,
+        )
+
+    @staticmethod
+    def to_array(features: Sequence["NewsFeatures"]) -> np.ndarray:
+        """Stack into a NEWS_FEATURES_DTYPE structured array, one row each"""
+        return np.array(
+            [
+                (
+                    f.headline_count,
+                    f.sentiment_count,
+                    f.avg_sentiment,
+                    f.max_relevance,
+                    f.catalyst_flags,
+                )
+                for f in features
+            ],
+            dtype=NEWS_FEATURES_DTYPE,
+        )
+
+
+def _float_or_nan(value) -> float:
+    return np.nan if value is None else float(value)
+
+
+@dataclass(frozen=True, **_SLOTS)
+class MomentumFeatures:
+    """Numeric inputs to momentum scoring and suggestion sizing
+
+    All fields are plain floats with NaN for "not available", so they unpack
+    straight into compiled scoring kernels without any object handling.
+    """
+
+    gap_pct: float
+    volume_ratio: float
+    news_score: float = 0.0  # news strength in the gap direction, 0.0 to 1.0
+    rsi: float = np.nan
+    macd: float = np.nan
+    macd_signal: float = np.nan
+    atr: float = np.nan
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, object]) -> "MomentumFeatures":
+        """Build from a legacy analysis dict; "gap_percent" is accepted too"""
+        gap_pct = data.get("gap_pct", data.get("gap_percent"))
+        return cls(
+            gap_pct=_float_or_nan(gap_pct),
+            volume_ratio=_float_or_nan(data.get("volume_ratio")),
+            news_score=float(data.get("news_score") or 0.0),
+            rsi=_float_or_nan(data.get("rsi")),
+            macd=_float_or_nan(data.get("macd")),
+            macd_signal=_float_or_nan(data.get("macd_signal")),
+            atr=_float_or_nan(data.get("atr")),
+        )
+
+
+@dataclass(frozen=True, **_SLOTS)
+class SuggestionInput:
+    """Everything SuggestionEngine.generate_suggestion needs for one symbol"""
+
+    asset: Asset
+    entry_price: float
+    momentum_score: float
+    features: MomentumFeatures
+    side: Optional[TradeSide] = None  # None: short a gap down, else long
+    volume_surge: bool = False
+    news_catalyst: bool = False
+    technical_setup: bool = False
+    supporting_factors: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, object]) -> "SuggestionInput":
+        """Build from a legacy analysis dict of the same keys plus features"""
+        return cls(
+            asset=data.get("asset"),
+            entry_price=_float_or_nan(data.get("entry_price")),
+            momentum_score=float(data.get("momentum_score") or 0.0),
+            features=MomentumFeatures.from_dict(data),
+            side=data.get("side"),
+            volume_surge=bool(data.get("volume_surge", False)),
+            news_catalyst=bool(data.get("news_catalyst", False)),
+            technical_setup=bool(data.get("technical_setup", False)),
+            supporting_factors=tuple(data.get("supporting_factors", ())),
+        )
+
+
+@dataclass(**_SLOTS)
+class NewsCatalystBatch:
+    """Flat (symbol, news item) rows for catalyst scans
+
+    Parallel arrays with one row per scanned symbol a news item mentions, so
+    age and sentiment filters are single vector ops. Missing sentiment is NaN.
+    """
+
+    symbols: np.ndarray  # object
+    ts_ns: np.ndarray  # int64, news timestamp in ns
+    sentiment: np.ndarray  # float32
+    news_refs: np.ndarray  # object, the NewsItem for each row
+
+    @classmethod
+    def empty(cls) -> "NewsCatalystBatch":
+        return cls(
+            symbols=np.empty(0, dtype=object),
+            ts_ns=np.empty(0, dtype=np.int64),
+            sentiment=np.empty(0, dtype=np.float32),
+            news_refs=np.empty(0, dtype=object),
+        )
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def select(self, mask: np.ndarray) -> "NewsCatalystBatch":
+        """Rows where mask (boolean or index array) selects"""
+        return NewsCatalystBatch(
+            symbols=self.symbols[mask],
+            ts_ns=self.ts_ns[mask],
+            sentiment=self.sentiment[mask],
+            news_refs=self.news_refs[mask],
+        )
+
+    def since(self, cutoff_ns: int) -> "NewsCatalystBatch":
+        """Rows published at or after cutoff_ns"""
+        return self.select(self.ts_ns >= cutoff_ns)
+
+    def group_by_symbol(self) -> List[Tuple[str, List[NewsItem]]]:
+        """(symbol, news items) pairs, most covered symbol first"""
+        if not len(self):
+            return []
+        names, inverse, counts = np.unique(
+            self.symbols.astype(str), return_inverse=True, return_counts=True
+        )
+        rows = np.argsort(inverse, kind="stable")
+        groups = np.split(self.news_refs[rows], np.cumsum(counts)[:-1])
+        order = np.argsort(-counts, kind="stable")
+        return [(str(names[g]), groups[g].tolist()) for g in order]
+
+
 @dataclass
 class TradeSuggestion:
     """Trade suggestion generated by analysis engine"""
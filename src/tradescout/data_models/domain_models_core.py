@@ -5,12 +5,112 @@ Core domain entities that properly model the financial markets.
 These represent the real-world concepts we're working with.
 """
 
-from dataclasses import dataclass, field
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import InitVar, dataclass, field
 from datetime import datetime, time
 from decimal import Decimal
-from enum import Enum
-from typing import Dict, List, Optional, Set
+from enum import Enum, IntEnum
+from typing import (
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+import itertools
+import sys
+import threading
 import uuid
+import weakref
+from zoneinfo import ZoneInfo
+
+import numpy as np
+
+from ._kernels import bullish_ratio, gap_metrics, sentiment_bucket
+
+# Slotted dataclasses drop the per-instance __dict__ (Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+# Weakly referenceable slotted dataclasses need weakref_slot (Python 3.11+)
+_WEAKREF_SLOTS = (
+    {"slots": True, "weakref_slot": True} if sys.version_info >= (3, 11) else {}
+)
+
+# Prices and sizes on the hot path are fixed-point ints of 1e-8 units
+TICK_SCALE = 10**8
+
+
+class Ticks(int):
+    """An int already in fixed-point ticks, passed through by to_ticks"""
+
+    __slots__ = ()
+
+
+def from_ticks(ticks: int) -> Ticks:
+    """Mark a raw tick count so constructors don't rescale it"""
+    return Ticks(ticks)
+
+
+def to_ticks(value: Union[int, Decimal, float, str]) -> Ticks:
+    """Convert a price/size in whole units to fixed-point ticks
+
+    Plain ints are whole units like any other number (1 share is 1e8 ticks);
+    only Ticks values, e.g. from ``from_ticks``, are taken as ticks already.
+    The result is Ticks, so converting a stored value again is a no-op.
+    """
+    if isinstance(value, Ticks):
+        return value
+    return Ticks((Decimal(str(value)) * TICK_SCALE).to_integral_value())
+
+
+def ticks_to_decimal(ticks: int) -> Decimal:
+    """Convert fixed-point ticks back to an exact Decimal for display/storage"""
+    return Decimal(ticks).scaleb(-8).normalize()
+
+
+def float_to_decimal(value: float, places: int = 8) -> Decimal:
+    """Quantize a float64 result to a Decimal for display/storage only"""
+    return Decimal(f"{value:.{places}f}")
+
+
+# Weekday bitmasks for Market.trading_days (bit 0 = Monday)
+WEEKDAYS = 0b0011111
+ALL_DAYS = 0b1111111
+
+
+def weekday_mask(days) -> int:
+    """Pack weekday numbers (0=Monday) into a trading-days bitmask"""
+    mask = 0
+    for day in days:
+        mask |= 1 << day
+    return mask
+
+
+_batch_now: ContextVar[Optional[datetime]] = ContextVar("batch_now", default=None)
+
+
+def _now() -> datetime:
+    """Current time, or the shared timestamp inside batch_clock()"""
+    return _batch_now.get() or datetime.now()
+
+
+@contextmanager
+def batch_clock(now: Optional[datetime] = None) -> Iterator[datetime]:
+    """Stamp every model created in the block with one shared timestamp
+
+    Example:
+        with batch_clock():
+            assets = [factory.create_apple(), factory.create_tesla()]
+    """
+    token = _batch_now.set(now or datetime.now())
+    try:
+        yield _batch_now.get()
+    finally:
+        _batch_now.reset(token)
 
 
 class MarketType(Enum):
@@ -24,14 +124,30 @@ class MarketType(Enum):
     COMMODITY = "commodity"
 
 
-class MarketStatus(Enum):
-    """Current market status"""
+class MarketStatus(IntEnum):
+    """Current market status
 
-    CLOSED = "closed"
-    PRE_MARKET = "pre_market"
-    OPEN = "open"
-    AFTER_HOURS = "after_hours"
-    HOLIDAY = "holiday"
+    Integer-valued so session comparisons and dict lookups are plain int
+    operations; use ``label`` for the display/storage string.
+    """
+
+    OPEN = 0
+    PRE_MARKET = 1
+    AFTER_HOURS = 2
+    CLOSED = 3
+    HOLIDAY = 4
+
+    @property
+    def label(self) -> str:
+        """Lowercase name, e.g. "pre_market" (the former string value)"""
+        return self.name.lower()
+
+    @classmethod
+    def _missing_(cls, value):
+        """Accept labels so rows stored before the IntEnum switch still load"""
+        if isinstance(value, str):
+            return cls.__members__.get(value.upper())
+        return None
 
 
 class AssetType(Enum):
@@ -49,7 +165,13 @@ class AssetType(Enum):
     COMMODITY = "commodity"
 
 
-@dataclass
+def _time_of_day_us(moment: Union[time, datetime]) -> int:
+    """Microseconds since midnight, so session checks are int compares"""
+    seconds = (moment.hour * 60 + moment.minute) * 60 + moment.second
+    return seconds * 1_000_000 + moment.microsecond
+
+
+@dataclass(**_SLOTS)
 class Market:
     """Represents a financial market/exchange"""
 
@@ -66,23 +188,110 @@ class Market:
     after_hours_end: Optional[time] = None  # e.g., 20:00:00
 
     # Market characteristics
-    min_tick_size: Decimal = Decimal("0.01")
+    min_tick_size: int = to_ticks(Decimal("0.01"))  # units accepted, see to_ticks
     lot_size: int = 1
-    trading_days: Set[int] = field(default_factory=lambda: {0, 1, 2, 3, 4})  # Mon-Fri
+    trading_days: int = WEEKDAYS  # bit n set = weekday n trades; sets accepted
+
+    _registry: ClassVar[Dict[str, "Market"]] = {}
+
+    # Pre-market start, open, close and after-hours end as microseconds of day
+    _session_bounds: Tuple[int, int, int, int] = field(
+        default=(0, 0, 0, 0), init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        """Intern the id and normalize tick size, trading days and hours"""
+        self.id = sys.intern(self.id)
+        self.min_tick_size = to_ticks(self.min_tick_size)
+        if not isinstance(self.trading_days, int):
+            self.trading_days = weekday_mask(self.trading_days)
+        self._session_bounds = (
+            _time_of_day_us(self.pre_market_start or self.regular_open),
+            _time_of_day_us(self.regular_open),
+            _time_of_day_us(self.regular_close),
+            _time_of_day_us(self.after_hours_end or self.regular_close),
+        )
+
+    @property
+    def min_tick_size_decimal(self) -> Decimal:
+        """Minimum tick size as an exact Decimal"""
+        return ticks_to_decimal(self.min_tick_size)
+
+    @classmethod
+    def get_or_create(cls, id: str, **kwargs) -> "Market":
+        """Return the shared Market for an id, creating it on first use
+
+        Interned markets are shared by every asset that trades on them, so
+        treat them as read-only once registered.
+        """
+        market = cls._registry.get(id)
+        if market is None:
+            market = cls._registry.setdefault(id, cls(id=id, **kwargs))
+        return market
 
     def get_current_status(self) -> MarketStatus:
         """Determine current market status based on time"""
-        # Implementation would check current time against trading hours
-        pass
+        return self.session_at(datetime.now(ZoneInfo(self.timezone)))
+
+    def session_at(self, moment: datetime) -> MarketStatus:
+        """Session for a wall-clock time in the market's timezone
+
+        Holidays are not tracked here; non-trading weekdays report CLOSED.
+        """
+        if not self.is_trading_day(moment):
+            return MarketStatus.CLOSED
+        now = _time_of_day_us(moment)
+        pre_start, open_, close, post_end = self._session_bounds
+        if open_ <= now < close:
+            return MarketStatus.OPEN
+        if pre_start <= now < open_:
+            return MarketStatus.PRE_MARKET
+        if close <= now < post_end:
+            return MarketStatus.AFTER_HOURS
+        return MarketStatus.CLOSED
 
     def is_trading_day(self, date: datetime) -> bool:
         """Check if given date is a trading day"""
-        return date.weekday() in self.trading_days
+        return bool(self.trading_days & (1 << date.weekday()))
+
+
+# Each segment id gets one bit so asset membership is a single AND
+_SEGMENT_BITS: Dict[str, int] = {}
+_segment_bits_lock = threading.Lock()
+
+# Display order of segment types, broadest classification first; unknown
+# types sort after these, alphabetically
+_SEGMENT_TYPE_ORDER: Dict[str, int] = {
+    "sector": 0,
+    "industry": 1,
+    "sub_industry": 2,
+    "index": 3,
+    "size": 4,
+    "style": 5,
+}
 
 
-@dataclass(frozen=True)
+def _segment_sort_key(segment: "MarketSegment") -> Tuple[int, str, str]:
+    rank = _SEGMENT_TYPE_ORDER.get(segment.segment_type, len(_SEGMENT_TYPE_ORDER))
+    return rank, segment.segment_type, segment.id
+
+
+def segment_bit(segment_id: str) -> int:
+    """Bit assigned to a segment id, allocating the next free bit if new"""
+    bit = _SEGMENT_BITS.get(segment_id)
+    if bit is None:
+        with _segment_bits_lock:
+            bit = _SEGMENT_BITS.setdefault(segment_id, 1 << len(_SEGMENT_BITS))
+    return bit
+
+
+@dataclass(frozen=True, **_WEAKREF_SLOTS)
 class MarketSegment:
-    """Market segments/sectors for classification"""
+    """Market segments/sectors for classification
+
+    Segments are flyweights: build them with ``get_or_create`` so every asset
+    in a universe shares one instance per id.
+    """
 
     id: str  # e.g., "technology", "healthcare", "sp500"
     name: str  # e.g., "Technology", "S&P 500"
@@ -90,18 +299,42 @@ class MarketSegment:
     segment_type: str  # "sector", "industry", "index", "size", "style"
     parent_segment: Optional["MarketSegment"] = None
 
+    bit: int = field(default=0, init=False, repr=False, compare=False)
+    _hierarchy: Tuple[str, ...] = field(
+        default=(), init=False, repr=False, compare=False
+    )
+
+    _registry: ClassVar["weakref.WeakValueDictionary[str, MarketSegment]"] = (
+        weakref.WeakValueDictionary()
+    )
+
+    @classmethod
+    def get_or_create(cls, id: str, **kwargs) -> "MarketSegment":
+        """Return the shared segment for an id, creating it on first use
+
+        Segments stay registered only while something references them; the
+        first definition for an id wins.
+        """
+        segment = cls._registry.get(id)
+        if segment is None:
+            segment = cls(id=id, **kwargs)
+            cls._registry[id] = segment
+        return segment
+
+    def __post_init__(self):
+        """Cache the hierarchy (built on the parent's) and assign the bit"""
+        parent = self.parent_segment
+        hierarchy = (parent.full_hierarchy if parent else ()) + (self.name,)
+        object.__setattr__(self, "_hierarchy", hierarchy)
+        object.__setattr__(self, "bit", segment_bit(self.id))
+
     @property
-    def full_hierarchy(self) -> List[str]:
-        """Get full segment hierarchy"""
-        hierarchy = [self.name]
-        current = self.parent_segment
-        while current:
-            hierarchy.insert(0, current.name)
-            current = current.parent_segment
-        return hierarchy
+    def full_hierarchy(self) -> Tuple[str, ...]:
+        """Get full segment hierarchy, root first"""
+        return self._hierarchy
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Asset:
     """Core financial asset/instrument"""
 
@@ -115,50 +348,113 @@ class Asset:
     isin: Optional[str] = None  # International Securities ID
     cusip: Optional[str] = None  # US securities ID
 
-    # Classification
-    segments: Set[MarketSegment] = field(default_factory=set)
+    # Classification (any iterable accepted; stored as a duplicate-free tuple)
+    segments: Tuple[MarketSegment, ...] = ()
 
     # Trading characteristics
     is_active: bool = True
-    min_order_size: Decimal = Decimal("1")
-    tick_size: Optional[Decimal] = None  # Override market default if needed
+    min_order_size: int = to_ticks(Decimal("1"))  # units accepted, see to_ticks
+    tick_size: Optional[int] = None  # Override market default if needed
 
     # Corporate data (for stocks)
     shares_outstanding: Optional[int] = None
     market_cap: Optional[Decimal] = None
 
     # Metadata
-    created_at: datetime = field(default_factory=datetime.now)
-    updated_at: datetime = field(default_factory=datetime.now)
+    created_at: datetime = field(default_factory=_now)
+    updated_at: datetime = field(default_factory=_now)
+
+    _qualified: str = field(default="", init=False, repr=False, compare=False)
+
+    # Segment lookups derived from segments; kept in sync by add/remove_segment
+    _primary_segment: Optional[MarketSegment] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    segment_mask: int = field(default=0, init=False, repr=False, compare=False)
+    _segments_by_type: Tuple[MarketSegment, ...] = field(
+        default=(), init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         """Validate asset data"""
-        if not self.tick_size:
+        self.min_order_size = to_ticks(self.min_order_size)
+        if self.tick_size:
+            self.tick_size = to_ticks(self.tick_size)
+        else:
             self.tick_size = self.market.min_tick_size
         if not self.currency:
             self.currency = self.market.currency
+        self.symbol = sys.intern(self.symbol)
+        self._qualified = sys.intern(f"{self.symbol}:{self.market.id}")
+        self._index_segments(self.segments)
+
+    def _index_segments(self, segments):
+        """Store segments as a tuple and rebuild the segment lookups
+
+        Duplicates are dropped by segment bit, so membership never hashes a
+        MarketSegment. A duplicate-free tuple is kept as-is (and shared).
+        """
+        mask = 0
+        unique = []
+        for segment in segments:
+            if not mask & segment.bit:
+                mask |= segment.bit
+                unique.append(segment)
+        if not isinstance(segments, tuple) or len(unique) != len(segments):
+            segments = tuple(unique)
+        self.segments = segments
+        self.segment_mask = mask
+        self._segments_by_type = tuple(sorted(self.segments, key=_segment_sort_key))
+        first = self._segments_by_type[0] if self._segments_by_type else None
+        self._primary_segment = (
+            first if first is not None and first.segment_type == "sector" else None
+        )
+
+    def add_segment(self, segment: MarketSegment):
+        """Add the asset to a market segment"""
+        if not self.segment_mask & segment.bit:
+            self._index_segments(self.segments + (segment,))
+
+    def remove_segment(self, segment: MarketSegment):
+        """Remove the asset from a market segment"""
+        self._index_segments(s for s in self.segments if s.bit != segment.bit)
+
+    @property
+    def tick_size_decimal(self) -> Decimal:
+        """Tick size as an exact Decimal"""
+        return ticks_to_decimal(self.tick_size)
+
+    @property
+    def min_order_size_decimal(self) -> Decimal:
+        """Minimum order size as an exact Decimal"""
+        return ticks_to_decimal(self.min_order_size)
 
     @property
     def qualified_symbol(self) -> str:
         """Get fully qualified symbol with market"""
-        return f"{self.symbol}:{self.market.id}"
+        return self._qualified
 
     @property
     def primary_segment(self) -> Optional[MarketSegment]:
         """Get primary market segment (sector)"""
-        sector_segments = [s for s in self.segments if s.segment_type == "sector"]
-        return sector_segments[0] if sector_segments else None
+        return self._primary_segment
+
+    @property
+    def segments_by_type(self) -> Tuple[MarketSegment, ...]:
+        """Segments ordered sector, industry, sub-industry, index, size, style"""
+        return self._segments_by_type
 
     def is_in_segment(self, segment_id: str) -> bool:
         """Check if asset belongs to a market segment"""
-        return any(s.id == segment_id for s in self.segments)
+        bit = _SEGMENT_BITS.get(segment_id)
+        return bit is not None and self.segment_mask & bit != 0
 
     def __str__(self) -> str:
         """String representation of asset"""
         return f"{self.symbol} ({self.name})"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class PriceData:
     """Price and volume data for an asset at a specific time"""
 
@@ -203,9 +499,183 @@ class PriceData:
         return None
 
 
-@dataclass
+# One packed row per price observation; missing prices are NaN, sizes 0
+PRICE_DTYPE = np.dtype(
+    [
+        ("ts", "i8"),  # nanoseconds since the epoch
+        ("price", "f8"),
+        ("volume", "i8"),
+        ("open", "f8"),
+        ("high", "f8"),
+        ("low", "f8"),
+        ("bid", "f8"),
+        ("ask", "f8"),
+        ("bid_size", "i4"),
+        ("ask_size", "i4"),
+        ("session", "u1"),  # MarketStatus value
+        ("quality", "u1"),  # index into DATA_QUALITY_CODES
+    ]
+)
+DATA_QUALITY_CODES = ("good", "stale", "estimated")
+
+
+def _optional_float(value) -> float:
+    return np.nan if value is None else float(value)
+
+
+def _optional_decimal(value: float) -> Optional[Decimal]:
+    return None if np.isnan(value) else Decimal(str(value))
+
+
+class PriceSeries:
+    """Column-oriented price history for one asset
+
+    Stores rows in a PRICE_DTYPE structured array instead of one PriceData
+    object per observation. Column properties return views, not copies.
+    This is the bulk form for historical quotes: load rows straight into
+    ``data`` and materialize PriceData/MarketQuote objects only when needed.
+    """
+
+    def __init__(self, asset: Asset, data: np.ndarray, data_source: str = "unknown"):
+        if data.dtype != PRICE_DTYPE:
+            raise ValueError(
+                f"PriceSeries data must use PRICE_DTYPE, got {data.dtype}"
+            )
+        self.asset = asset
+        self.data = data
+        self.data_source = data_source
+
+    @classmethod
+    def from_price_data(cls, asset: Asset, rows: List[PriceData]) -> "PriceSeries":
+        """Pack PriceData objects into a series"""
+        data = np.empty(len(rows), dtype=PRICE_DTYPE)
+        for i, row in enumerate(rows):
+            data[i] = (
+                round(row.timestamp.timestamp() * 1e6) * 1000,
+                float(row.price),
+                row.volume,
+                _optional_float(row.open_price),
+                _optional_float(row.high_price),
+                _optional_float(row.low_price),
+                _optional_float(row.bid_price),
+                _optional_float(row.ask_price),
+                row.bid_size or 0,
+                row.ask_size or 0,
+                row.session_type,
+                DATA_QUALITY_CODES.index(row.data_quality),
+            )
+        data_source = rows[0].data_source if rows else "unknown"
+        return cls(asset, data, data_source)
+
+    @classmethod
+    def from_quotes(cls, quotes: List["MarketQuote"]) -> "PriceSeries":
+        """Pack the price data of historical quotes, oldest first"""
+        if not quotes:
+            raise ValueError("PriceSeries.from_quotes needs at least one quote")
+        return cls.from_price_data(quotes[0].asset, [q.price_data for q in quotes])
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, index):
+        """Row record (or sliced array) viewing the underlying storage"""
+        return self.data[index]
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        return self.data["ts"]
+
+    @property
+    def prices(self) -> np.ndarray:
+        return self.data["price"]
+
+    @property
+    def volumes(self) -> np.ndarray:
+        return self.data["volume"]
+
+    @property
+    def opens(self) -> np.ndarray:
+        return self.data["open"]
+
+    @property
+    def highs(self) -> np.ndarray:
+        return self.data["high"]
+
+    @property
+    def lows(self) -> np.ndarray:
+        return self.data["low"]
+
+    @property
+    def complete_bars(self) -> np.ndarray:
+        """Boolean mask of rows with full OHLC data"""
+        ohlc = np.column_stack(
+            (self.data["open"], self.data["high"], self.data["low"], self.data["price"])
+        )
+        return np.all(~np.isnan(ohlc), axis=1)
+
+    @property
+    def spreads(self) -> np.ndarray:
+        """Ask minus bid per row (NaN where either side is missing)"""
+        return self.data["ask"] - self.data["bid"]
+
+    def to_price_data(self, index: int) -> PriceData:
+        """Materialize a single row as a PriceData object"""
+        row = self.data[index]
+        return PriceData(
+            asset=self.asset,
+            timestamp=datetime.fromtimestamp(int(row["ts"]) / 1e9),
+            price=Decimal(str(float(row["price"]))),
+            volume=int(row["volume"]),
+            open_price=_optional_decimal(row["open"]),
+            high_price=_optional_decimal(row["high"]),
+            low_price=_optional_decimal(row["low"]),
+            session_type=MarketStatus(int(row["session"])),
+            bid_price=_optional_decimal(row["bid"]),
+            ask_price=_optional_decimal(row["ask"]),
+            bid_size=int(row["bid_size"]) or None,
+            ask_size=int(row["ask_size"]) or None,
+            data_source=self.data_source,
+            data_quality=DATA_QUALITY_CODES[int(row["quality"])],
+        )
+
+    def to_quote(self, index: int) -> "MarketQuote":
+        """Materialize a row as a MarketQuote, using the prior row as close"""
+        index = range(len(self.data))[index]
+        previous_close = None
+        if index > 0:
+            previous_close = Decimal(str(float(self.data["price"][index - 1])))
+        return MarketQuote(
+            asset=self.asset,
+            price_data=self.to_price_data(index),
+            previous_close=previous_close,
+        )
+
+    def to_quote_array(self) -> "QuoteArray":
+        """Contiguous float64 OHLCV columns for technical analysis"""
+        return QuoteArray(
+            open=np.ascontiguousarray(self.data["open"]),
+            high=np.ascontiguousarray(self.data["high"]),
+            low=np.ascontiguousarray(self.data["low"]),
+            close=np.ascontiguousarray(self.data["price"]),
+            volume=self.data["volume"].astype(np.float64),
+            timestamp_ns=np.ascontiguousarray(self.data["ts"]),
+            asset=self.asset,
+        )
+
+
+@dataclass(**_SLOTS)
 class MarketQuote:
-    """Current market quote - uses Asset and extends with market data"""
+    """Current market quote - uses Asset and extends with market data
+
+    Derived metrics are computed with native floats by default, which is much
+    cheaper than Decimal arithmetic when building thousands of quotes per
+    tick. Pass ``exact=True`` (or clear ``USE_FLOAT_MATH``) for audit-grade
+    Decimal results.
+    """
+
+    USE_FLOAT_MATH: ClassVar[bool] = True
+    GAP_THRESHOLD_PERCENT: ClassVar[float] = 1.0
+    VOLUME_SURGE_RATIO: ClassVar[float] = 2.0
 
     asset: Asset
     price_data: PriceData
@@ -215,12 +685,47 @@ class MarketQuote:
     average_volume: Optional[int] = None
 
     # Calculated fields
-    price_change: Optional[Decimal] = field(init=False, default=None)
-    price_change_percent: Optional[Decimal] = field(init=False, default=None)
-    volume_ratio: Optional[Decimal] = field(init=False, default=None)
-
-    def __post_init__(self):
+    price_change: Optional[Union[float, Decimal]] = field(init=False, default=None)
+    price_change_percent: Optional[Union[float, Decimal]] = field(
+        init=False, default=None
+    )
+    volume_ratio: Optional[Union[float, Decimal]] = field(init=False, default=None)
+
+    # Threshold flags, fixed at construction from the class thresholds
+    is_gap_up: bool = field(init=False, default=False, repr=False, compare=False)
+    is_gap_down: bool = field(init=False, default=False, repr=False, compare=False)
+    has_volume_surge: bool = field(
+        init=False, default=False, repr=False, compare=False
+    )
+
+    exact: InitVar[bool] = False
+
+    def __post_init__(self, exact: bool):
         """Calculate derived fields"""
+        if exact or not self.USE_FLOAT_MATH:
+            self._calculate_exact()
+        else:
+            previous_close = (
+                float(self.previous_close) if self.previous_close else 0.0
+            )
+            if previous_close > 0:
+                self.price_change, self.price_change_percent = gap_metrics(
+                    float(self.price_data.price), previous_close
+                )
+            if self.average_volume and self.average_volume > 0:
+                self.volume_ratio = self.price_data.volume / self.average_volume
+
+        pct = self.price_change_percent
+        if pct is not None:
+            self.is_gap_up = pct > self.GAP_THRESHOLD_PERCENT
+            self.is_gap_down = pct < -self.GAP_THRESHOLD_PERCENT
+        self.has_volume_surge = (
+            self.volume_ratio is not None
+            and self.volume_ratio > self.VOLUME_SURGE_RATIO
+        )
+
+    def _calculate_exact(self):
+        """Calculate derived fields with Decimal arithmetic"""
         if self.previous_close and self.previous_close > 0:
             self.price_change = self.price_data.price - self.previous_close
             self.price_change_percent = (self.price_change / self.previous_close) * 100
@@ -230,25 +735,192 @@ class MarketQuote:
                 self.average_volume
             )
 
-    @property
-    def is_gap_up(self) -> bool:
-        """Check if price gapped up significantly"""
-        return self.price_change_percent is not None and self.price_change_percent > 1.0
+    def as_decimals(self) -> Dict[str, Optional[Decimal]]:
+        """Derived metrics converted to Decimal for callers needing exact types"""
+        return {
+            name: None if value is None else Decimal(str(value))
+            for name, value in (
+                ("price_change", self.price_change),
+                ("price_change_percent", self.price_change_percent),
+                ("volume_ratio", self.volume_ratio),
+            )
+        }
 
-    @property
-    def is_gap_down(self) -> bool:
-        """Check if price gapped down significantly"""
+    @staticmethod
+    def gap_masks(
+        pct_change: np.ndarray, vol_ratio: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Vectorized is_gap_up / is_gap_down / has_volume_surge
+
+        NaN entries (no reference data) are False in every mask.
+        """
+        threshold = MarketQuote.GAP_THRESHOLD_PERCENT
         return (
-            self.price_change_percent is not None and self.price_change_percent < -1.0
+            pct_change > threshold,
+            pct_change < -threshold,
+            vol_ratio > MarketQuote.VOLUME_SURGE_RATIO,
         )
 
-    @property
-    def has_volume_surge(self) -> bool:
-        """Check if volume is significantly above average"""
-        return self.volume_ratio is not None and self.volume_ratio > 2.0
+    @classmethod
+    def from_arrays(
+        cls,
+        prices,
+        prev_closes,
+        volumes,
+        avg_volumes,
+        assets: Optional[List[Asset]] = None,
+    ) -> "QuoteBatch":
+        """Derive quote metrics for a whole universe in one vectorized pass"""
+        return QuoteBatch.from_arrays(
+            prices, prev_closes, volumes, avg_volumes, assets=assets
+        )
+
+
+@dataclass(**_SLOTS)
+class QuoteBatch:
+    """Column-oriented quote metrics for many assets
+
+    Rows line up with ``assets``; metrics whose reference value is missing or
+    non-positive are NaN rather than None.
+    """
+
+    assets: List[Asset]
+    prices: np.ndarray
+    price_change: np.ndarray
+    price_change_percent: np.ndarray
+    volume_ratio: np.ndarray
+    _rows: Optional[Dict[str, int]] = field(default=None, init=False, repr=False)
+
+    @classmethod
+    def from_arrays(
+        cls,
+        prices,
+        prev_closes,
+        volumes,
+        avg_volumes,
+        assets: Optional[List[Asset]] = None,
+    ) -> "QuoteBatch":
+        """Build a batch from parallel price/volume arrays"""
+        prices = np.asarray(prices, dtype=np.float64)
+        prev_closes = np.asarray(prev_closes, dtype=np.float64)
+        volumes = np.asarray(volumes, dtype=np.float64)
+        avg_volumes = np.asarray(avg_volumes, dtype=np.float64)
+
+        price_change = np.full_like(prices, np.nan)
+        has_close = prev_closes > 0
+        np.subtract(prices, prev_closes, out=price_change, where=has_close)
+        pct = np.full_like(prices, np.nan)
+        np.divide(price_change * 100, prev_closes, out=pct, where=has_close)
+        ratio = np.full_like(volumes, np.nan)
+        np.divide(volumes, avg_volumes, out=ratio, where=avg_volumes > 0)
+
+        return cls(
+            assets=list(assets) if assets is not None else [],
+            prices=prices,
+            price_change=price_change,
+            price_change_percent=pct,
+            volume_ratio=ratio,
+        )
 
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    def gap_masks(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(gap_up, gap_down, volume_surge) boolean masks for every row"""
+        return MarketQuote.gap_masks(self.price_change_percent, self.volume_ratio)
+
+    def row_of(self, symbol: str) -> int:
+        """Row index for a symbol, first occurrence wins (requires assets)"""
+        if self._rows is None:
+            self._rows = {}
+            for i, asset in enumerate(self.assets):
+                self._rows.setdefault(asset.symbol, i)
+        return self._rows[symbol]
+
+    def metrics(self, symbol: str) -> Dict[str, float]:
+        """Derived metrics for a single symbol"""
+        i = self.row_of(symbol)
+        return {
+            "price_change": float(self.price_change[i]),
+            "price_change_percent": float(self.price_change_percent[i]),
+            "volume_ratio": float(self.volume_ratio[i]),
+        }
+
+
+@dataclass(**_SLOTS)
+class QuoteArray:
+    """Float64 OHLCV columns for a run of historical quotes
+
+    The input format for technical analysis: Decimal prices are converted
+    once at ingest so indicator math runs on contiguous float arrays. Missing
+    OHLC values are NaN. Every constructor yields C-contiguous float64
+    columns (int64 timestamps), which numba kernels may rely on.
+    """
+
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    timestamp_ns: np.ndarray
+    asset: Optional[Asset] = None
+
+    @classmethod
+    def from_quotes(cls, quotes: List[MarketQuote]) -> "QuoteArray":
+        """Build the columns from quotes, oldest first, in one pass"""
+        n = len(quotes)
+        ohlcv = np.empty((5, n), dtype=np.float64)
+        timestamp_ns = np.empty(n, dtype=np.int64)
+        for i, quote in enumerate(quotes):
+            bar = quote.price_data
+            ohlcv[:, i] = (
+                _optional_float(bar.open_price),
+                _optional_float(bar.high_price),
+                _optional_float(bar.low_price),
+                float(bar.price),
+                bar.volume,
+            )
+            timestamp_ns[i] = round(bar.timestamp.timestamp() * 1e6) * 1000
+        return cls(
+            *ohlcv,
+            timestamp_ns=timestamp_ns,
+            asset=quotes[0].asset if quotes else None,
+        )
 
-@dataclass
+    @classmethod
+    def from_ohlcv(
+        cls,
+        ohlcv: np.ndarray,
+        timestamp_ns: Optional[np.ndarray] = None,
+        asset: Optional[Asset] = None,
+    ) -> "QuoteArray":
+        """Wrap a (T, 5) open/high/low/close/volume array, oldest bar first"""
+        ohlcv = np.asarray(ohlcv, dtype=np.float64)
+        if ohlcv.ndim != 2 or ohlcv.shape[1] != 5:
+            raise ValueError(f"Expected a (T, 5) OHLCV array, got {ohlcv.shape}")
+        if timestamp_ns is None:
+            timestamp_ns = np.zeros(len(ohlcv), dtype=np.int64)
+        columns = np.ascontiguousarray(ohlcv.T)
+        return cls(*columns, timestamp_ns=timestamp_ns, asset=asset)
+
+    @classmethod
+    def coerce(
+        cls, quotes: Union["QuoteArray", PriceSeries, np.ndarray, List[MarketQuote]]
+    ) -> "QuoteArray":
+        """Accept a QuoteArray, PriceSeries, (T, 5) OHLCV array or quote list"""
+        if isinstance(quotes, QuoteArray):
+            return quotes
+        if isinstance(quotes, PriceSeries):
+            return quotes.to_quote_array()
+        if isinstance(quotes, np.ndarray):
+            return cls.from_ohlcv(quotes)
+        return cls.from_quotes(quotes)
+
+    def __len__(self) -> int:
+        return len(self.close)
+
+
+@dataclass(**_SLOTS)
 class ExtendedHoursData:
     """Extended hours trading data for an asset"""
 
@@ -260,16 +932,14 @@ class ExtendedHoursData:
     regular_session_close: Decimal
 
     # Calculated gap metrics
-    gap_amount: Decimal = field(init=False)
-    gap_percent: Decimal = field(init=False)
+    gap_amount: float = field(init=False)
+    gap_percent: float = field(init=False)
 
     def __post_init__(self):
         """Calculate gap metrics"""
-        self.gap_amount = self.price_data.price - self.regular_session_close
-        if self.regular_session_close > 0:
-            self.gap_percent = (self.gap_amount / self.regular_session_close) * 100
-        else:
-            self.gap_percent = Decimal(0)
+        self.gap_amount, self.gap_percent = gap_metrics(
+            float(self.price_data.price), float(self.regular_session_close)
+        )
 
     @property
     def is_significant_gap(self) -> bool:
@@ -277,12 +947,71 @@ class ExtendedHoursData:
         return abs(self.gap_percent) > 1.0
 
 
-@dataclass
+# Per-process prefix keeps counter ids unique across hosts and processes
+_NEWS_ID_PREFIX = uuid.uuid4().hex[:12]
+_news_id_counter = itertools.count()
+
+
+def _next_news_id() -> str:
+    """Cheap, creation-ordered news id (uuid4 if NewsItem.USE_UUID_IDS)"""
+    if NewsItem.USE_UUID_IDS:
+        return str(uuid.uuid4())
+    return f"{_NEWS_ID_PREFIX}-{next(_news_id_counter):012d}"
+
+
+class NewsIndex:
+    """Inverted index from asset to the news items that mention it
+
+    Assets are keyed by qualified_symbol because Asset is a mutable dataclass
+    and therefore not hashable. Items are held weakly, so the index never
+    keeps a news item alive; entries vanish once the item is garbage.
+    """
+
+    def __init__(self):
+        self._by_asset: Dict[str, "weakref.WeakValueDictionary[int, NewsItem]"] = {}
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+
+    def add(self, item: "NewsItem"):
+        """Register a news item under each of its related assets"""
+        seq = next(self._seq)
+        with self._lock:
+            for key in item._asset_keys:
+                bucket = self._by_asset.get(key)
+                if bucket is None:
+                    bucket = self._by_asset[key] = weakref.WeakValueDictionary()
+                bucket[seq] = item
+
+    def for_asset(self, asset: Asset) -> List["NewsItem"]:
+        """Live news items related to an asset, oldest registered first"""
+        bucket = self._by_asset.get(asset.qualified_symbol)
+        if bucket is None:
+            return []
+        with self._lock:
+            return list(bucket.values())
+
+    def clear(self):
+        """Drop all registered news items"""
+        with self._lock:
+            self._by_asset.clear()
+
+    def __len__(self) -> int:
+        return len(self._by_asset)
+
+
+@dataclass(**_WEAKREF_SLOTS)
 class NewsItem:
-    """News article that may affect one or more assets"""
+    """News article that may affect one or more assets
+
+    Every item registers itself in ``NewsItem.index`` on creation. The index
+    holds weak references, so items are freed as soon as callers drop them.
+    """
+
+    index: ClassVar[NewsIndex] = NewsIndex()
+    USE_UUID_IDS: ClassVar[bool] = False
 
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
-    timestamp: datetime = field(default_factory=datetime.now)
+    id: str = field(default_factory=_next_news_id)
+    timestamp: datetime = field(default_factory=_now)
 
     # Content
     headline: str = ""
@@ -292,7 +1021,7 @@ class NewsItem:
     url: Optional[str] = None
 
     # Asset relevance
-    related_assets: Set[Asset] = field(default_factory=set)
+    related_assets: Set[Asset] = field(default_factory=set)  # any iterable of Asset
     primary_asset: Optional[Asset] = None  # Main asset if story is focused on one
 
     # Market segments affected
@@ -308,9 +1037,23 @@ class NewsItem:
     language: str = "en"
     category: str = "general"  # "earnings", "merger", "regulatory", etc.
 
+    _asset_keys: FrozenSet[str] = field(
+        default=frozenset(), init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        """Index the item by its related assets"""
+        self._asset_keys = frozenset(a.qualified_symbol for a in self.related_assets)
+        NewsItem.index.add(self)
+
+    @classmethod
+    def for_asset(cls, asset: Asset) -> Iterator["NewsItem"]:
+        """Iterate over registered news items related to an asset"""
+        return iter(cls.index.for_asset(asset))
+
     def affects_asset(self, asset: Asset) -> bool:
         """Check if this news affects a specific asset"""
-        return asset in self.related_assets
+        return asset.qualified_symbol in self._asset_keys
 
     def affects_segment(self, segment: MarketSegment) -> bool:
         """Check if this news affects a market segment"""
@@ -327,7 +1070,10 @@ class NewsItem:
         return self.sentiment_score is not None and self.sentiment_score < -0.1
 
 
-@dataclass
+SENTIMENT_STRENGTHS = ("weak", "moderate", "strong")
+
+
+@dataclass(**_SLOTS)
 class SocialSentiment:
     """Social media sentiment for an asset"""
 
@@ -352,20 +1098,16 @@ class SocialSentiment:
     top_keywords: List[str] = field(default_factory=list)
     top_hashtags: List[str] = field(default_factory=list)
 
-    @property
-    def bullish_ratio(self) -> Decimal:
-        """Ratio of bullish to total mentions"""
-        if self.total_mentions == 0:
-            return Decimal(0)
-        return Decimal(self.bullish_mentions) / Decimal(self.total_mentions)
+    # Categorized once from sentiment_score, which is fixed after construction
+    sentiment_strength: str = field(init=False, default="weak", compare=False)
 
-    @property
-    def sentiment_strength(self) -> str:
+    def __post_init__(self):
         """Categorize sentiment strength"""
-        abs_score = abs(self.sentiment_score)
-        if abs_score > 0.6:
-            return "strong"
-        elif abs_score > 0.3:
-            return "moderate"
-        else:
-            return "weak"
+        self.sentiment_strength = SENTIMENT_STRENGTHS[
+            sentiment_bucket(float(self.sentiment_score))
+        ]
+
+    @property
+    def bullish_ratio(self) -> float:
+        """Ratio of bullish to total mentions"""
+        return bullish_ratio(self.bullish_mentions, self.total_mentions)
@@ -6,19 +6,34 @@ Separates object creation logic from domain models.
 """
 
 from datetime import time
+from functools import lru_cache
 from decimal import Decimal
 from typing import Dict, Set
 
-from .domain_models_core import Asset, Market, MarketSegment, AssetType, MarketType
+from .domain_models_core import (
+    ALL_DAYS,
+    WEEKDAYS,
+    Asset,
+    Market,
+    MarketSegment,
+    AssetType,
+    MarketType,
+    batch_clock,
+)
 
 
 class MarketFactory:
-    """Factory for creating Market entities with standard configurations"""
+    """Factory for creating Market entities with standard configurations
+
+    Each method builds its market once and returns the same shared instance on
+    every later call, so treat the returned markets as read-only.
+    """
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def create_us_stock_market() -> Market:
         """Create standard US stock market configuration"""
-        return Market(
+        return Market.get_or_create(
             id="US_STOCKS",
             name="US Stock Markets",
             market_type=MarketType.STOCK,
@@ -29,13 +44,14 @@ class MarketFactory:
             pre_market_start=time(4, 0),
             after_hours_end=time(20, 0),
             min_tick_size=Decimal("0.01"),
-            trading_days={0, 1, 2, 3, 4},  # Monday to Friday
+            trading_days=WEEKDAYS,  # Monday to Friday
         )
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def create_nyse_market() -> Market:
         """Create New York Stock Exchange market"""
-        return Market(
+        return Market.get_or_create(
             id="NYSE",
             name="New York Stock Exchange",
             market_type=MarketType.STOCK,
@@ -46,13 +62,14 @@ class MarketFactory:
             pre_market_start=time(4, 0),
             after_hours_end=time(20, 0),
             min_tick_size=Decimal("0.01"),
-            trading_days={0, 1, 2, 3, 4},
+            trading_days=WEEKDAYS,
         )
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def create_nasdaq_market() -> Market:
         """Create NASDAQ market"""
-        return Market(
+        return Market.get_or_create(
             id="NASDAQ",
             name="NASDAQ Stock Market",
             market_type=MarketType.STOCK,
@@ -63,13 +80,14 @@ class MarketFactory:
             pre_market_start=time(4, 0),
             after_hours_end=time(20, 0),
             min_tick_size=Decimal("0.01"),
-            trading_days={0, 1, 2, 3, 4},
+            trading_days=WEEKDAYS,
         )
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def create_crypto_market() -> Market:
         """Create 24/7 cryptocurrency market"""
-        return Market(
+        return Market.get_or_create(
             id="CRYPTO",
             name="Cryptocurrency Markets",
             market_type=MarketType.CRYPTO,
@@ -78,7 +96,7 @@ class MarketFactory:
             regular_open=time(0, 0),
             regular_close=time(23, 59),
             min_tick_size=Decimal("0.00000001"),
-            trading_days={0, 1, 2, 3, 4, 5, 6},  # All days
+            trading_days=ALL_DAYS,
         )
 
 
@@ -88,7 +106,7 @@ class MarketSegmentFactory:
     @staticmethod
     def create_technology_segment() -> MarketSegment:
         """Create technology sector segment"""
-        return MarketSegment(
+        return MarketSegment.get_or_create(
             id="technology",
             name="Technology",
             description="Technology companies and software",
@@ -98,7 +116,7 @@ class MarketSegmentFactory:
     @staticmethod
     def create_healthcare_segment() -> MarketSegment:
         """Create healthcare sector segment"""
-        return MarketSegment(
+        return MarketSegment.get_or_create(
             id="healthcare",
             name="Healthcare",
             description="Healthcare and pharmaceutical companies",
@@ -108,7 +126,7 @@ class MarketSegmentFactory:
     @staticmethod
     def create_financial_segment() -> MarketSegment:
         """Create financial sector segment"""
-        return MarketSegment(
+        return MarketSegment.get_or_create(
             id="financial",
             name="Financial Services",
             description="Banks, insurance, and financial services",
@@ -118,7 +136,7 @@ class MarketSegmentFactory:
     @staticmethod
     def create_sp500_segment() -> MarketSegment:
         """Create S&P 500 index segment"""
-        return MarketSegment(
+        return MarketSegment.get_or_create(
             id="sp500",
             name="S&P 500",
             description="Standard & Poor's 500 large-cap US stocks",
@@ -128,7 +146,7 @@ class MarketSegmentFactory:
     @staticmethod
     def create_nasdaq100_segment() -> MarketSegment:
         """Create NASDAQ-100 index segment"""
-        return MarketSegment(
+        return MarketSegment.get_or_create(
             id="nasdaq100",
             name="NASDAQ-100",
             description="100 largest non-financial companies on NASDAQ",
@@ -138,7 +156,7 @@ class MarketSegmentFactory:
     @staticmethod
     def create_large_cap_segment() -> MarketSegment:
         """Create large-cap size segment"""
-        return MarketSegment(
+        return MarketSegment.get_or_create(
             id="large_cap",
             name="Large Cap",
             description="Large capitalization stocks (>$10B market cap)",
@@ -152,7 +170,7 @@ class MarketSegmentFactory:
         technology = MarketSegmentFactory.create_technology_segment()
 
         # Sub-industries
-        software = MarketSegment(
+        software = MarketSegment.get_or_create(
             id="software",
             name="Software",
             description="Software development and services",
@@ -160,7 +178,7 @@ class MarketSegmentFactory:
             parent_segment=technology,
         )
 
-        hardware = MarketSegment(
+        hardware = MarketSegment.get_or_create(
             id="hardware",
             name="Hardware",
             description="Computer and electronic hardware",
@@ -168,7 +186,7 @@ class MarketSegmentFactory:
             parent_segment=technology,
         )
 
-        semiconductors = MarketSegment(
+        semiconductors = MarketSegment.get_or_create(
             id="semiconductors",
             name="Semiconductors",
             description="Semiconductor and chip manufacturers",
@@ -177,7 +195,7 @@ class MarketSegmentFactory:
         )
 
         # Sub-sub-industries
-        cloud_software = MarketSegment(
+        cloud_software = MarketSegment.get_or_create(
             id="cloud_software",
             name="Cloud Software",
             description="Cloud-based software services (SaaS)",
@@ -202,6 +220,18 @@ class AssetFactory:
         self.nyse = MarketFactory.create_nyse_market()
         self.nasdaq = MarketFactory.create_nasdaq_market()
         self.segments = self._create_common_segments()
+        self._mega_tech_segments = (
+            self.segments["technology"],
+            self.segments["sp500"],
+            self.segments["nasdaq100"],
+            self.segments["large_cap"],
+        )
+        self._large_tech_segments = (
+            self.segments["technology"],
+            self.segments["sp500"],
+            self.segments["large_cap"],
+        )
+        self._sp500_only = (self.segments["sp500"],)
 
     def _create_common_segments(self) -> Dict[str, MarketSegment]:
         """Create commonly used market segments"""
@@ -222,12 +252,7 @@ class AssetFactory:
             asset_type=AssetType.COMMON_STOCK,
             market=self.nasdaq,
             currency="USD",
-            segments={
-                self.segments["technology"],
-                self.segments["sp500"],
-                self.segments["nasdaq100"],
-                self.segments["large_cap"],
-            },
+            segments=self._mega_tech_segments,
             shares_outstanding=15500000000,
             market_cap=Decimal("3000000000000"),  # ~$3T
             is_active=True,
@@ -241,12 +266,7 @@ class AssetFactory:
             asset_type=AssetType.COMMON_STOCK,
             market=self.nasdaq,
             currency="USD",
-            segments={
-                self.segments["technology"],
-                self.segments["sp500"],
-                self.segments["nasdaq100"],
-                self.segments["large_cap"],
-            },
+            segments=self._mega_tech_segments,
             shares_outstanding=7400000000,
             market_cap=Decimal("2800000000000"),  # ~$2.8T
             is_active=True,
@@ -260,11 +280,7 @@ class AssetFactory:
             asset_type=AssetType.COMMON_STOCK,
             market=self.nasdaq,
             currency="USD",
-            segments={
-                self.segments["technology"],
-                self.segments["sp500"],
-                self.segments["large_cap"],
-            },
+            segments=self._large_tech_segments,
             shares_outstanding=3170000000,
             market_cap=Decimal("800000000000"),  # ~$800B
             is_active=True,
@@ -278,7 +294,7 @@ class AssetFactory:
             asset_type=AssetType.ETF,
             market=self.nyse,
             currency="USD",
-            segments={self.segments["sp500"]},
+            segments=self._sp500_only,
             shares_outstanding=920000000,
             is_active=True,
         )
@@ -291,20 +307,21 @@ class AssetFactory:
             asset_type=AssetType.ETF,
             market=self.nyse,
             currency="USD",
-            segments={self.segments["sp500"]},
+            segments=self._sp500_only,
             shares_outstanding=340000000,
             is_active=True,
         )
 
     def create_asset_universe(self) -> Dict[str, Asset]:
         """Create a universe of common assets for testing/development"""
-        return {
-            "AAPL": self.create_apple(),
-            "MSFT": self.create_microsoft(),
-            "TSLA": self.create_tesla(),
-            "SPY": self.create_spy_etf(),
-            "VOO": self.create_voo_etf(),
-        }
+        with batch_clock():
+            return {
+                "AAPL": self.create_apple(),
+                "MSFT": self.create_microsoft(),
+                "TSLA": self.create_tesla(),
+                "SPY": self.create_spy_etf(),
+                "VOO": self.create_voo_etf(),
+            }
 
 
 # Convenience functions for easy access
@@ -228,7 +228,7 @@ class AssetDataProviderPolygon(AssetDataProvider):
             extended_data = cached_api_call(
                 provider=self.provider_name,
                 endpoint="extended_hours",
-                params={"symbol": asset.symbol, "session": session.value},
+                params={"symbol": asset.symbol, "session": session.label},
                 api_function=fetch_extended_hours,
                 policy=CachePolicy.INTRADAY,
             )
@@ -20,6 +20,7 @@ from ..data_models.domain_models_core import (
     MarketStatus,
 )
 from ..caches.api_cache import APICache, CachePolicy, cached_api_call
+from ..config.local_config import get_http_session
 
 logger = logging.getLogger(__name__)
 
@@ -62,7 +63,7 @@ class AssetDataProviderYFinance(AssetDataProvider):
 
             def fetch_quote() -> Optional[Dict[str, Any]]:
                 """Internal function to fetch quote data"""
-                ticker = yf.Ticker(asset.symbol)
+                ticker = yf.Ticker(asset.symbol, session=get_http_session())
 
                 # Get current info and recent price data
                 info = ticker.info
@@ -186,7 +187,7 @@ class AssetDataProviderYFinance(AssetDataProvider):
 
             def fetch_extended_hours() -> Optional[Dict[str, Any]]:
                 """Internal function to fetch extended hours data"""
-                ticker = yf.Ticker(asset.symbol)
+                ticker = yf.Ticker(asset.symbol, session=get_http_session())
                 hist = ticker.history(period="2d", interval="1m", prepost=True)
 
                 if hist.empty:
@@ -249,7 +250,7 @@ class AssetDataProviderYFinance(AssetDataProvider):
             extended_data = cached_api_call(
                 provider=self.provider_name,
                 endpoint="get_extended_hours",
-                params={"symbol": asset.symbol, "session": session.value},
+                params={"symbol": asset.symbol, "session": session.label},
                 api_function=fetch_extended_hours,
                 policy=CachePolicy.INTRADAY,
             )
@@ -307,7 +308,7 @@ class AssetDataProviderYFinance(AssetDataProvider):
 
             def fetch_historical() -> List[Dict[str, Any]]:
                 """Internal function to fetch historical data"""
-                ticker = yf.Ticker(asset.symbol)
+                ticker = yf.Ticker(asset.symbol, session=get_http_session())
                 hist = ticker.history(start=start_date, end=end_date, interval=interval)
 
                 if hist.empty:
@@ -420,7 +421,7 @@ class AssetDataProviderYFinance(AssetDataProvider):
 
             def fetch_fundamentals() -> Dict[str, Any]:
                 """Internal function to fetch fundamental data"""
-                ticker = yf.Ticker(asset.symbol)
+                ticker = yf.Ticker(asset.symbol, session=get_http_session())
                 info = ticker.info
 
                 # Extract key fundamental metrics
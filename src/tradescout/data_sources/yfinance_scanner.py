@@ -17,6 +17,8 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 import time
 
+from ..config.local_config import get_http_session
+
 logger = logging.getLogger(__name__)
 
 
@@ -50,7 +52,7 @@ class YFinanceScanner:
             if self._is_cached_valid(cache_key):
                 return self.cache[cache_key]["data"]
 
-            ticker = yf.Ticker(symbol)
+            ticker = yf.Ticker(symbol, session=get_http_session())
             info = ticker.info
 
             # Get recent price data
@@ -108,7 +110,7 @@ class YFinanceScanner:
             After-hours price and volume data
         """
         try:
-            ticker = yf.Ticker(symbol)
+            ticker = yf.Ticker(symbol, session=get_http_session())
 
             # Get extended hours data
             hist = ticker.history(period="1d", interval="1m", prepost=True)
@@ -158,7 +160,7 @@ class YFinanceScanner:
             Pre-market price and volume data
         """
         try:
-            ticker = yf.Ticker(symbol)
+            ticker = yf.Ticker(symbol, session=get_http_session())
 
             # Get today's extended hours data
             hist = ticker.history(period="1d", interval="1m", prepost=True)
@@ -259,7 +261,7 @@ class YFinanceScanner:
             Historical price DataFrame
         """
         try:
-            ticker = yf.Ticker(symbol)
+            ticker = yf.Ticker(symbol, session=get_http_session())
             hist = ticker.history(period=period, interval=interval)
             time.sleep(self.delay_seconds)
             return hist
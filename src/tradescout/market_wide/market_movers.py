@@ -279,7 +279,7 @@ if __name__ == "__main__":
     print("\\n📊 Testing Complete Report:")
     report = provider.get_market_movers_report(limit=3)
     print(f"Report generated at: {report.timestamp}")
-    print(f"Market status: {report.market_status}")
+    print(f"Market status: {report.market_status.label}")
     print(f"Gainers: {len(report.gainers)}, Losers: {len(report.losers)}, Most Active: {len(report.most_active)}")
     
     print("\\n✅ Market Movers Provider test completed!")
\ No newline at end of file
@@ -259,7 +259,7 @@ if __name__ == "__main__":
     report = provider.get_market_movers_report(limit=5)
     if report:
         print(f"Timestamp: {report.timestamp}")
-        print(f"Market Status: {report.market_status}")
+        print(f"Market Status: {report.market_status.label}")
         
         print("\\n🟢 Top Gainers:")
         for gainer in report.gainers[:3]:
@@ -23,7 +23,7 @@ from rich import box
 from ..storage.sqlite_repository import create_sqlite_database_manager
 from ..data_models.domain_models_core import Asset, AssetType
 from ..data_models.factories import MarketFactory
-from ..config.local_config import DATABASE_CONFIG
+from ..config import local_config
 from ..data_sources.smart_coordinator import create_smart_coordinator
 from ..config.data_sources_manager import get_data_sources_manager
 from ..market_wide import create_market_movers_provider
@@ -58,7 +58,7 @@ def main(ctx, db_path: Optional[str], verbose: bool):
     if db_path:
         db_manager = create_sqlite_database_manager(db_path)
     else:
-        default_path = DATABASE_CONFIG["path"]
+        default_path = local_config.get("database")["path"]
         db_manager = create_sqlite_database_manager(str(default_path))
 
     # Initialize database if needed
@@ -796,7 +796,7 @@ def movers(ctx, limit: int, force_refresh: bool):
         
         # Show report header
         console.print(Panel(
-            f"[bold]Market Status:[/bold] {report.market_status.value}\n"
+            f"[bold]Market Status:[/bold] {report.market_status.label}\n"
             f"[bold]Report Time:[/bold] {report.timestamp.strftime('%Y-%m-%d %H:%M:%S')}\n"
             f"[bold]Data Source:[/bold] {'Alpha Vantage' if len(report.gainers) >= limit else 'YFinance Fallback'}",
             title="📊 Report Info",
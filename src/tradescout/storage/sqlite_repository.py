@@ -136,7 +136,7 @@ class SQLiteQuoteRepository(QuoteRepository):
                             else None
                         ),
                         str(quote.volume_ratio) if quote.volume_ratio else None,
-                        quote.price_data.session_type.value,
+                        quote.price_data.session_type.label,
                         quote.price_data.data_source,
                         quote.price_data.data_quality,
                     ),
@@ -282,7 +282,7 @@ class SQLiteQuoteRepository(QuoteRepository):
                                     else None
                                 ),
                                 str(quote.volume_ratio) if quote.volume_ratio else None,
-                                quote.price_data.session_type.value,
+                                quote.price_data.session_type.label,
                                 quote.price_data.data_source,
                                 quote.price_data.data_quality,
                             ),
@@ -7,114 +7,183 @@ URL: https://www.cnn.com/markets/after-hours
 
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException
 from bs4 import BeautifulSoup
 from datetime import datetime, time
-import pytz
-from typing import List, Dict, Optional
+from typing import List, Dict
+from zoneinfo import ZoneInfo
 import logging
 from decimal import Decimal
+import atexit
+import threading
 import time as time_module
 
 from .interfaces import AfterHoursWebScraper
 
 logger = logging.getLogger(__name__)
 
+ET_TZ = ZoneInfo('America/New_York')
+
+
+# One shared driver per headless mode, so scrapers never lose theirs to a
+# scraper that asked for the other mode
+_GLOBAL_DRIVERS: Dict[bool, WebDriver] = {}
+_GLOBAL_DRIVER_LOCK = threading.Lock()
+# A driver has one current page, so each shared driver serves one scrape at a
+# time; reentrant so a thread can nest scrapes on the same driver
+_SCRAPE_LOCKS: Dict[bool, threading.RLock] = {
+    headless: threading.RLock() for headless in (True, False)
+}
+
+
+def _create_driver(headless: bool) -> WebDriver:
+    """Create a Chrome driver with proper options to mimic a real browser"""
+    chrome_options = Options()
+    
+    if headless:
+        chrome_options.add_argument("--headless")
+        
+    # Mimic a real browser to avoid detection
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+    
+    # Set realistic user agent
+    chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+    
+    # Set window size to mimic desktop browser
+    chrome_options.add_argument("--window-size=1920,1080")
+    
+    # Ad blocking and popup prevention
+    chrome_options.add_argument("--block-new-web-contents")  # Block popups
+    chrome_options.add_argument("--disable-notifications")
+    chrome_options.add_argument("--disable-infobars")
+    chrome_options.add_argument("--disable-extensions-except")
+    chrome_options.add_argument("--disable-plugins-discovery")
+    chrome_options.add_argument("--disable-translate")
+    chrome_options.add_argument("--disable-background-timer-throttling")
+    chrome_options.add_argument("--disable-renderer-backgrounding")
+    chrome_options.add_argument("--disable-backgrounding-occluded-windows")
+    chrome_options.add_argument("--disable-features=TranslateUI")
+    chrome_options.add_argument("--disable-ipc-flooding-protection")
+    chrome_options.add_argument("--disable-features=VizDisplayCompositor")
+    
+    # Block ads and trackers at DNS level
+    chrome_options.add_experimental_option("prefs", {
+        "profile.default_content_setting_values": {
+            "notifications": 2,  # Block notifications
+            "popups": 2,  # Block popups
+            "media_stream": 2,  # Block media stream
+            "plugins": 2,  # Block plugins
+            "automatic_downloads": 2,  # Block automatic downloads
+            "cookies": 1,  # Allow cookies (needed for functionality)
+            "images": 1,  # Allow images
+            "javascript": 1,  # Allow JavaScript
+            "geolocation": 2,  # Block location
+            "microphone": 2,  # Block microphone
+            "camera": 2,  # Block camera
+        },
+        "profile.managed_default_content_settings": {
+            "images": 1
+        }
+    })
+    
+    try:
+        driver = webdriver.Chrome(options=chrome_options)
+        # Execute script to remove webdriver property
+        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        return driver
+    except Exception as e:
+        logger.error(f"Failed to setup Chrome driver: {e}")
+        raise
+
+
+def _cleanup_global_driver():
+    """Quit the shared drivers (registered with atexit)"""
+    with _GLOBAL_DRIVER_LOCK:
+        for driver in _GLOBAL_DRIVERS.values():
+            try:
+                driver.quit()
+            except Exception:
+                pass
+        _GLOBAL_DRIVERS.clear()
+
+
+atexit.register(_cleanup_global_driver)
+
+
+def get_driver(headless: bool = True) -> WebDriver:
+    """
+    Get the process-wide Chrome driver for a headless mode, starting it on first use
+
+    Chrome takes seconds to start, so scrapers created with reuse=True share
+    one driver per headless mode; drivers are quit at interpreter exit.
+    Callers other than CNNAfterHoursScraper must hold the headless mode's
+    scrape lock while driving it, and must not change its settings.
+    """
+    with _GLOBAL_DRIVER_LOCK:
+        driver = _GLOBAL_DRIVERS.get(headless)
+        if driver is None:
+            driver = _GLOBAL_DRIVERS[headless] = _create_driver(headless)
+        return driver
+
 
 class CNNAfterHoursScraper(AfterHoursWebScraper):
     """
     CNN Markets after-hours data scraper implementation using Selenium
     """
     
-    def __init__(self, delay_seconds: float = 1.0, headless: bool = True):
+    def __init__(self, delay_seconds: float = 1.0, headless: bool = True, reuse: bool = True):
         """
         Initialize CNN after-hours scraper with Selenium
         
         Args:
             delay_seconds: Delay between requests to be respectful
             headless: Run browser in headless mode (default: True)
+            reuse: Share one process-wide Chrome driver instead of starting
+                a new browser for every request (default: True)
         """
         self.base_url = "https://www.cnn.com/markets/after-hours"
         self.delay_seconds = delay_seconds
         self.headless = headless
+        self.reuse = reuse
         self.driver = None
+        self._scrape_lock = None
         
     def _setup_driver(self):
-        """Setup Chrome driver with proper options to mimic real browser"""
+        """
+        Setup Chrome driver (shared when reuse is enabled)
+        
+        A shared driver is locked until _cleanup_driver, so concurrent
+        scrapers take turns instead of navigating each other's page.
+        """
         if self.driver is not None:
             return
-            
-        chrome_options = Options()
         
-        if self.headless:
-            chrome_options.add_argument("--headless")
-            
-        # Mimic a real browser to avoid detection
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        
-        # Set realistic user agent
-        chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-        
-        # Set window size to mimic desktop browser
-        chrome_options.add_argument("--window-size=1920,1080")
-        
-        # Ad blocking and popup prevention
-        chrome_options.add_argument("--block-new-web-contents")  # Block popups
-        chrome_options.add_argument("--disable-notifications")
-        chrome_options.add_argument("--disable-infobars")
-        chrome_options.add_argument("--disable-extensions-except")
-        chrome_options.add_argument("--disable-plugins-discovery")
-        chrome_options.add_argument("--disable-translate")
-        chrome_options.add_argument("--disable-background-timer-throttling")
-        chrome_options.add_argument("--disable-renderer-backgrounding")
-        chrome_options.add_argument("--disable-backgrounding-occluded-windows")
-        chrome_options.add_argument("--disable-features=TranslateUI")
-        chrome_options.add_argument("--disable-ipc-flooding-protection")
-        chrome_options.add_argument("--disable-features=VizDisplayCompositor")
-        
-        # Block ads and trackers at DNS level
-        chrome_options.add_experimental_option("prefs", {
-            "profile.default_content_setting_values": {
-                "notifications": 2,  # Block notifications
-                "popups": 2,  # Block popups
-                "media_stream": 2,  # Block media stream
-                "plugins": 2,  # Block plugins
-                "automatic_downloads": 2,  # Block automatic downloads
-                "cookies": 1,  # Allow cookies (needed for functionality)
-                "images": 1,  # Allow images
-                "javascript": 1,  # Allow JavaScript
-                "geolocation": 2,  # Block location
-                "microphone": 2,  # Block microphone
-                "camera": 2,  # Block camera
-            },
-            "profile.managed_default_content_settings": {
-                "images": 1
-            }
-        })
-        
-        try:
-            self.driver = webdriver.Chrome(options=chrome_options)
-            # Execute script to remove webdriver property
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        except Exception as e:
-            logger.error(f"Failed to setup Chrome driver: {e}")
-            raise
+        if self.reuse:
+            self._scrape_lock = _SCRAPE_LOCKS[self.headless]
+            self._scrape_lock.acquire()
+            self.driver = get_driver(self.headless)
+        else:
+            self.driver = _create_driver(self.headless)
     
     def _cleanup_driver(self):
-        """Clean up the selenium driver"""
-        if self.driver:
+        """Clean up the selenium driver (the shared driver stays open)"""
+        if self.driver and not self.reuse:
             try:
                 self.driver.quit()
             except:
                 pass
-            self.driver = None
+        self.driver = None
+        if self._scrape_lock is not None:
+            self._scrape_lock.release()
+            self._scrape_lock = None
     
     def get_after_hours_gainers(self, limit: int = 10) -> List[Dict[str, any]]:
         """
@@ -239,7 +308,7 @@ class CNNAfterHoursScraper(AfterHoursWebScraper):
                                     buttons_found += 1
                                     time_module.sleep(1)
                                 except Exception as e:
-                                    logger.debug(f"Failed to click button: {e}")
+                                    logger.debug("Failed to click button: %s", e)
                     except:
                         continue
                         
@@ -404,8 +473,7 @@ class CNNAfterHoursScraper(AfterHoursWebScraper):
         Returns:
             True if currently in after-hours trading period
         """
-        et_tz = pytz.timezone('America/New_York')
-        now_et = datetime.now(et_tz).time()
+        now_et = datetime.now(ET_TZ).time()
         
         after_hours_start = time(16, 0)  # 4:00 PM ET
         after_hours_end = time(20, 0)    # 8:00 PM ET
@@ -419,8 +487,7 @@ class CNNAfterHoursScraper(AfterHoursWebScraper):
         Returns:
             Dictionary with session and source metadata
         """
-        et_tz = pytz.timezone('America/New_York')
-        now_et = datetime.now(et_tz)
+        now_et = datetime.now(ET_TZ)
         
         # Determine current session
         current_time = now_et.time()
@@ -568,7 +635,7 @@ class CNNAfterHoursScraper(AfterHoursWebScraper):
                     }
                     
                     movers.append(mover_data)
-                    logger.debug(f"Parsed {symbol}: ${current_price} ({change_percent:+.2f}%)")
+                    logger.debug("Parsed %s: $%s (%+.2f%%)", symbol, current_price, change_percent)
                     
                 except Exception as e:
                     logger.warning(f"Error parsing stock row: {e}")
@@ -2,6 +2,8 @@
 Pytest configuration and fixtures for TradeScout tests
 """
 
+import sys
+
 import pytest
 from decimal import Decimal
 from datetime import datetime, time
@@ -18,6 +20,22 @@ from tradescout.data_models.domain_models_core import (
 from tradescout.caches.api_cache import APICache
 
 
+@pytest.fixture(autouse=True)
+def isolated_data_dirs(tmp_path, monkeypatch):
+    """Keep default caches and databases out of the repo's data/ directory"""
+    # Tests import the package as both tradescout and src.tradescout
+    for prefix in ("tradescout", "src.tradescout"):
+        module = sys.modules.get(f"{prefix}.caches.api_cache")
+        if module is not None:
+            monkeypatch.setattr(module, "DEFAULT_CACHE_DIR", str(tmp_path / "cache"))
+            monkeypatch.setattr(module, "_api_cache", None)
+        config = sys.modules.get(f"{prefix}.config.local_config")
+        if config is not None:
+            monkeypatch.setitem(
+                config.DATABASE_CONFIG, "path", tmp_path / "tradescout.db"
+            )
+
+
 @pytest.fixture
 def sample_market():
     """Create a sample market for testing"""
@@ -0,0 +1,445 @@
+"""
+Tests for the file-based API cache
+"""
+
+import gzip
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from src.tradescout.caches.api_cache import (
+    NOT_MODIFIED,
+    APICache,
+    CacheConfig,
+    CachePolicy,
+)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create an API cache rooted in a temporary directory"""
+    return APICache(CacheConfig(base_dir=str(tmp_path / "cache")))
+
+
+@pytest.fixture
+def large_payload():
+    """Payload big enough to be gzipped"""
+    return {"bars": [{"close": 150.0 + i, "volume": 1000 * i} for i in range(50)]}
+
+
+class TestAPICacheStorage:
+    """Test on-disk cache entry format"""
+
+    def test_roundtrip(self, cache, large_payload):
+        """Test that cached data is returned unchanged"""
+        params = {"symbol": "AAPL"}
+        assert cache.set("yfinance", "history", params, large_payload) is True
+        assert cache.get("yfinance", "history", params) == large_payload
+
+    def test_large_entries_are_gzipped(self, cache, large_payload):
+        """Test that large entries are written as compact gzipped JSON"""
+        cache.set("yfinance", "history", {"symbol": "AAPL"}, large_payload)
+
+        files = list(cache.providers["yfinance"].iterdir())
+        assert len(files) == 1
+        assert files[0].name.endswith(".json.gz")
+
+        with gzip.open(files[0], "rt") as f:
+            raw = f.read()
+        assert "\n" not in raw
+        assert json.loads(raw)["data"] == large_payload
+
+    def test_small_entries_stay_plain(self, cache):
+        """Test that tiny payloads skip compression"""
+        cache.set("yfinance", "quote", {"symbol": "AAPL"}, {"price": 1})
+
+        files = list(cache.providers["yfinance"].iterdir())
+        assert len(files) == 1
+        assert files[0].name.endswith(".json")
+        assert cache.get("yfinance", "quote", {"symbol": "AAPL"}) == {"price": 1}
+
+    def test_non_json_types(self, cache):
+        """Test that Decimal/datetime values and params are serializable"""
+        params = {"symbol": "AAPL", "start": datetime(2024, 1, 2), 5: "int key"}
+        data = {"price": Decimal("150.25"), "as_of": datetime(2024, 1, 2, 16, 0)}
+
+        assert cache.set("yfinance", "quote", params, data) is True
+        assert cache.get("yfinance", "quote", params) == {
+            "price": "150.25",
+            "as_of": "2024-01-02T16:00:00",
+        }
+
+    def test_cache_key_ignores_param_order(self, cache):
+        """Test that cache keys are independent of param ordering"""
+        key_a = cache.get_cache_key("yfinance", "quote", {"a": 1, "b": 2})
+        key_b = cache.get_cache_key("yfinance", "quote", {"b": 2, "a": 1})
+        assert key_a == key_b
+        assert key_a != cache.get_cache_key("polygon", "quote", {"a": 1, "b": 2})
+
+    def test_cache_key_is_type_aware(self, cache):
+        """Test that equal-looking params of different types get distinct keys"""
+        keys = {
+            cache.get_cache_key("yfinance", "quote", params)
+            for params in ({"limit": 1}, {"limit": "1"}, {1: "limit"}, {"limit": [1]})
+        }
+        assert len(keys) == 4
+
+        nested_a = {"filters": {"x": [1, 2], "y": {"z"}}, "symbol": "NVDA"}
+        nested_b = {"symbol": "NVDA", "filters": {"y": {"z"}, "x": [1, 2]}}
+        assert cache.get_cache_key("yfinance", "quote", nested_a) == cache.get_cache_key(
+            "yfinance", "quote", nested_b
+        )
+
+    def test_cache_key_numeric_types(self, cache):
+        """Test equal int, float and bool params never share a memoized key"""
+        params = ({"x": 1}, {"x": 1.0}, {"x": True})
+        keys = [cache.get_cache_key("yfinance", "quote", p) for p in params]
+        assert len(set(keys)) == 3
+        assert keys == [
+            cache.get_cache_key("yfinance", "quote", p) for p in reversed(params)
+        ][::-1]
+
+    def test_cache_key_unhashable_values(self, cache):
+        """Test that params with unhashable values still produce stable keys"""
+        class Unhashable:
+            __hash__ = None
+
+            def __repr__(self):
+                return "Unhashable()"
+
+        key = cache.get_cache_key("yfinance", "quote", {"obj": Unhashable()})
+        assert key == cache.get_cache_key("yfinance", "quote", {"obj": Unhashable()})
+
+    def test_cache_files_honour_umask(self, cache):
+        """Test that atomic writes keep the umask-based mode, not mkstemp's 0600"""
+        cache.set("yfinance", "quote", {"symbol": "NVDA"}, {"price": 1})
+
+        cache_path = next(cache.providers["yfinance"].iterdir())
+        umask = os.umask(0)
+        os.umask(umask)
+        assert cache_path.stat().st_mode & 0o777 == 0o666 & ~umask
+
+    def test_compression_disabled(self, tmp_path, large_payload):
+        """Test that compress_data=False writes plain JSON"""
+        cache = APICache(CacheConfig(base_dir=str(tmp_path), compress_data=False))
+        cache.set("polygon", "aggs", {"symbol": "NVDA"}, large_payload)
+
+        files = list(cache.providers["polygon"].iterdir())
+        assert [f.suffix for f in files] == [".json"]
+        assert cache.get("polygon", "aggs", {"symbol": "NVDA"}) == large_payload
+
+    def test_writes_leave_no_temp_files(self, cache, large_payload):
+        """Test that atomic writes clean up their temp files"""
+        for symbol in ("AAPL", "MSFT"):
+            cache.set("yfinance", "history", {"symbol": symbol}, large_payload)
+        cache.set("yfinance", "history", {"symbol": "AAPL"}, large_payload)
+
+        names = [f.name for f in cache.providers["yfinance"].iterdir()]
+        assert len(names) == 2
+        assert not any(name.endswith(".tmp") for name in names)
+
+    def test_overwrite_replaces_other_format(self, cache, large_payload):
+        """Test that re-caching a key never leaves both formats behind"""
+        params = {"symbol": "AAPL"}
+        cache.set("yfinance", "quote", params, {"price": 1})
+        cache.set("yfinance", "quote", params, large_payload)
+
+        files = list(cache.providers["yfinance"].iterdir())
+        assert len(files) == 1
+        assert cache.get("yfinance", "quote", params) == large_payload
+
+
+class TestAPICacheManagement:
+    """Test invalidation, cleanup and API call wrapping"""
+
+    def test_cached_api_call_hits_cache(self, cache):
+        """Test that the API function only runs on a miss"""
+        calls = []
+
+        def api_function():
+            calls.append(1)
+            return {"price": 172.41}
+
+        for _ in range(3):
+            result = cache.cached_api_call(
+                "yfinance", "quote", {"symbol": "NVDA"}, api_function
+            )
+            assert result == {"price": 172.41}
+
+        assert len(calls) == 1
+        assert cache.stats["hits"] == 2
+
+    def test_cached_api_call_many(self, cache):
+        """Test that bulk calls dedupe params and only fetch misses"""
+        calls = []
+        lock = threading.Lock()
+
+        def api_function(params):
+            with lock:
+                calls.append(params["symbol"])
+            return {"symbol": params["symbol"]}
+
+        symbols = ["NVDA", "TSLA", "AMD", "INTC", "NVDA", "TSLA"]
+        params_list = [{"symbol": symbol} for symbol in symbols]
+
+        results = cache.cached_api_call_many("yfinance", "quote", params_list, api_function)
+        assert [r["symbol"] for r in results] == symbols
+        assert sorted(calls) == ["AMD", "INTC", "NVDA", "TSLA"]
+
+        results = cache.cached_api_call_many("yfinance", "quote", params_list, api_function)
+        assert [r["symbol"] for r in results] == symbols
+        assert len(calls) == 4
+        assert cache.stats["memory_hits"] == 4
+
+    def test_memory_layer(self, cache, large_payload):
+        """Test that repeat hits are served from the in-process LRU"""
+        params = {"symbol": "AAPL"}
+        cache.set("yfinance", "history", params, large_payload)
+
+        assert cache.get("yfinance", "history", params) == large_payload
+        assert cache.stats["memory_hits"] == 1
+
+        # A fresh instance over the same directory warms from disk
+        other = APICache(cache.config)
+        assert other.get("yfinance", "history", params) == large_payload
+        assert other.stats["memory_hits"] == 0
+        assert other.get("yfinance", "history", params) == large_payload
+        assert other.stats["memory_hits"] == 1
+
+    def test_memory_layer_is_bounded(self, tmp_path):
+        """Test that the least recently used entry is dropped first"""
+        cache = APICache(CacheConfig(base_dir=str(tmp_path), memory_cache_size=2))
+        for symbol in ("AAPL", "MSFT", "NVDA"):
+            cache.set("yfinance", "quote", {"symbol": symbol}, {"symbol": symbol})
+
+        assert len(cache._memory) == 2
+        cache.get("yfinance", "quote", {"symbol": "AAPL"})
+        assert cache.stats["memory_hits"] == 0
+
+    def test_stats_are_thread_safe(self, cache):
+        """Test that concurrent hits are all counted"""
+        cache.set("yfinance", "quote", {"symbol": "NVDA"}, {"price": 1})
+
+        def worker():
+            for _ in range(200):
+                cache.get("yfinance", "quote", {"symbol": "NVDA"})
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1600
+        assert stats["memory_hits"] == 1600
+
+    def test_single_flight(self, cache):
+        """Test that concurrent misses for one key make a single API call"""
+        calls = []
+        release = threading.Event()
+
+        def api_function():
+            calls.append(1)
+            release.wait(timeout=5)
+            return {"price": 1}
+
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(
+                    cache.cached_api_call("yfinance", "quote", {"symbol": "NVDA"}, api_function)
+                )
+            )
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.1)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert results == [{"price": 1}] * 5
+        assert len(calls) == 1
+
+    def test_stale_while_revalidate(self, tmp_path):
+        """Test that expired data inside the stale window is served while refreshing"""
+        config = CacheConfig(base_dir=str(tmp_path), memory_cache_size=0)
+        config.ttl_policies[CachePolicy.REAL_TIME] = 0
+        cache = APICache(config)
+        cache.set("yfinance", "quote", {"symbol": "NVDA"}, {"price": 1}, CachePolicy.REAL_TIME)
+
+        refreshed = threading.Event()
+
+        def api_function():
+            refreshed.set()
+            return {"price": 2}
+
+        result = cache.cached_api_call(
+            "yfinance", "quote", {"symbol": "NVDA"}, api_function, CachePolicy.REAL_TIME
+        )
+        assert result == {"price": 1}
+        assert cache.stats["stale_hits"] == 1
+
+        assert refreshed.wait(timeout=5)
+        deadline = time.time() + 5
+        while cache._inflight and time.time() < deadline:
+            time.sleep(0.01)
+        assert cache._get_stale(
+            cache.get_cache_key("yfinance", "quote", {"symbol": "NVDA"}), CachePolicy.REAL_TIME
+        ) == {"price": 2}
+
+    def test_disabled_cache_skips_stale_data(self, tmp_path):
+        """Test that a disabled cache calls the API instead of serving stale data"""
+        config = CacheConfig(base_dir=str(tmp_path), memory_cache_size=0)
+        config.ttl_policies[CachePolicy.REAL_TIME] = 0
+        cache = APICache(config)
+        cache.set("yfinance", "quote", {"symbol": "NVDA"}, {"v": "old"}, CachePolicy.REAL_TIME)
+        config.enabled = False
+
+        result = cache.cached_api_call(
+            "yfinance", "quote", {"symbol": "NVDA"}, lambda: {"v": "new"}, CachePolicy.REAL_TIME
+        )
+        assert result == {"v": "new"}
+        assert cache.stats["stale_hits"] == 0
+
+    def test_expired_past_stale_window_blocks(self, tmp_path):
+        """Test that data older than the stale window triggers a normal call"""
+        config = CacheConfig(base_dir=str(tmp_path))
+        config.ttl_policies[CachePolicy.REAL_TIME] = -10
+        cache = APICache(config)
+        cache.set("yfinance", "quote", {"symbol": "NVDA"}, {"price": 1}, CachePolicy.REAL_TIME)
+
+        result = cache.cached_api_call(
+            "yfinance", "quote", {"symbol": "NVDA"}, lambda: {"price": 2}, CachePolicy.REAL_TIME
+        )
+        assert result == {"price": 2}
+        assert cache.stats["stale_hits"] == 0
+
+    def test_not_modified_touches_entry(self, tmp_path):
+        """Test that NOT_MODIFIED refreshes the existing entry in place"""
+        config = CacheConfig(base_dir=str(tmp_path))
+        config.stale_windows[CachePolicy.REAL_TIME] = 0
+        config.ttl_policies[CachePolicy.REAL_TIME] = 1
+        cache = APICache(config)
+        cache.set("yfinance", "quote", {"symbol": "NVDA"}, {"price": 1}, CachePolicy.REAL_TIME)
+
+        cache_path = next(cache.providers["yfinance"].iterdir())
+        old = time.time() - 120
+        os.utime(cache_path, (old, old))
+        cache._index_write("UPDATE entries SET mtime = ?", (old,))
+        cache._memory.clear()
+
+        result = cache.cached_api_call(
+            "yfinance", "quote", {"symbol": "NVDA"}, lambda: NOT_MODIFIED, CachePolicy.REAL_TIME
+        )
+        assert result == {"price": 1}
+        assert cache.stats["saves"] == 1
+        assert cache.is_fresh(cache_path, CachePolicy.REAL_TIME)
+
+    def test_touch_missing_entry(self, cache):
+        """Test that touching an uncached request reports failure"""
+        assert cache.touch("yfinance", "quote", {"symbol": "NVDA"}) is False
+
+    def test_invalidate_by_symbol(self, cache, large_payload):
+        """Test invalidating entries whose params mention a symbol"""
+        cache.set("yfinance", "history", {"symbol": "AAPL"}, large_payload)
+        cache.set("yfinance", "history", {"symbol": "MSFT"}, {"price": 1})
+
+        assert cache.invalidate(symbol="aapl") == 1
+        assert cache.get("yfinance", "history", {"symbol": "AAPL"}) is None
+        assert cache.get("yfinance", "history", {"symbol": "MSFT"}) == {"price": 1}
+
+    def test_invalidate_by_endpoint_and_provider(self, cache):
+        """Test that provider narrows endpoint invalidation"""
+        cache.set("yfinance", "quote", {"symbol": "AAPL"}, {"price": 1})
+        cache.set("polygon", "quote", {"symbol": "AAPL"}, {"price": 2})
+        cache.set("polygon", "aggs", {"symbol": "AAPL"}, {"price": 3})
+
+        assert cache.invalidate(provider="polygon", endpoint="quote") == 1
+        assert cache.get("yfinance", "quote", {"symbol": "AAPL"}) == {"price": 1}
+        assert cache.get("polygon", "aggs", {"symbol": "AAPL"}) == {"price": 3}
+
+    def test_missing_file_is_a_miss(self, tmp_path, large_payload):
+        """Test that an indexed entry whose file vanished is dropped"""
+        cache = APICache(CacheConfig(base_dir=str(tmp_path), memory_cache_size=0))
+        cache.set("yfinance", "history", {"symbol": "AAPL"}, large_payload)
+        for cache_file in cache.providers["yfinance"].iterdir():
+            cache_file.unlink()
+
+        assert cache.get("yfinance", "history", {"symbol": "AAPL"}) is None
+        assert cache.get_stats()["file_count"] == 0
+
+    def test_index_backfill(self, cache, large_payload):
+        """Test that files written before the index existed get indexed"""
+        cache.set("yfinance", "history", {"symbol": "AAPL"}, large_payload)
+        cache._index.close()
+        (cache.cache_dir / "index.db").unlink()
+
+        reopened = APICache(cache.config)
+        assert reopened.get_stats()["file_count"] == 1
+        assert reopened.invalidate(symbol="AAPL") == 1
+        assert list(reopened.providers["yfinance"].iterdir()) == []
+
+    def test_eviction(self, tmp_path, large_payload):
+        """Test that the oldest entries are evicted past max_size_mb"""
+        cache = APICache(CacheConfig(base_dir=str(tmp_path), max_size_mb=0.002))
+        for day in range(10):
+            cache.set("yfinance", "history", {"symbol": "AAPL", "day": day}, large_payload)
+
+        assert cache.stats["evictions"] > 0
+        assert cache._calculate_cache_size() <= 0.002 * 1024 * 1024
+        assert cache.get("yfinance", "history", {"symbol": "AAPL", "day": 9}) == large_payload
+        assert cache.get("yfinance", "history", {"symbol": "AAPL", "day": 0}) is None
+
+    def test_clear_all(self, cache, large_payload):
+        """Test clearing every provider"""
+        cache.set("yfinance", "history", {"symbol": "AAPL"}, large_payload)
+        cache.set("polygon", "quote", {"symbol": "AAPL"}, {"price": 1})
+
+        assert cache.clear_all() == 2
+        assert cache.get_stats()["file_count"] == 0
+
+    def test_clear_all_sweeps_unindexed_files(self, cache):
+        """Test that clear_all also removes files missing from the index"""
+        orphan = cache.providers["reddit"] / "orphan.json"
+        orphan.write_text("{}")
+
+        assert cache.clear_all() == 1
+        assert not orphan.exists()
+
+    def test_cleanup_expired(self, tmp_path, large_payload):
+        """Test that only stale entries are removed"""
+        config = CacheConfig(base_dir=str(tmp_path))
+        config.ttl_policies[CachePolicy.REAL_TIME] = -1
+        cache = APICache(config)
+        cache.set("yfinance", "quote", {"symbol": "AAPL"}, {"price": 1}, CachePolicy.REAL_TIME)
+        cache.set("yfinance", "history", {"symbol": "AAPL"}, large_payload, CachePolicy.DAILY)
+
+        assert cache.cleanup_expired() == 1
+        assert cache.get("yfinance", "history", {"symbol": "AAPL"}, CachePolicy.DAILY) == large_payload
+
+    def test_is_fresh(self, cache):
+        """Test file-based freshness against policy TTLs"""
+        cache.set("yfinance", "quote", {"symbol": "AAPL"}, {"price": 1})
+        cache_path = next(cache.providers["yfinance"].iterdir())
+
+        assert cache.is_fresh(cache_path, CachePolicy.REAL_TIME) is True
+        assert cache.is_fresh(cache_path.with_name("missing.json"), CachePolicy.DAILY) is False
+        assert 0 <= cache._get_age_minutes(cache_path) < 1
+
+    def test_disabled_cache(self, tmp_path):
+        """Test that a disabled cache never stores anything"""
+        cache = APICache(CacheConfig(base_dir=str(tmp_path), enabled=False))
+        assert cache.set("yfinance", "quote", {"symbol": "AAPL"}, {"price": 1}) is False
+        assert cache.get("yfinance", "quote", {"symbol": "AAPL"}) is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -2,6 +2,12 @@
 Tests for TradeScout data models
 """
 
+import dataclasses
+import gc
+import math
+import sys
+
+import numpy as np
 import pytest
 from datetime import datetime, time
 from decimal import Decimal
@@ -11,11 +17,23 @@ from tradescout.data_models.domain_models_core import (
     Market,
     MarketSegment,
     PriceData,
+    PriceSeries,
     MarketQuote,
+    QuoteArray,
+    ExtendedHoursData,
+    NewsItem,
+    SocialSentiment,
     AssetType,
     MarketType,
     MarketStatus,
+    batch_clock,
+    float_to_decimal,
+    from_ticks,
+    to_ticks,
+    WEEKDAYS,
 )
+from tradescout.data_models._kernels import gap_metrics_vec
+from tradescout.data_models.factories import AssetFactory, MarketFactory
 
 
 class TestMarket:
@@ -40,6 +58,70 @@ class TestMarket:
         assert market.market_type == MarketType.STOCK
         assert market.currency == "USD"
 
+    def test_float_to_decimal(self):
+        """Test float results are quantized only when converted for storage"""
+        assert float_to_decimal(0.1 + 0.2) == Decimal("0.30000000")
+        assert float_to_decimal(1.23456, places=2) == Decimal("1.23")
+
+    def test_market_tick_size_is_fixed_point(self, sample_market):
+        """Test Decimal tick sizes are normalized to integer ticks"""
+        assert sample_market.min_tick_size == to_ticks(Decimal("0.01"))
+        assert sample_market.min_tick_size_decimal == Decimal("0.01")
+
+        crypto = Market(
+            id="CRYPTO_TEST",
+            name="Crypto",
+            market_type=MarketType.CRYPTO,
+            timezone="UTC",
+            currency="USD",
+            regular_open=time(0, 0),
+            regular_close=time(23, 59),
+            min_tick_size=Decimal("0.00000001"),
+        )
+        assert crypto.min_tick_size == 1
+
+    def test_trading_days_bitmask(self, sample_market):
+        """Test trading days are stored and checked as a weekday bitmask"""
+        assert sample_market.trading_days == WEEKDAYS
+        assert sample_market.is_trading_day(datetime(2025, 1, 3))  # Friday
+        assert not sample_market.is_trading_day(datetime(2025, 1, 4))  # Saturday
+
+        weekend = Market(
+            id="WEEKEND_TEST",
+            name="Weekend",
+            market_type=MarketType.CRYPTO,
+            timezone="UTC",
+            currency="USD",
+            regular_open=time(0, 0),
+            regular_close=time(23, 59),
+            trading_days={5, 6},
+        )
+        assert weekend.trading_days == 0b1100000
+        assert weekend.is_trading_day(datetime(2025, 1, 4))
+
+    def test_session_at(self, sample_market):
+        """Test session classification against the precomputed bounds"""
+        friday = datetime(2025, 1, 3)
+        assert sample_market.session_at(friday.replace(hour=3, minute=59)) == (
+            MarketStatus.CLOSED
+        )
+        assert sample_market.session_at(friday.replace(hour=4)) == (
+            MarketStatus.PRE_MARKET
+        )
+        assert sample_market.session_at(friday.replace(hour=9, minute=30)) == (
+            MarketStatus.OPEN
+        )
+        assert sample_market.session_at(friday.replace(hour=16)) == (
+            MarketStatus.AFTER_HOURS
+        )
+        assert sample_market.session_at(friday.replace(hour=20)) == (
+            MarketStatus.CLOSED
+        )
+        assert sample_market.session_at(datetime(2025, 1, 4, 10)) == (
+            MarketStatus.CLOSED
+        )
+        assert isinstance(sample_market.get_current_status(), MarketStatus)
+
     def test_market_is_open_during_regular_hours(self, sample_market):
         """Test market open status during regular hours"""
         # Mock current time to 10:00 AM (market open)
@@ -75,6 +157,17 @@ class TestMarket:
         assert market1 == market2
 
 
+class TestMarketStatus:
+    """Test MarketStatus integer enum"""
+
+    def test_labels_round_trip(self):
+        """Test stored string labels still resolve to members"""
+        assert MarketStatus.PRE_MARKET.label == "pre_market"
+        assert MarketStatus("pre_market") is MarketStatus.PRE_MARKET
+        assert MarketStatus("OPEN") is MarketStatus.OPEN
+        assert MarketStatus(MarketStatus.AFTER_HOURS.value) is MarketStatus.AFTER_HOURS
+
+
 class TestMarketSegment:
     """Test MarketSegment domain model"""
 
@@ -103,6 +196,7 @@ class TestMarketSegment:
 
         assert child_segment.parent_segment == sample_market_segment
         assert child_segment.parent_segment.id == "TECH"
+        assert child_segment.full_hierarchy == ("Technology", "AI Technology")
 
     def test_segment_hashable(self, sample_market_segment):
         """Test that MarketSegment is hashable (can be used in sets)"""
@@ -110,6 +204,27 @@ class TestMarketSegment:
         assert len(segment_set) == 1
         assert sample_market_segment in segment_set
 
+    def test_factory_segments_are_interned(self):
+        """Test factories hand out shared segment and market instances"""
+        first, second = AssetFactory(), AssetFactory()
+
+        assert first.segments["technology"] is second.segments["technology"]
+        assert first.nasdaq is second.nasdaq
+        assert MarketFactory.create_nyse_market() is first.nyse
+        assert first.create_apple().market is second.create_microsoft().market
+        assert first.create_apple().segments is first.create_microsoft().segments
+        assert isinstance(first.create_spy_etf().segments, tuple)
+
+    @pytest.mark.skipif(sys.version_info < (3, 11), reason="weakref_slot needs 3.11+")
+    def test_segment_is_slotted_flyweight(self):
+        """Test segments are slotted yet still held by the weak registry"""
+        segment = MarketSegment.get_or_create(
+            "energy", name="Energy", description="", segment_type="sector"
+        )
+
+        assert not hasattr(segment, "__dict__")
+        assert MarketSegment.get_or_create("energy") is segment
+
 
 class TestAsset:
     """Test Asset domain model"""
@@ -120,12 +235,94 @@ class TestAsset:
         assert sample_asset.name == "Apple Inc."
         assert sample_asset.asset_type == AssetType.COMMON_STOCK
         assert sample_asset.market.id == "NASDAQ"
+        assert sample_asset.qualified_symbol == "AAPL:NASDAQ"
+        assert sample_asset.tick_size == sample_asset.market.min_tick_size
+        assert sample_asset.min_order_size_decimal == Decimal("1")
+
+    def test_asset_int_sizes_are_whole_units(self, sample_market):
+        """Test plain ints are whole units and raw ticks go through from_ticks"""
+        asset = Asset(
+            symbol="BRK.A",
+            name="Berkshire Hathaway",
+            asset_type=AssetType.COMMON_STOCK,
+            market=sample_market,
+            currency="USD",
+            min_order_size=1,
+            tick_size=from_ticks(5_000_000),
+        )
+        assert asset.min_order_size_decimal == Decimal("1")
+        assert asset.tick_size_decimal == Decimal("0.05")
+
+        copy = dataclasses.replace(asset)
+        assert (copy.min_order_size, copy.tick_size) == (
+            asset.min_order_size,
+            asset.tick_size,
+        )
 
     def test_asset_with_segments(self, sample_asset, sample_market_segment):
         """Test asset with market segments"""
         assert len(sample_asset.segments) == 1
         assert sample_market_segment in sample_asset.segments
 
+    def test_segments_stored_as_tuple(self, sample_market, sample_market_segment):
+        """Test segments are kept as a duplicate-free tuple"""
+        asset = Asset(
+            symbol="MSFT",
+            name="Microsoft Corporation",
+            asset_type=AssetType.COMMON_STOCK,
+            market=sample_market,
+            currency="USD",
+            segments=[sample_market_segment, sample_market_segment],
+        )
+
+        assert asset.segments == (sample_market_segment,)
+        asset.add_segment(sample_market_segment)
+        assert asset.segments == (sample_market_segment,)
+
+    def test_segment_lookups(self, sample_asset, sample_market_segment):
+        """Test cached segment lookups follow add/remove_segment"""
+        assert sample_asset.primary_segment is sample_market_segment
+
+        index = MarketSegment(
+            id="sp500",
+            name="S&P 500",
+            description="S&P 500 Index",
+            segment_type="index",
+        )
+        sample_asset.add_segment(index)
+        assert sample_asset.is_in_segment("sp500")
+        assert sample_asset.primary_segment is sample_market_segment
+        assert sample_asset.segments_by_type == (sample_market_segment, index)
+
+        assert sample_asset.segment_mask == sample_market_segment.bit | index.bit
+
+        sample_asset.remove_segment(sample_market_segment)
+        assert sample_asset.primary_segment is None
+        assert not sample_asset.is_in_segment("TECH")
+        assert not sample_asset.is_in_segment("unknown_segment")
+        assert sample_asset.segment_mask == index.bit
+        assert sample_asset.segments_by_type == (index,)
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="slots need 3.10+")
+    def test_asset_has_no_instance_dict(self, sample_asset):
+        """Test domain models are slotted to keep per-instance memory low"""
+        assert not hasattr(sample_asset, "__dict__")
+        with pytest.raises(AttributeError):
+            sample_asset.not_a_field = True
+
+    def test_batch_clock_shares_timestamp(self):
+        """Test assets built inside batch_clock share one timestamp"""
+        universe = AssetFactory().create_asset_universe()
+        stamps = {a.created_at for a in universe.values()}
+        stamps |= {a.updated_at for a in universe.values()}
+        assert len(stamps) == 1
+
+        fixed_time = datetime(2025, 1, 1, 12, 0, 0)
+        with batch_clock(fixed_time):
+            asset = AssetFactory().create_apple()
+        assert asset.created_at == fixed_time
+        assert AssetFactory().create_apple().created_at != fixed_time
+
     def test_asset_string_representation(self, sample_asset):
         """Test asset string representation"""
         assert str(sample_asset) == "AAPL (Apple Inc.)"
@@ -201,6 +398,121 @@ class TestPriceData:
         assert price_data.spread == Decimal("1.00")
 
 
+class TestPriceSeries:
+    """Test the packed PriceSeries layout"""
+
+    def test_round_trip_and_columns(self, sample_asset):
+        """Test rows pack into columns and materialize back"""
+        rows = [
+            PriceData(
+                asset=sample_asset,
+                timestamp=datetime(2025, 1, 2, 9, 30 + i),
+                price=Decimal("100.50") + i,
+                volume=1000 * (i + 1),
+                open_price=Decimal("100.00") if i else None,
+                high_price=Decimal("102.00"),
+                low_price=Decimal("99.00"),
+                session_type=MarketStatus.PRE_MARKET,
+                data_quality="stale",
+            )
+            for i in range(3)
+        ]
+
+        series = PriceSeries.from_price_data(sample_asset, rows)
+
+        assert len(series) == 3
+        assert series.prices.tolist() == [100.5, 101.5, 102.5]
+        assert series.complete_bars.tolist() == [False, True, True]
+        assert np.shares_memory(series.prices, series.data)
+
+        row = series.to_price_data(1)
+        assert row.price == Decimal("101.5")
+        assert row.open_price == Decimal("100.0")
+        assert row.timestamp == datetime(2025, 1, 2, 9, 31)
+        assert row.session_type is MarketStatus.PRE_MARKET
+        assert row.data_quality == "stale"
+        assert row.bid_price is None
+
+    def test_from_quotes_and_bulk_views(self, sample_asset):
+        """Test quotes pack once and expose contiguous OHLCV columns"""
+        quotes = [
+            MarketQuote(
+                asset=sample_asset,
+                price_data=PriceData(
+                    asset=sample_asset,
+                    timestamp=datetime(2025, 1, 2 + i, 16, 0),
+                    price=Decimal(close),
+                    volume=1000,
+                    open_price=Decimal("100.00"),
+                    high_price=Decimal("103.00"),
+                    low_price=Decimal("99.00"),
+                ),
+            )
+            for i, close in enumerate(("101.25", "102.50"))
+        ]
+
+        series = PriceSeries.from_quotes(quotes)
+        bars = series.to_quote_array()
+
+        assert series.asset is sample_asset
+        assert bars.close.flags["C_CONTIGUOUS"]
+        assert bars.close.tolist() == [101.25, 102.5]
+        assert bars.volume.dtype == np.float64
+        assert QuoteArray.coerce(series).close.tolist() == [101.25, 102.5]
+
+        quote = series.to_quote(-1)
+        assert quote.price_data.price == Decimal("102.5")
+        assert quote.previous_close == Decimal("101.25")
+        assert series.to_quote(0).previous_close is None
+
+        with pytest.raises(ValueError):
+            PriceSeries.from_quotes([])
+
+
+class TestQuoteArray:
+    """Test the float64 OHLCV columns used by technical analysis"""
+
+    def test_from_quotes(self, sample_asset):
+        """Test Decimal quotes convert once into float columns"""
+        quotes = [
+            MarketQuote(
+                asset=sample_asset,
+                price_data=PriceData(
+                    asset=sample_asset,
+                    timestamp=datetime(2025, 1, 2, 16, 0),
+                    price=Decimal(close),
+                    volume=1000,
+                    open_price=Decimal("100.00"),
+                    high_price=Decimal("103.00"),
+                    low_price=None,
+                ),
+            )
+            for close in ("101.25", "102.50")
+        ]
+
+        bars = QuoteArray.from_quotes(quotes)
+
+        assert len(bars) == 2
+        assert bars.close.dtype == np.float64
+        assert bars.close.tolist() == [101.25, 102.5]
+        assert bars.open.tolist() == [100.0, 100.0]
+        assert np.isnan(bars.low).all()
+        assert bars.asset is sample_asset
+        assert bars.close.flags["C_CONTIGUOUS"]
+
+    def test_from_ohlcv(self):
+        """Test a raw (T, 5) array is split into contiguous columns"""
+        ohlcv = np.array([[1.0, 2.0, 0.5, 1.5, 100.0], [1.5, 2.5, 1.0, 2.0, 200.0]])
+
+        bars = QuoteArray.coerce(ohlcv)
+
+        assert bars.close.tolist() == [1.5, 2.0]
+        assert bars.volume.tolist() == [100.0, 200.0]
+        assert bars.high.flags["C_CONTIGUOUS"]
+        with pytest.raises(ValueError):
+            QuoteArray.from_ohlcv(np.zeros((3, 4)))
+
+
 class TestMarketQuote:
     """Test MarketQuote domain model"""
 
@@ -243,6 +555,9 @@ class TestMarketQuote:
         # Test price change calculations (handled in __post_init__)
         assert quote.price_change == Decimal("5.00")  # 105 - 100
         assert quote.price_change_percent == Decimal("5.00")  # 5/100 * 100
+        assert quote.is_gap_up
+        assert not quote.is_gap_down
+        assert not quote.has_volume_surge  # no average volume
 
     def test_volume_ratio_calculation(self, sample_asset):
         """Test volume ratio calculation when average volume is provided"""
@@ -264,3 +579,168 @@ class TestMarketQuote:
         )
 
         assert quote.volume_ratio == Decimal("1.50")  # 75M / 50M
+        assert not quote.has_volume_surge
+        assert quote.is_gap_up  # 1.01% is just over the 1% threshold
+
+    def test_exact_calculation_returns_decimals(self, sample_asset):
+        """Test audit callers can request Decimal arithmetic"""
+        price_data = PriceData(
+            asset=sample_asset,
+            timestamp=datetime.now(),
+            price=Decimal("105.00"),
+            volume=75000000,
+            open_price=Decimal("101.00"),
+            high_price=Decimal("106.00"),
+            low_price=Decimal("99.00"),
+        )
+
+        fast = MarketQuote(
+            asset=sample_asset,
+            price_data=price_data,
+            previous_close=Decimal("100.00"),
+            average_volume=50000000,
+        )
+        exact = MarketQuote(
+            asset=sample_asset,
+            price_data=price_data,
+            previous_close=Decimal("100.00"),
+            average_volume=50000000,
+            exact=True,
+        )
+
+        assert isinstance(fast.price_change, float)
+        assert isinstance(exact.price_change, Decimal)
+        assert exact.price_change_percent == Decimal("5.00")
+        assert exact.volume_ratio == Decimal("1.5")
+        assert fast.as_decimals()["volume_ratio"] == Decimal("1.5")
+
+    def test_from_arrays_batch(self, sample_asset):
+        """Test vectorized batch derivation of quote metrics"""
+        batch = MarketQuote.from_arrays(
+            prices=[105.0, 50.0],
+            prev_closes=[100.0, 0.0],
+            volumes=[75000000, 1000],
+            avg_volumes=[50000000, 0],
+            assets=[sample_asset, sample_asset],
+        )
+
+        assert len(batch) == 2
+        assert batch.price_change[0] == 5.0
+        assert batch.price_change_percent[0] == 5.0
+        assert batch.volume_ratio[0] == 1.5
+        assert math.isnan(batch.price_change_percent[1])
+        assert math.isnan(batch.volume_ratio[1])
+        assert batch.metrics("AAPL")["volume_ratio"] == 1.5
+
+        gap_up, gap_down, surge = batch.gap_masks()
+        assert gap_up.tolist() == [True, False]
+        assert gap_down.tolist() == [False, False]
+        assert surge.tolist() == [False, False]
+
+    def test_gap_masks(self):
+        """Test vectorized predicates match the per-quote thresholds"""
+        gap_up, gap_down, surge = MarketQuote.gap_masks(
+            np.array([2.0, -1.5, 0.5]), np.array([2.5, 1.0, 3.0])
+        )
+
+        assert gap_up.tolist() == [True, False, False]
+        assert gap_down.tolist() == [False, True, False]
+        assert surge.tolist() == [True, False, True]
+
+
+class TestNewsItem:
+    """Test NewsItem asset relevance"""
+
+    def test_inverted_index(self, sample_asset, sample_market):
+        """Test news is retrievable per asset without scanning items"""
+        NewsItem.index.clear()
+        other = Asset(
+            symbol="MSFT",
+            name="Microsoft Corporation",
+            asset_type=AssetType.COMMON_STOCK,
+            market=sample_market,
+            currency="USD",
+        )
+
+        first = NewsItem(headline="Apple earnings", related_assets=[sample_asset])
+        second = NewsItem(headline="Big tech rally", related_assets=[sample_asset, other])
+
+        assert list(NewsItem.for_asset(sample_asset)) == [first, second]
+        assert list(NewsItem.for_asset(other)) == [second]
+        assert first.affects_asset(sample_asset)
+        assert not first.affects_asset(other)
+
+        NewsItem.index.clear()
+        assert list(NewsItem.for_asset(sample_asset)) == []
+
+    def test_index_does_not_keep_items_alive(self, sample_asset):
+        """Test dropped news items leave the index instead of leaking"""
+        NewsItem.index.clear()
+        kept = NewsItem(headline="kept", related_assets=[sample_asset])
+        for i in range(100):
+            NewsItem(headline=f"throwaway {i}", related_assets=[sample_asset])
+        gc.collect()
+
+        assert list(NewsItem.for_asset(sample_asset)) == [kept]
+        NewsItem.index.clear()
+
+    def test_ids_are_unique_and_ordered(self):
+        """Test default ids are counter-based and sort by creation"""
+        ids = [NewsItem(headline=str(i)).id for i in range(3)]
+        assert len(set(ids)) == 3
+        assert ids == sorted(ids)
+
+        NewsItem.USE_UUID_IDS = True
+        try:
+            assert len(NewsItem(headline="uuid").id) == 36
+        finally:
+            NewsItem.USE_UUID_IDS = False
+        NewsItem.index.clear()
+
+
+class TestDerivedMetrics:
+    """Test gap and sentiment metrics backed by the numeric kernels"""
+
+    def test_extended_hours_gap(self, sample_asset):
+        """Test gap metrics relative to the regular session close"""
+        price_data = PriceData(
+            asset=sample_asset,
+            timestamp=datetime.now(),
+            price=Decimal("102.00"),
+            volume=1000,
+            session_type=MarketStatus.PRE_MARKET,
+        )
+
+        data = ExtendedHoursData(
+            asset=sample_asset,
+            session_type=MarketStatus.PRE_MARKET,
+            price_data=price_data,
+            regular_session_close=Decimal("100.00"),
+        )
+
+        assert data.gap_amount == 2.0
+        assert data.gap_percent == 2.0
+        assert data.is_significant_gap
+
+    def test_social_sentiment_metrics(self, sample_asset):
+        """Test bullish ratio and strength buckets"""
+        sentiment = SocialSentiment(
+            asset=sample_asset,
+            timestamp=datetime.now(),
+            source_platform="reddit",
+            total_mentions=40,
+            sentiment_score=Decimal("-0.45"),
+            bullish_mentions=10,
+            bearish_mentions=25,
+            neutral_mentions=5,
+        )
+
+        assert sentiment.bullish_ratio == 0.25
+        assert sentiment.sentiment_strength == "moderate"
+
+    def test_gap_metrics_vec(self):
+        """Test the vectorized gap kernel handles zero references"""
+        amounts, percents = gap_metrics_vec([102.0, 5.0], [100.0, 0.0])
+
+        assert amounts.tolist() == [2.0, 5.0]
+        assert percents.tolist() == [2.0, 0.0]
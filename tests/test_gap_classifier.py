@@ -0,0 +1,188 @@
+"""
+Tests for the vectorized gap type analyzer
+"""
+
+import numpy as np
+import pytest
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from tradescout.analysis.gap_classifier import (
+    BREAKAWAY,
+    COMMON,
+    CONTINUATION,
+    EXHAUSTION,
+    MAX_STATS_LOOKBACK_DAYS,
+    UNKNOWN,
+    GapTypeAnalyzer,
+)
+from tradescout.data_models.domain_models_analysis import (
+    GapRiskLevel,
+    GapType,
+    TradeSide,
+)
+from tradescout.data_models.domain_models_core import (
+    ExtendedHoursData,
+    MarketQuote,
+    MarketStatus,
+    PriceData,
+)
+
+
+def make_quote(asset, price, prev_close, volume=1_000_000, avg_volume=1_000_000):
+    return MarketQuote(
+        asset=asset,
+        price_data=PriceData(
+            asset=asset,
+            timestamp=datetime(2025, 1, 2, 8, 0),
+            price=Decimal(price),
+            volume=volume,
+        ),
+        previous_close=Decimal(prev_close) if prev_close else None,
+        average_volume=avg_volume,
+    )
+
+
+class TestGapTypeAnalyzerBatch:
+    """Test the array stages"""
+
+    def test_classify_gap_type_batch(self):
+        """Test gap-size bins, volume confirmation and missing references"""
+        analyzer = GapTypeAnalyzer()
+        opens = np.array([100.5, 103.5, 106.0, 106.0, 110.0, 100.0])
+        prev = np.array([100.0, 100.0, 100.0, 100.0, 100.0, np.nan])
+        volumes = np.array([1.0, 1.0, 3.0, 1.0, 3.0, 1.0])
+        avg = np.ones(6)
+
+        codes, confidence, probs = analyzer.classify_gap_type_batch(
+            opens, prev, volumes, avg
+        )
+
+        assert codes.dtype == np.int8
+        assert codes.tolist() == [
+            COMMON,
+            BREAKAWAY,
+            CONTINUATION,
+            EXHAUSTION,
+            EXHAUSTION,
+            UNKNOWN,
+        ]
+        assert confidence[5] == 0.0
+        assert confidence[2] > confidence[3]
+        assert probs.shape == (6, 4)
+        np.testing.assert_allclose(probs[:5].sum(axis=1), 1.0)
+        assert (probs[5] == 0).all()
+
+    def test_assess_tradability_batch(self):
+        """Test tradeability, risk and quality match the scalar model rules"""
+        analyzer = GapTypeAnalyzer()
+        rows = analyzer.assess_tradability_batch(
+            np.array([CONTINUATION, COMMON, EXHAUSTION], dtype=np.int8),
+            np.array([0.9, 0.9, 0.7]),
+            np.array([6.0, 1.0, -9.0]),
+            np.array([0.5, 0.5, 0.5]),
+        )
+
+        assert rows["tradeable"].tolist() == [True, False, True]
+        assert rows["risk"].tolist() == [0, 3, 2]
+        assert rows["strategy"].tolist() == [1, 0, 2]
+        assert rows["quality"][0] == pytest.approx(0.9 * 0.4 + 0.5 * 0.4 + 0.2)
+        assert rows["quality"][1] == 0.0
+
+
+class TestGapTypeAnalyzer:
+    """Test the per-candidate interface and batch screening"""
+
+    def test_batch_analyze_candidates_ranks_top_k(self, sample_asset):
+        """Test candidates are ranked by quality and only top_k materialized"""
+        candidates = [
+            make_quote(sample_asset, "100.50", "100.00"),
+            make_quote(sample_asset, "106.00", "100.00", volume=3_000_000),
+            make_quote(sample_asset, "103.50", "100.00"),
+            make_quote(sample_asset, "100.00", None),
+        ]
+        analyzer = GapTypeAnalyzer()
+
+        top = analyzer.batch_analyze_candidates(candidates, top_k=2)
+
+        assert len(top) == 2
+        assert top[0].gap_classification.gap_type == GapType.CONTINUATION
+        assert top[0].risk_level == GapRiskLevel.LOW
+        assert top[0].recommended_side == TradeSide.LONG
+        assert top[1].gap_classification.gap_type == GapType.BREAKAWAY
+        assert top[0].trade_quality_score >= top[1].trade_quality_score
+
+        everything = analyzer.batch_analyze_candidates(candidates)
+        assert len(everything) == 4
+        stats = analyzer.get_gap_statistics()
+        assert stats["total_candidates"] == 8
+        assert stats["gap_type_counts"]["unknown"] == 2
+
+    def test_statistics_history_is_bounded(self, sample_asset):
+        """Test runs fold into day aggregates and expired days are dropped"""
+        analyzer = GapTypeAnalyzer()
+        candidates = [make_quote(sample_asset, "103.50", "100.00")]
+        for _ in range(50):
+            analyzer.batch_analyze_candidates(candidates)
+        assert len(analyzer._days) == 1
+
+        today = next(iter(analyzer._days))
+        stale = today - timedelta(days=MAX_STATS_LOOKBACK_DAYS + 1)
+        analyzer._days = {stale: analyzer._days[today]}
+        analyzer.batch_analyze_candidates(candidates)
+
+        assert list(analyzer._days) == [today]
+        assert analyzer.get_gap_statistics()["total_candidates"] == 1
+
+    def test_single_candidate_pipeline(self, sample_asset):
+        """Test classify -> strength -> tradability on one gap"""
+        quote = make_quote(sample_asset, "92.00", "100.00")
+        extended = ExtendedHoursData(
+            asset=sample_asset,
+            session_type=MarketStatus.PRE_MARKET,
+            price_data=quote.price_data,
+            regular_session_close=Decimal("100.00"),
+        )
+        analyzer = GapTypeAnalyzer()
+
+        classification = analyzer.classify_gap_type(
+            quote, extended, {"trend_direction": "up"}
+        )
+        assert classification.gap_type == GapType.EXHAUSTION
+        assert classification.gap_percent == Decimal("-8.0000")
+        assert "gap_against_trend" in classification.warning_flags
+
+        metrics = analyzer.analyze_gap_strength(
+            classification,
+            {"volume_ratio": Decimal("2.5")},
+            {"news_catalyst_present": True, "catalyst_quality_score": 0.8},
+        )
+        assert metrics.volume_confirmation
+        assert metrics.strength_score == Decimal("0.5400")
+
+        assessment = analyzer.assess_tradability(
+            classification, metrics, {"stop_loss_percent": "1.5"}
+        )
+        assert assessment.recommended_strategy == "reversal"
+        assert assessment.recommended_side == TradeSide.LONG
+        assert assessment.stop_loss_percent == Decimal("1.5")
+
+    def test_classify_gap_type_bin_edges(self):
+        """Test the lookup table bins match the research thresholds"""
+        analyzer = GapTypeAnalyzer()
+        gaps = np.array([1.99, 2.0, 4.5, 5.5, 6.5, 7.5, -2.5, -6.0])
+
+        codes, _, _ = analyzer.classify_gap_type_batch(
+            100.0 + gaps, np.full(8, 100.0), np.full(8, 3.0), np.ones(8)
+        )
+
+        assert codes.tolist() == [
+            COMMON,
+            BREAKAWAY,
+            BREAKAWAY,
+            CONTINUATION,
+            CONTINUATION,
+            EXHAUSTION,
+            BREAKAWAY,
+            CONTINUATION,
+        ]
@@ -0,0 +1,124 @@
+"""
+Tests for the vectorized GapScanner
+"""
+
+import numpy as np
+import pytest
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from tradescout.analysis.gap_scanner import GapScanner
+from tradescout.data_models.domain_models_analysis import MarketEvent
+from tradescout.data_models.domain_models_core import (
+    MarketQuote,
+    NewsItem,
+    PriceData,
+)
+from tradescout.data_models.factories import AssetFactory
+
+
+@pytest.fixture
+def universe():
+    """Apple gaps up on volume, Microsoft is flat, Tesla has no references"""
+    factory = AssetFactory()
+    rows = [
+        (factory.create_apple(), "105.00", 3_000_000, "100.00", 1_000_000),
+        (factory.create_microsoft(), "300.50", 900_000, "300.00", 1_000_000),
+        (factory.create_tesla(), "250.00", 5_000_000, None, None),
+    ]
+    return [
+        MarketQuote(
+            asset=asset,
+            price_data=PriceData(
+                asset=asset,
+                timestamp=datetime(2025, 1, 2, 8, 0),
+                price=Decimal(price),
+                volume=volume,
+            ),
+            previous_close=Decimal(prev) if prev else None,
+            average_volume=avg,
+        )
+        for asset, price, volume, prev, avg in rows
+    ]
+
+
+class TestGapScanner:
+    """Test GapScanner scans over the quote universe"""
+
+    def test_scan_pre_market_gaps(self, universe):
+        """Test gaps are masked by size and quotes without references skipped"""
+        scanner = GapScanner(universe)
+
+        gaps = scanner.scan_pre_market_gaps()
+        assert gaps.symbol.tolist() == ["AAPL"]
+        assert gaps.gap_pct[0] == pytest.approx(5.0)
+        assert gaps.prev_close.tolist() == [100.0]
+        assert gaps.premarket.tolist() == [105.0]
+        assert scanner.quotes_at(gaps.row) == [universe[0]]
+        assert scanner.scan_pre_market_gaps(0.1).symbol.tolist() == ["AAPL", "MSFT"]
+        assert len(scanner.scan_pre_market_gaps(10)) == 0
+
+    def test_scan_gap_down(self, universe):
+        """Test gap downs count toward the gap threshold"""
+        universe[1].price_data.price = Decimal("290.00")
+        scanner = GapScanner(universe)
+
+        gaps = scanner.scan_pre_market_gaps(3)
+        assert scanner.quotes_at(gaps.row) == universe[:2]
+        assert gaps.gap_pct[1] < 0
+
+    def test_scan_volume_spikes(self, universe):
+        """Test volume ratio masking"""
+        scanner = GapScanner(universe)
+
+        spikes = scanner.scan_volume_spikes()
+        assert spikes.symbol.tolist() == ["AAPL"]
+        assert spikes.volume_ratio.tolist() == [3.0]
+        assert scanner.quotes_at(scanner.scan_volume_spikes(0.5).row) == universe[:2]
+
+    def test_empty_universe(self):
+        """Test scans on an empty universe"""
+        scanner = GapScanner()
+
+        assert len(scanner) == 0
+        assert len(scanner.scan_pre_market_gaps()) == 0
+        assert len(scanner.scan_volume_spikes()) == 0
+        assert scanner.scan_news_catalysts().group_by_symbol() == []
+
+    def test_news_and_earnings(self, universe):
+        """Test news catalysts and upcoming earnings filters"""
+        apple = universe[0].asset
+        news = [
+            NewsItem(headline="Apple beats", related_assets=[apple]),
+            NewsItem(
+                headline="Old news",
+                related_assets=[apple],
+                timestamp=datetime.now() - timedelta(days=3),
+            ),
+        ]
+        soon = MarketEvent(
+            timestamp=datetime.now(),
+            event_type="earnings",
+            asset=apple,
+            title="AAPL Q1",
+            description="",
+            expected_impact="bullish",
+            scheduled_time=datetime.now() + timedelta(hours=12),
+        )
+        later = MarketEvent(
+            timestamp=datetime.now(),
+            event_type="earnings",
+            asset=apple,
+            title="AAPL Q2",
+            description="",
+            expected_impact="neutral",
+            scheduled_time=datetime.now() + timedelta(days=90),
+        )
+        scanner = GapScanner(universe, news=news, events=[later, soon])
+
+        catalysts = scanner.scan_news_catalysts()
+        assert catalysts.group_by_symbol() == [("AAPL", news[:1])]
+        assert catalysts.symbols.tolist() == ["AAPL"]
+        assert catalysts.ts_ns.dtype == np.int64
+        assert len(scanner.scan_news_catalysts(max_age_hours=10_000)) == 2
+        assert scanner.scan_earnings_plays() == [soon]
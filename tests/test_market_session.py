@@ -0,0 +1,61 @@
+"""
+Tests for the per-second memoized MarketSessionManager
+"""
+
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from tradescout.analysis.market_session import MarketSessionManager
+
+NEW_YORK = ZoneInfo("America/New_York")
+
+
+def clock_at(*args):
+    """Clock frozen at a New York wall-clock time"""
+    epoch = datetime(*args, tzinfo=NEW_YORK).timestamp()
+    return lambda: epoch
+
+
+class TestMarketSessionManager:
+    """Test session lookups, timing and caching"""
+
+    def test_sessions(self, sample_market):
+        """Test current session and analysis gating follow the clock"""
+        pre = MarketSessionManager(sample_market, clock_at(2025, 1, 3, 8, 0))
+        regular = MarketSessionManager(sample_market, clock_at(2025, 1, 3, 10, 0))
+
+        assert pre.get_current_session() == "pre_market"
+        assert not pre.is_market_open()
+        assert pre.should_run_analysis("morning")
+        assert regular.is_market_open()
+        assert regular.should_run_analysis("realtime")
+        with pytest.raises(ValueError):
+            regular.should_run_analysis("lunch")
+
+    def test_time_until_open_and_close(self, sample_market):
+        """Test the next open skips the weekend"""
+        friday_evening = MarketSessionManager(
+            sample_market, clock_at(2025, 1, 3, 17, 0)
+        )
+
+        assert friday_evening.time_until_market_open() == timedelta(
+            days=2, hours=16, minutes=30
+        )
+        assert friday_evening.time_until_market_close() == timedelta(days=2, hours=23)
+
+    def test_session_cached_per_second(self, sample_market):
+        """Test repeated calls within a second reuse one computation"""
+        now = [datetime(2025, 1, 3, 10, 0, tzinfo=NEW_YORK).timestamp()]
+        manager = MarketSessionManager(sample_market, lambda: now[0])
+
+        for _ in range(1000):
+            manager.is_market_open()
+        now[0] += 0.5
+        manager.get_current_session()
+        now[0] += 1.0
+        manager.get_current_session()
+
+        info = manager._session_at.cache_info()
+        assert (info.misses, info.hits) == (2, 1000)
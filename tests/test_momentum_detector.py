@@ -0,0 +1,207 @@
+"""
+Tests for the MomentumDetector typed results and scoring
+"""
+
+import dataclasses
+
+import pytest
+from datetime import datetime
+from decimal import Decimal
+
+from tradescout.analysis.momentum_detector import (
+    DEFAULT_WEIGHTS,
+    MomentumDetector,
+    _compile_scorer,
+    _momentum_score,
+    compile_scorer,
+)
+from tradescout.data_models.domain_models_analysis import (
+    GapMomentumResult,
+    MomentumFeatures,
+    NEWS_CATALYST_BITS,
+    NewsFeatures,
+    NewsMomentumResult,
+    TechnicalIndicators,
+    VolumeMomentumResult,
+)
+from tradescout.data_models.domain_models_core import (
+    ExtendedHoursData,
+    MarketQuote,
+    MarketStatus,
+    NewsItem,
+    PriceData,
+)
+
+
+@pytest.fixture
+def gap_up_quote(sample_asset):
+    """Quote 4% above the prior close on 2.4x average volume"""
+    price_data = PriceData(
+        asset=sample_asset,
+        timestamp=datetime(2025, 1, 2, 8, 0),
+        price=Decimal("104.00"),
+        volume=2_400_000,
+    )
+    return MarketQuote(
+        asset=sample_asset,
+        price_data=price_data,
+        previous_close=Decimal("100.00"),
+        average_volume=1_000_000,
+    )
+
+
+class TestMomentumDetector:
+    """Test MomentumDetector"""
+
+    def test_results_are_frozen(self):
+        """Test result objects are immutable"""
+        result = GapMomentumResult(
+            gap_pct=1.0, strength=0.2, direction=1, confidence=0.5
+        )
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.gap_pct = 2.0
+
+    def test_analyze_gap_and_volume(self, gap_up_quote, sample_asset):
+        """Test gap and volume results from a gapping quote"""
+        extended = ExtendedHoursData(
+            asset=sample_asset,
+            session_type=MarketStatus.PRE_MARKET,
+            price_data=gap_up_quote.price_data,
+            regular_session_close=Decimal("100.00"),
+        )
+        detector = MomentumDetector()
+
+        gap = detector.analyze_gap_momentum(gap_up_quote, extended)
+        volume = detector.analyze_volume_momentum(gap_up_quote, [1_000_000] * 10)
+
+        assert gap.direction == 1
+        assert gap.strength == pytest.approx(0.8)
+        assert gap.confidence == pytest.approx(0.9)
+        assert volume.volume_ratio == pytest.approx(2.4)
+        assert volume.is_surge
+        assert volume.confidence == pytest.approx(0.5)
+
+    def test_analyze_news_momentum(self, sample_asset):
+        """Test news is aggregated once and scored from the features"""
+        news = [
+            NewsItem(
+                related_assets=[sample_asset],
+                sentiment_score=Decimal("0.8"),
+                impact_score=Decimal("0.7"),
+                category="earnings",
+            ),
+            NewsItem(related_assets=[sample_asset], sentiment_score=Decimal("0.4")),
+            NewsItem(related_assets=[sample_asset], category="merger"),
+        ]
+        features = NewsFeatures.from_news(news)
+        detector = MomentumDetector()
+
+        result = detector.analyze_news_momentum("AAPL", features)
+
+        assert features.max_relevance == pytest.approx(0.7)
+        assert features.catalyst_flags == (
+            NEWS_CATALYST_BITS["earnings"] | NEWS_CATALYST_BITS["merger"]
+        )
+        assert result.news_count == 3
+        assert result.sentiment == pytest.approx(0.6)
+        assert result.strength == pytest.approx(0.36)
+
+        batch = NewsFeatures.to_array([features, NewsFeatures()])
+        strengths = detector.analyze_news_momentum_batch(batch)
+        assert strengths.tolist() == pytest.approx([0.36, 0.0])
+
+    def test_calculate_momentum_score(self):
+        """Test weighting and that opposing news does not add to the score"""
+        detector = MomentumDetector()
+        gap = GapMomentumResult(gap_pct=5.0, strength=1.0, direction=1, confidence=1.0)
+        volume = VolumeMomentumResult(
+            volume_ratio=3.0, strength=1.0, is_surge=True, confidence=1.0
+        )
+        bullish = NewsMomentumResult(
+            news_count=5, sentiment=0.8, strength=0.8, confidence=1.0
+        )
+        bearish = NewsMomentumResult(
+            news_count=5, sentiment=-0.8, strength=0.8, confidence=1.0
+        )
+
+        score = detector.calculate_momentum_score("AAPL", gap, volume)
+        assert isinstance(score, float)
+        assert score == pytest.approx(0.75)
+        assert detector.calculate_momentum_score(
+            "AAPL", gap, volume, bullish
+        ) == pytest.approx(0.95)
+        assert detector.calculate_momentum_score(
+            "AAPL", gap, volume, bearish
+        ) == pytest.approx(0.75)
+
+    def test_momentum_score_with_technicals(self, sample_asset):
+        """Test MACD confirmation and stretched RSI adjust the score"""
+        detector = MomentumDetector()
+        gap = GapMomentumResult(gap_pct=5.0, strength=1.0, direction=1, confidence=1.0)
+        volume = VolumeMomentumResult(
+            volume_ratio=1.5, strength=0.5, is_surge=False, confidence=1.0
+        )
+        indicators = TechnicalIndicators(
+            asset=sample_asset,
+            timestamp=datetime(2025, 1, 2),
+            timeframe="1d",
+            rsi=Decimal("85"),
+            macd=Decimal("1.2"),
+            macd_signal=Decimal("0.8"),
+        )
+
+        base = detector.calculate_momentum_score("AAPL", gap, volume)
+        adjusted = detector.calculate_momentum_score(
+            "AAPL", gap, volume, indicators=indicators
+        )
+
+        assert base == pytest.approx(0.575)
+        assert adjusted == pytest.approx(0.525)  # +0.05 MACD, -0.10 stretched RSI
+
+    def test_score_features(self):
+        """Test typed features score like the results they were built from"""
+        detector = MomentumDetector()
+        gap = GapMomentumResult(gap_pct=5.0, strength=1.0, direction=1, confidence=1.0)
+        volume = VolumeMomentumResult(
+            volume_ratio=3.0, strength=1.0, is_surge=True, confidence=1.0
+        )
+        bearish = NewsMomentumResult(
+            news_count=5, sentiment=-0.8, strength=0.8, confidence=1.0
+        )
+
+        features = detector.build_features(gap, volume, bearish)
+        legacy = MomentumFeatures.from_dict({"gap_percent": 5, "volume_ratio": 3})
+
+        assert features == MomentumFeatures(gap_pct=5.0, volume_ratio=3.0)
+        assert detector.score_features(features) == pytest.approx(0.75)
+        assert detector.score_features(legacy) == pytest.approx(0.75)
+
+    def test_compiled_scorer_matches_default(self):
+        """Test the template scorer reproduces the hand-written kernel"""
+        scorer = _compile_scorer(tuple(DEFAULT_WEIGHTS.values()))
+        nan = float("nan")
+        for args in [
+            (5.0, 3.0, nan, nan, nan, 0.8),
+            (-2.0, 1.5, 15.0, -0.5, 0.1, 0.0),
+            (4.0, 1.5, 85.0, 0.2, 0.8, 0.0),
+            (1.0, 0.5, nan, 0.3, 0.1, 0.3),
+        ]:
+            assert scorer(*args) == pytest.approx(_momentum_score(*args))
+        assert _momentum_score(5.0, 3.0, nan, nan, nan, 0.8) == pytest.approx(0.95)
+        assert compile_scorer({}) is _momentum_score
+
+    def test_strategy_weights(self):
+        """Test per-strategy weights swap in a specialized scorer"""
+        gap = GapMomentumResult(gap_pct=5.0, strength=1.0, direction=1, confidence=1.0)
+        volume = VolumeMomentumResult(
+            volume_ratio=0.0, strength=0.0, is_surge=False, confidence=1.0
+        )
+        detector = MomentumDetector(weights={"gap": 0.9})
+
+        assert detector.weights["volume"] == 0.35
+        assert detector.calculate_momentum_score("AAPL", gap, volume) == (
+            pytest.approx(0.9)
+        )
+        with pytest.raises(ValueError):
+            compile_scorer({"sector": 0.1})
@@ -0,0 +1,142 @@
+"""
+Tests for the stacked-array ScanOrchestrator
+"""
+
+import numpy as np
+import pytest
+
+from tradescout.analysis._indicator_kernels import atr
+from tradescout.analysis._trade_levels import ATR_STOP_MULTIPLE
+from tradescout.analysis.orchestrator import (
+    FLAG_GAP_UP,
+    FLAG_TREND_UP,
+    FLAG_VOLUME_SURGE,
+    ScanOrchestrator,
+    _scan_kernel,
+    stack_ohlcv,
+    stack_quote_arrays,
+)
+from tradescout.data_models.domain_models_analysis import TradeSide
+from tradescout.data_models.domain_models_core import QuoteArray
+
+
+def make_bars(close, volume=None, open_=None, asset=None):
+    close = np.asarray(close, dtype=np.float64)
+    return QuoteArray(
+        open=close.copy() if open_ is None else np.asarray(open_, dtype=np.float64),
+        high=close + 1.0,
+        low=close - 1.0,
+        close=close,
+        volume=np.full(len(close), 1000.0) if volume is None else volume,
+        timestamp_ns=np.arange(len(close), dtype=np.int64),
+        asset=asset,
+    )
+
+
+def gapper(asset=None):
+    """Steady uptrend that gaps up 4% on triple volume"""
+    close = 100.0 + np.sin(np.arange(60)) + np.arange(60) * 0.2
+    open_ = close.copy()
+    open_[-1] = close[-2] * 1.04
+    close[-1] = open_[-1] + 0.5
+    volume = np.full(60, 1000.0)
+    volume[-1] = 3500.0
+    return make_bars(close, volume=volume, open_=open_, asset=asset)
+
+
+class TestScanKernel:
+    """Test stacking and the scan kernel"""
+
+    def test_stack_ohlcv_right_aligns(self):
+        """Test shorter histories are NaN padded at the front"""
+        tensor, lengths = stack_ohlcv([make_bars([1.0, 2.0, 3.0]), make_bars([5.0])])
+
+        assert tensor.shape == (2, 3, 5)
+        assert lengths.tolist() == [3, 1]
+        assert tensor[1, -1, 3] == 5.0
+        assert np.isnan(tensor[1, :2]).all()
+
+    def test_stack_quote_arrays_mask(self):
+        """Test the mask marks real bars and the pad value fills the rest"""
+        symbols, tensor, mask = stack_quote_arrays(
+            {"A": make_bars([1.0, 2.0, 3.0]), "B": make_bars([5.0])}, pad_value=0.0
+        )
+
+        assert symbols == ["A", "B"]
+        assert mask.tolist() == [[True, True, True], [False, False, True]]
+        assert tensor[1, :2].sum() == 0.0
+
+    def test_scan_kernel_scores_and_flags(self):
+        """Test the gapper outscores a flat series and short series score zero"""
+        flat = make_bars(np.full(60, 100.0))
+        tensor, lengths = stack_ohlcv([gapper(), flat, make_bars([1.0] * 10)])
+        scores = np.zeros(3)
+        flags = np.zeros(3, dtype=np.int8)
+
+        _scan_kernel(tensor, lengths, scores, flags)
+
+        assert scores[0] > 0.6 > scores[1]
+        assert flags[0] & FLAG_GAP_UP
+        assert flags[0] & FLAG_VOLUME_SURGE
+        assert flags[0] & FLAG_TREND_UP
+        assert scores[2] == 0.0 and flags[2] == 0
+
+
+class TestScanOrchestrator:
+    """Test suggestions built from scan winners"""
+
+    def test_run_realtime_scan(self, sample_asset):
+        """Test only winners become suggestions and missing symbols are skipped"""
+        histories = {
+            "AAPL": gapper(asset=sample_asset),
+            "FLAT": make_bars(np.full(60, 100.0)),
+        }
+        orchestrator = ScanOrchestrator(histories.get, watchlist=["AAPL", "FLAT"])
+
+        suggestions = orchestrator.run_realtime_scan(["AAPL", "FLAT", "MISSING"])
+
+        assert len(suggestions) == 1
+        suggestion = suggestions[0]
+        assert suggestion.asset is sample_asset
+        assert suggestion.side == TradeSide.LONG
+        assert suggestion.stop_loss < suggestion.suggested_entry
+        assert suggestion.take_profit_1 > suggestion.suggested_entry
+        assert suggestion.volume_surge
+        assert suggestion.gap_percent == pytest.approx(4.0)
+
+        assert orchestrator.analyze_symbol("FLAT") is None
+        assert orchestrator.analyze_symbol("MISSING") is None
+        assert orchestrator.analyze_symbol("AAPL").gap_percent == pytest.approx(4.0)
+        evening = orchestrator.run_evening_analysis()
+        assert evening["symbols_scanned"] == 2
+        assert evening["volume_surges"] == ["AAPL"]
+
+    def test_analyze_batch(self, sample_asset):
+        """Test every input symbol gets an entry, winners a suggestion"""
+        orchestrator = ScanOrchestrator(lambda symbol: None)
+
+        results = orchestrator.analyze_batch(
+            {
+                "AAPL": gapper(asset=sample_asset),
+                "FLAT": make_bars(np.full(60, 100.0)),
+                "EMPTY": make_bars([]),
+            }
+        )
+
+        assert list(results) == ["AAPL", "FLAT", "EMPTY"]
+        assert results["AAPL"].asset is sample_asset
+        assert results["FLAT"] is None and results["EMPTY"] is None
+
+    def test_suggestions_use_engine_stops_and_validation(self, sample_asset):
+        """Test stops are ATR_STOP_MULTIPLE ATRs and invalid setups are dropped"""
+        bars = gapper(asset=sample_asset)
+        histories = {"AAPL": bars}
+        suggestion = ScanOrchestrator(histories.get).analyze_symbol("AAPL")
+
+        expected_stop = bars.close[-1] - ATR_STOP_MULTIPLE * atr(
+            bars.high, bars.low, bars.close, 14
+        )[-1]
+        assert float(suggestion.stop_loss) == pytest.approx(expected_stop, abs=0.01)
+        # A target closer than the stop fails the engine's reward/risk check
+        narrow = ScanOrchestrator(histories.get, target_ratio=0.5)
+        assert narrow.run_realtime_scan(["AAPL"]) == []
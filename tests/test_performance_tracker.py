@@ -0,0 +1,117 @@
+"""
+Tests for the incrementally aggregated PerformanceTracker
+"""
+
+import pytest
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from tradescout.analysis.performance_tracker import PerformanceTracker, RunningStats
+from tradescout.data_models.domain_models_analysis import (
+    ActualTrade,
+    TradeStatus,
+    TradeSuggestion,
+)
+
+
+def make_trade(asset, pnl, day, shares=10, entry="100", suggestion_id=None):
+    exit_time = datetime(2025, 1, day, 15, 0)
+    return ActualTrade(
+        suggestion_id=suggestion_id,
+        asset=asset,
+        entry_price=Decimal(entry),
+        entry_time=exit_time - timedelta(hours=1),
+        shares=shares,
+        exit_price=Decimal(entry) + Decimal(pnl) / shares,
+        exit_time=exit_time,
+        realized_pnl=Decimal(pnl),
+        hold_time_minutes=60,
+    )
+
+
+def test_running_stats_add_remove():
+    """Test running sums match a direct computation and removal undoes add"""
+    stats = RunningStats()
+    for value in (2.0, -1.0, 4.0):
+        stats.add(value)
+    stats.add(10.0)
+    stats.remove(10.0)
+
+    assert stats.n == 3
+    assert (stats.wins, stats.losses) == (2, 1)
+    assert stats.mean == pytest.approx(5.0 / 3)
+    assert stats.std == pytest.approx(2.5166114784)
+
+
+class TestPerformanceTracker:
+    """Test period metrics and suggestion accuracy"""
+
+    def test_period_performance(self, sample_asset):
+        """Test only day buckets inside the window are combined"""
+        tracker = PerformanceTracker()
+        tracker.record_actual_trade(make_trade(sample_asset, "50", day=2))
+        tracker.record_actual_trade(make_trade(sample_asset, "-80", day=3))
+        tracker.record_actual_trade(make_trade(sample_asset, "100", day=3))
+        tracker.record_actual_trade(make_trade(sample_asset, "500", day=20))
+
+        metrics = tracker.calculate_period_performance(
+            datetime(2025, 1, 1), datetime(2025, 1, 10)
+        )
+
+        assert metrics.total_trades == 3
+        assert metrics.winning_trades == 2
+        assert metrics.total_pnl == Decimal("70.00")
+        assert metrics.best_trade == Decimal("100.00")
+        assert metrics.worst_trade == Decimal("-80.00")
+        assert metrics.profit_factor == Decimal("1.8750")
+        assert metrics.avg_trade_return == Decimal("2.3333")
+        assert metrics.avg_hold_time_minutes == Decimal("60.0")
+
+    def test_rerecorded_trade_replaces_contribution(self, sample_asset):
+        """Test recording a trade again rebuilds its day instead of adding"""
+        tracker = PerformanceTracker()
+        trade = make_trade(sample_asset, "40", day=6)
+        tracker.record_actual_trade(trade)
+        trade.realized_pnl = Decimal("-30")
+        tracker.record_actual_trade(trade)
+
+        metrics = tracker.calculate_period_performance(
+            datetime(2025, 1, 6), datetime(2025, 1, 6)
+        )
+        assert metrics.total_trades == 1
+        assert metrics.total_pnl == Decimal("-30.00")
+        assert metrics.best_trade == Decimal("-30.00")
+
+    def test_suggestion_accuracy(self, sample_asset):
+        """Test outcomes resolve against target/stop and can be revised"""
+        tracker = PerformanceTracker()
+        suggestions = [
+            TradeSuggestion(
+                asset=sample_asset,
+                suggested_entry=Decimal("100"),
+                stop_loss=Decimal("98"),
+                take_profit_1=Decimal("103"),
+            )
+            for _ in range(3)
+        ]
+        for suggestion in suggestions:
+            tracker.track_suggestion_performance(suggestion)
+
+        tracker.update_suggestion_outcome(suggestions[0].id, Decimal("1"), Decimal("2"))
+        tracker.update_suggestion_outcome(suggestions[1].id, Decimal("1"), Decimal("2"))
+        tracker.update_suggestion_outcome(suggestions[1].id, Decimal("3"), Decimal("1"))
+        tracker.update_suggestion_outcome(suggestions[2].id, Decimal("1"), Decimal("1"))
+        tracker.record_actual_trade(
+            ActualTrade(suggestion_id=suggestions[1].id, asset=sample_asset)
+        )
+
+        accuracy = tracker.get_suggestion_accuracy()
+
+        assert accuracy["total_suggestions"] == 3
+        assert accuracy["resolved_suggestions"] == 2
+        assert accuracy["win_rate"] == Decimal("0.5000")
+        assert accuracy["avg_return_percent"] == Decimal("0.5000")
+        assert accuracy["follow_rate"] == Decimal("0.3333")
+        assert suggestions[1].status == TradeStatus.EXECUTED
+        with pytest.raises(KeyError):
+            tracker.update_suggestion_outcome("missing", Decimal("1"), Decimal("1"))
@@ -0,0 +1,59 @@
+"""
+Tests for the array-based RiskCalculator
+"""
+
+import numpy as np
+import pytest
+
+from tradescout.analysis.risk_calculator import RiskCalculator
+from tradescout.data_models.domain_models_analysis import TradeSide
+
+
+class TestRiskCalculator:
+    """Test bulk sizing, stops and targets against the scalar methods"""
+
+    def test_position_size_bulk(self):
+        """Test sizing floors, caps by buying power and zeroes flat stops"""
+        calc = RiskCalculator()
+        entry = np.array([100.0, 50.0, 20.0, 10.0])
+        stop = np.array([98.0, 51.0, 20.0, 9.99])
+
+        shares = calc.calculate_position_size_bulk(10_000.0, 0.02, entry, stop)
+
+        assert shares.dtype == np.int64
+        assert shares.tolist() == [100, 200, 0, 1000]
+        assert calc.calculate_position_size(10_000.0, 0.02, 100.0, 98.0) == 100
+
+    def test_stop_loss_bulk(self):
+        """Test volatility stops, fallback and tightening to structure"""
+        calc = RiskCalculator()
+        nan = np.nan
+
+        stops = calc.calculate_stop_loss_bulk(
+            entry=np.array([100.0, 100.0, 100.0, 100.0]),
+            is_long=np.array([True, True, False, True]),
+            volatility=np.array([2.0, 2.0, 2.0, nan]),
+            support=np.array([90.0, 98.5, 90.0, nan]),
+            resistance=np.array([110.0, 110.0, 101.0, nan]),
+        )
+
+        assert stops.tolist() == pytest.approx([97.0, 98.5, 101.0, 98.0])
+        assert calc.calculate_stop_loss(
+            100.0, TradeSide.SHORT, 2.0, (90.0, 110.0)
+        ) == pytest.approx(103.0)
+
+    def test_take_profit_and_validation(self):
+        """Test targets follow the stop side and reward/risk validation"""
+        calc = RiskCalculator()
+
+        first, second = calc.calculate_take_profit_levels_bulk(
+            np.array([100.0, 100.0]), np.array([98.0, 102.0]), target_ratio=1.5
+        )
+
+        assert first.tolist() == [103.0, 97.0]
+        assert second.tolist() == [106.0, 94.0]
+        assert calc.calculate_take_profit_levels(
+            100.0, 98.0, TradeSide.LONG
+        ) == (103.0, 106.0)
+        assert calc.validate_risk_reward(100.0, 98.0, 103.0, min_ratio=1.5)
+        assert not calc.validate_risk_reward(100.0, 98.0, 97.0)
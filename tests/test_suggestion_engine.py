@@ -0,0 +1,118 @@
+"""
+Tests for the SuggestionEngine and its top-K selection
+"""
+
+import numpy as np
+from decimal import Decimal
+
+from tradescout.analysis.suggestion_engine import SuggestionEngine, top_k_indices
+from tradescout.data_models.domain_models_analysis import (
+    ConfidenceLevel,
+    MomentumFeatures,
+    SuggestionInput,
+    TradeSide,
+)
+
+
+def test_top_k_indices():
+    """Test partial selection returns the best k in order, ties stable"""
+    scores = np.array([0.2, 0.9, 0.5, 0.9, 0.7])
+
+    assert top_k_indices(scores, 3).tolist() == [1, 3, 4]
+    assert top_k_indices(scores, 10).tolist() == [1, 3, 4, 2, 0]
+    assert top_k_indices(scores, 0).tolist() == []
+
+    # Ties straddling k resolve to the earliest indices, matching a full sort
+    tied = np.array([0.5, 0.7, 0.5, 0.5, 0.7, 0.5, 0.1])
+    assert top_k_indices(tied, 3).tolist() == [1, 4, 0]
+    assert top_k_indices(tied, 4).tolist() == [1, 4, 0, 2]
+    rng = np.random.default_rng(0)
+    for _ in range(200):
+        quantized = rng.integers(0, 4, size=12) / 4
+        k = int(rng.integers(1, 12))
+        expected = np.argsort(-quantized, kind="stable")[:k]
+        assert top_k_indices(quantized, k).tolist() == expected.tolist()
+
+
+class TestSuggestionEngine:
+    """Test suggestion generation, validation and filtering"""
+
+    def test_generate_suggestion(self, sample_asset):
+        """Test ATR stop, targets and confidence from analysis data"""
+        engine = SuggestionEngine()
+
+        long = engine.generate_suggestion(
+            "AAPL",
+            {
+                "asset": sample_asset,
+                "entry_price": Decimal("100"),
+                "momentum_score": 0.9,
+                "atr": 2.0,
+                "gap_percent": 3.0,
+                "volume_surge": True,
+            },
+        )
+        assert long.side == TradeSide.LONG
+        assert long.confidence == ConfidenceLevel.HIGH
+        assert long.stop_loss == Decimal("97.00")
+        assert long.take_profit_1 == Decimal("104.50")
+        assert long.gap_percent == Decimal("3.0000")
+        assert long.volume_surge
+
+        short = engine.generate_suggestion(
+            "AAPL",
+            {
+                "asset": sample_asset,
+                "entry_price": 100.0,
+                "momentum_score": 0.7,
+                "gap_percent": -4.0,
+            },
+        )
+        assert short.side == TradeSide.SHORT
+        assert short.stop_loss == Decimal("102.00")
+        assert short.take_profit_1 == Decimal("97.00")
+
+        weak = {"asset": sample_asset, "entry_price": 100.0, "momentum_score": 0.3}
+        assert engine.generate_suggestion("AAPL", weak) is None
+
+    def test_generate_from_typed_input(self, sample_asset):
+        """Test a SuggestionInput builds the same suggestion as the dict form"""
+        engine = SuggestionEngine()
+        analysis = SuggestionInput(
+            asset=sample_asset,
+            entry_price=100.0,
+            momentum_score=0.9,
+            features=MomentumFeatures(gap_pct=-3.0, volume_ratio=2.5, atr=2.0),
+            volume_surge=True,
+        )
+
+        short = engine.generate_suggestion("AAPL", analysis)
+
+        assert short.side == TradeSide.SHORT
+        assert short.stop_loss == Decimal("103.00")
+        assert short.gap_percent == Decimal("-3.0000")
+        assert short.volume_surge
+        assert engine.generate_suggestion("AAPL", {"momentum_score": 0.9}) is None
+
+    def test_rank_and_filter(self, sample_asset):
+        """Test filtering keeps the best valid suggestions without ranking"""
+        engine = SuggestionEngine()
+        suggestions = [
+            engine.generate_suggestion(
+                symbol,
+                {"asset": sample_asset, "entry_price": 50.0, "momentum_score": s},
+            )
+            for symbol, s in [("A", 0.65), ("B", 0.95), ("C", 0.8), ("D", 0.7)]
+        ]
+        invalid = engine.generate_suggestion(
+            "E", {"asset": sample_asset, "entry_price": 50.0, "momentum_score": 0.99}
+        )
+        invalid.stop_loss = Decimal("60.00")  # stop above a long entry
+
+        ranked = engine.rank_suggestions(suggestions + [invalid])
+        assert ranked[0] is invalid
+        assert ranked[1:] == [suggestions[i] for i in (1, 2, 3, 0)]
+
+        top = engine.filter_suggestions(suggestions + [invalid], max_suggestions=2)
+        assert top == [suggestions[1], suggestions[2]]
+        assert engine.filter_suggestions([]) == []
@@ -0,0 +1,192 @@
+"""
+Tests for the technical indicator kernels and TechnicalAnalyzer
+"""
+
+import sys
+
+import numpy as np
+import pytest
+from decimal import Decimal
+
+from tradescout.analysis import _indicator_kernels as kernels
+from tradescout.analysis.technical_analysis import TechnicalAnalyzer
+from tradescout.data_models.domain_models_analysis import TechnicalIndicators
+from tradescout.data_models.domain_models_core import QuoteArray
+
+
+def make_bars(close, asset=None, volume=None):
+    """Build a QuoteArray with high/low one point either side of close"""
+    close = np.asarray(close, dtype=np.float64)
+    if volume is None:
+        volume = np.full(len(close), 1000.0)
+    return QuoteArray(
+        open=close.copy(),
+        high=close + 1.0,
+        low=close - 1.0,
+        close=close,
+        volume=np.asarray(volume, dtype=np.float64),
+        timestamp_ns=np.arange(len(close), dtype=np.int64),
+        asset=asset,
+    )
+
+
+class TestIndicatorKernels:
+    """Test indicator kernels against straightforward NumPy references"""
+
+    def test_sma(self):
+        """Test SMA matches a convolution and pads warm-up with NaN"""
+        a = np.random.default_rng(0).normal(100, 5, 60)
+        out = kernels.sma(a, 20)
+
+        assert np.isnan(out[:19]).all()
+        expected = np.convolve(a, np.ones(20) / 20, mode="valid")
+        np.testing.assert_allclose(out[19:], expected)
+
+    def test_ema_seeded_with_sma(self):
+        """Test EMA starts at the SMA and then smooths toward new values"""
+        a = np.arange(1.0, 31.0)
+        out = kernels.ema(a, 10)
+
+        assert np.isnan(out[:9]).all()
+        assert out[9] == pytest.approx(a[:10].mean())
+        alpha = 2.0 / 11
+        assert out[10] == pytest.approx(alpha * a[10] + (1 - alpha) * out[9])
+
+    def test_rsi_extremes(self):
+        """Test RSI is 100 on a steady rise and 0 on a steady fall"""
+        rising = np.arange(1.0, 41.0)
+
+        assert kernels.rsi(rising, 14)[-1] == pytest.approx(100.0)
+        assert kernels.rsi(rising[::-1].copy(), 14)[-1] == pytest.approx(0.0)
+        assert np.isnan(kernels.rsi(rising, 14)[:14]).all()
+
+    def test_macd_components(self):
+        """Test MACD line, signal and histogram are consistent"""
+        a = np.linspace(100.0, 150.0, 80)
+        line, signal, hist = kernels.macd(a)
+
+        assert line.shape == signal.shape == hist.shape == a.shape
+        expected = kernels.ema(a, 12) - kernels.ema(a, 26)
+        np.testing.assert_allclose(line[25:], expected[25:])
+        assert np.isnan(signal[:33]).all()
+        assert not np.isnan(signal[33:]).any()
+        np.testing.assert_allclose(hist[33:], line[33:] - signal[33:])
+
+    def test_short_input(self):
+        """Test kernels return all-NaN output when there is too little data"""
+        a = np.array([1.0, 2.0, 3.0])
+
+        assert np.isnan(kernels.sma(a, 20)).all()
+        assert np.isnan(kernels.rsi(a, 14)).all()
+        assert np.isnan(kernels.atr(a, a, a, 14)).all()
+
+    def test_atr_missing_high_low(self):
+        """Test a NaN high or low is treated as the close"""
+        close = 100.0 + np.arange(30.0)
+        high, low = close + 2.0, close - 2.0
+        high[20], low[25] = np.nan, np.nan
+        filled_high, filled_low = high.copy(), low.copy()
+        filled_high[20], filled_low[25] = close[20], close[25]
+
+        result = kernels.atr(high, low, close, 14)
+
+        assert not np.isnan(result[14:]).any()
+        np.testing.assert_allclose(
+            result, kernels.atr(filled_high, filled_low, close, 14)
+        )
+
+
+class TestTechnicalAnalyzer:
+    """Test the concrete TechnicalAnalyzer"""
+
+    def test_analyze_indicators(self, sample_asset):
+        """Test indicators are computed from the latest bar as Decimals"""
+        bars = make_bars(np.arange(100.0, 160.0), asset=sample_asset)
+
+        indicators = TechnicalAnalyzer().analyze_indicators(bars)
+
+        assert indicators.asset is sample_asset
+        assert indicators.timeframe == "1d"
+        assert indicators.sma_20 == Decimal("149.5000")
+        assert indicators.rsi == Decimal("100.0000")
+        assert indicators.is_overbought
+        assert indicators.volume_ratio == Decimal("1.0000")
+        assert indicators.atr == Decimal("2.0000")
+        assert indicators.bollinger_upper > indicators.sma_20
+        assert indicators.bollinger_lower < indicators.sma_20
+        if sys.version_info >= (3, 10):
+            assert not hasattr(indicators, "__dict__")
+
+        analyzer = TechnicalAnalyzer()
+        assert not analyzer.is_favorable_setup(indicators, 0.9)  # overbought
+        neutral = TechnicalIndicators(
+            asset=sample_asset,
+            timestamp=indicators.timestamp,
+            timeframe="1d",
+            rsi=Decimal("55"),
+        )
+        assert analyzer.is_favorable_setup(neutral, 0.6)
+        assert not analyzer.is_favorable_setup(neutral, 0.59)
+
+    def test_analyze_indicators_warm_up(self):
+        """Test indicators without enough history are left as None"""
+        indicators = TechnicalAnalyzer().analyze_indicators(make_bars([10.0] * 30))
+
+        assert indicators.sma_20 == Decimal("10.0000")
+        assert indicators.sma_50 is None
+        assert indicators.macd_signal is None
+
+    def test_trend_and_breakout(self):
+        """Test an uptrend with a volume-backed breakout on the last bar"""
+        close = np.arange(100.0, 160.0)
+        close[-1] += 10.0
+        volume = np.full(len(close), 1000.0)
+        volume[-1] = 5000.0
+        bars = make_bars(close, volume=volume)
+        analyzer = TechnicalAnalyzer()
+
+        assert analyzer.analyze_trend(bars)["direction"] == "up"
+        assert analyzer.detect_breakout_patterns(bars) == [
+            "breakout_high",
+            "volume_breakout",
+        ]
+
+    def test_support_resistance(self):
+        """Test support and resistance span the lookback window"""
+        bars = make_bars(np.arange(100.0, 160.0))
+
+        support, resistance = TechnicalAnalyzer().calculate_support_resistance(bars)
+
+        assert support == Decimal("139.0000")
+        assert resistance == Decimal("160.0000")
+
+    def test_analyze_indicators_bulk(self):
+        """Test the bulk kernel matches per-symbol results, padding included"""
+        rng = np.random.default_rng(7)
+        long = 100.0 + np.cumsum(rng.normal(size=80))
+        short = 50.0 + np.cumsum(rng.normal(size=60))
+        closes = np.full((2, 80), np.nan)
+        closes[0] = long
+        closes[1, 20:] = short
+        volumes = np.where(np.isnan(closes), np.nan, 1000.0)
+        analyzer = TechnicalAnalyzer()
+
+        batch = analyzer.analyze_indicators_bulk(
+            closes, closes + 1.0, closes - 1.0, volumes
+        )
+
+        assert len(batch) == 2
+        assert batch.rsi.shape == (2, 80)
+        assert np.isnan(batch.sma_fast[1, :39]).all()
+        latest = batch.latest()
+        for row, close in enumerate((long, short)):
+            single = analyzer.analyze_indicators(make_bars(close))
+            assert latest["rsi"][row] == pytest.approx(float(single.rsi), abs=1e-4)
+            assert latest["macd_signal"][row] == pytest.approx(
+                float(single.macd_signal), abs=1e-4
+            )
+            assert latest["atr"][row] == pytest.approx(float(single.atr), abs=1e-4)
+            assert latest["sma_slow"][row] == pytest.approx(
+                float(single.sma_50), abs=1e-4
+            )
+        assert latest["volume_ratio"].tolist() == [1.0, 1.0]